@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[('C:\\ffmpeg\\ffmpeg-8.0-essentials_build\\bin\\ffmpeg.exe', 'ffmpeg'), ('C:\\ffmpeg\\ffmpeg-8.0-essentials_build\\bin\\ffprobe.exe', 'ffmpeg')],
     datas=[('C:\\Users\\JOMAAMSI\\Downloads\\Compressed\\facebook-main\\assets', 'assets')],
-    hiddenimports=['core', 'core.base_job', 'core.logger', 'core.utils', 'services', 'services.facebook_api', 'services.upload_service', 'services.database_manager', 'services.token_manager', 'services.updater', 'controllers', 'controllers.video_controller', 'controllers.story_controller', 'controllers.reels_controller', 'controllers.scheduler_controller', 'ui', 'ui.main_window', 'ui.scheduler_ui', 'ui.components', 'ui.components.jobs_table', 'ui.components.log_viewer', 'ui.components.progress_widget', 'ui.panels', 'ui.panels.settings_panel', 'secure_utils', 'secure_utils.secure_storage', 'requests', 'PySide6', 'PySide6.QtCore', 'PySide6.QtGui', 'PySide6.QtWidgets', 'PySide6.QtNetwork', 'PySide6.QtSvg', 'pyqtdarktheme', 'qtawesome', 'cryptography', 'cryptography.fernet', 'sqlite3', 'json', 'threading', 'subprocess', 'pathlib'],
+    hiddenimports=['core', 'core.base_job', 'core.logger', 'core.utils', 'services', 'services.facebook_api', 'services.upload_service', 'services.database_manager', 'services.token_manager', 'services.updater', 'controllers', 'controllers.video_controller', 'controllers.story_controller', 'controllers.reels_controller', 'controllers.scheduler_controller', 'ui', 'ui.main_window', 'ui.scheduler_ui', 'ui.components', 'ui.components.jobs_table', 'ui.components.log_viewer', 'ui.components.progress_widget', 'ui.panels', 'ui.panels.settings_panel', 'secure_utils', 'secure_utils.secure_storage', 'requests', 'requests_toolbelt', 'PySide6', 'PySide6.QtCore', 'PySide6.QtGui', 'PySide6.QtWidgets', 'PySide6.QtNetwork', 'PySide6.QtSvg', 'pyqtdarktheme', 'qtawesome', 'cryptography', 'cryptography.fernet', 'sqlite3', 'json', 'threading', 'subprocess', 'pathlib'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
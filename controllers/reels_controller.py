@@ -21,7 +21,7 @@ from typing import Optional, Callable, Tuple, Union, Any, List, Dict
 import requests
 
 from services import FacebookAPIService
-from core import BaseJob, NotificationSystem, VIDEO_EXTENSIONS
+from core import BaseJob, NotificationSystem, VIDEO_EXTENSIONS_SET
 from core import (
     get_subprocess_args, run_subprocess, check_internet_connection,
     check_disk_space, validate_file_extension, normalize_path,
@@ -965,7 +965,8 @@ def upload_reels_with_retry(page_id: str,
                             log_fn: Callable[[str], None] = None,
                             progress_callback: Callable[[float], None] = None,
                             max_retries: int = MAX_UPLOAD_RETRIES,
-                            stop_event: threading.Event = None) -> Tuple[Optional[int], dict]:
+                            stop_event: threading.Event = None,
+                            session: requests.Session = None) -> Tuple[Optional[int], dict]:
     """
     رفع ريلز مع إعادة المحاولة تلقائياً في حالة الفشل.
     
@@ -979,6 +980,7 @@ def upload_reels_with_retry(page_id: str,
         progress_callback: دالة لعرض التقدم
         max_retries: الحد الأقصى لعدد المحاولات
         stop_event: حدث لإيقاف الرفع (threading.Event)
+        session: جلسة requests مشتركة بين المحاولات والملفات (اختياري)
     
     العائد:
         (status_code, response_body)
@@ -1032,7 +1034,8 @@ def upload_reels_with_retry(page_id: str,
                 title=title,
                 log_fn=log_fn,
                 progress_callback=progress_callback,
-                stop_event=stop_event
+                stop_event=stop_event,
+                session=session
             )
             
             # التحقق من إيقاف العملية
@@ -1184,7 +1187,7 @@ class ReelsController(QObject):
             return (False, 'المسار ليس ملف')
         
         ext = Path(video_path).suffix.lower()
-        if ext not in VIDEO_EXTENSIONS:
+        if ext not in VIDEO_EXTENSIONS_SET:
             return (False, f'امتداد غير مدعوم: {ext}')
         
         try:
@@ -22,7 +22,7 @@ from typing import Callable, Optional, List, Any, Tuple, Dict
 
 import requests
 
-from services import FacebookAPIService
+from services import FacebookAPIService, UploadService
 from core import BaseJob, NotificationSystem
 from core import (
     get_subprocess_args, run_subprocess, SmartUploadScheduler,
@@ -56,6 +56,9 @@ DEFAULT_RANDOM_DELAY_MAX = 15
 # إصدار Facebook Graph API
 FB_API_VERSION = 'v20.0'
 
+# خدمة الرفع - لكشف أخطاء Rate Limit بنفس منطق المجدولات
+_upload_service = UploadService(api_version=FB_API_VERSION)
+
 
 # ==================== دوال مساعدة ====================
 # Helper Functions
@@ -943,6 +946,14 @@ def _process_normal_mode(job: StoryJob, batch: list, files: list, token: str,
                 except Exception:
                     pass
             
+            # Rate Limit - إيقاف الدفعة فوراً بدلاً من محاولة باقي الملفات
+            if _upload_service.is_rate_limit_error(body):
+                result['files_failed'] += 1
+                result['error'] = translate_fb_error(body)
+                result['rate_limited'] = True
+                _log(f'⏳ تم الوصول لحد الطلبات (Rate Limit) - إيقاف الدفعة: {filename}')
+                break
+            
             # التحقق من النجاح
             if is_story_upload_successful(status, body):
                 result['files_uploaded'] += 1
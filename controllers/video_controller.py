@@ -33,7 +33,7 @@ from core import (
     get_subprocess_args, run_subprocess, check_internet_connection,
     check_disk_space, validate_file_extension, normalize_path,
     retry_with_backoff, RateLimiter, handle_rate_limit, get_file_info,
-    get_temp_directory, NotificationSystem, VIDEO_EXTENSIONS
+    get_temp_directory, NotificationSystem, VIDEO_EXTENSIONS, VIDEO_EXTENSIONS_SET
 )
 
 # ==================== ثوابت ====================
@@ -329,8 +329,10 @@ def get_video_files(folder_path: str, sort_by: str = 'name') -> list:
     if not folder.exists():
         return []
     
-    files = [p for p in folder.iterdir() 
-             if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS]
+    # os.scandir يعيد نوع الملف مع القائمة - بدون stat إضافي لكل ملف
+    with os.scandir(folder) as it:
+        files = [Path(e.path) for e in it
+                 if e.is_file() and e.name.lower().endswith(VIDEO_EXTENSIONS)]
     
     if sort_by == 'random':
         random.shuffle(files)
@@ -364,8 +366,9 @@ def count_video_files(folder_path: str) -> int:
     if not folder.exists():
         return 0
     
-    return len([p for p in folder.iterdir() 
-                if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS])
+    with os.scandir(folder) as it:
+        return sum(1 for e in it
+                   if e.is_file() and e.name.lower().endswith(VIDEO_EXTENSIONS))
 
 
 # ==================== دوال العلامة المائية (Watermark) ====================
@@ -1165,7 +1168,7 @@ class VideoController(QObject):
             return (False, 'المسار ليس ملف')
         
         ext = Path(video_path).suffix.lower()
-        if ext not in VIDEO_EXTENSIONS:
+        if ext not in VIDEO_EXTENSIONS_SET:
             return (False, f'امتداد غير مدعوم: {ext}')
         
         try:
@@ -12,7 +12,7 @@ This module provides core functionality including:
 """
 
 from .single_instance import SingleInstanceManager
-from .threads import TokenExchangeThread, FetchPagesThread
+from .threads import TokenExchangeThread, TokenExchangeRunnable, FetchPagesThread
 from .notifications import TelegramNotifier, NotificationSystem
 from .constants import (
     SINGLE_INSTANCE_BASE_NAME,
@@ -28,8 +28,11 @@ from .constants import (
     WATERMARK_MIN_OUTPUT_RATIO,
     WATERMARK_CLEANUP_DELAY,
     WATERMARK_FILE_CLOSE_DELAY,
+    WatermarkPos,
+    WATERMARK_OVERLAY,
     IMAGE_EXTENSIONS,
     VIDEO_EXTENSIONS,
+    VIDEO_EXTENSIONS_SET,
     STORY_EXTENSIONS,
     MAX_VIDEO_DURATION_SECONDS,
     INTERNET_CHECK_INTERVAL,
@@ -68,6 +71,7 @@ from .job_keys import make_job_key, get_job_key
 __all__ = [
     'SingleInstanceManager',
     'TokenExchangeThread',
+    'TokenExchangeRunnable',
     'FetchPagesThread',
     'TelegramNotifier',
     'NotificationSystem',
@@ -84,8 +88,11 @@ __all__ = [
     'WATERMARK_MIN_OUTPUT_RATIO',
     'WATERMARK_CLEANUP_DELAY',
     'WATERMARK_FILE_CLOSE_DELAY',
+    'WatermarkPos',
+    'WATERMARK_OVERLAY',
     'IMAGE_EXTENSIONS',
     'VIDEO_EXTENSIONS',
+    'VIDEO_EXTENSIONS_SET',
     'STORY_EXTENSIONS',
     'MAX_VIDEO_DURATION_SECONDS',
     'INTERNET_CHECK_INTERVAL',
@@ -55,6 +55,8 @@ class BaseJob(ABC):
         self._is_scheduled = is_scheduled
         self._cancel_requested = False
         self._next_run_timestamp = next_run_timestamp if next_run_timestamp is not None else (time.time() + max(1, int(interval_seconds)))
+        # نفس الموعد على الساعة الرتيبة - لا يتأثر بتعديل ساعة النظام (NTP/التوقيت الصيفي)
+        self._next_run_monotonic = time.monotonic() + (self._next_run_timestamp - time.time())
         
         # أقفال
         self._state_lock = threading.Lock()
@@ -112,9 +114,27 @@ class BaseJob(ABC):
 
     @next_run_timestamp.setter
     def next_run_timestamp(self, value: float):
-        """تعيين ختم وقت التشغيل التالي بشكل آمن."""
+        """تعيين ختم وقت التشغيل التالي بشكل آمن (مع تحديث الموعد الرتيب)."""
+        next_run_monotonic = time.monotonic() + (value - time.time())
         with self._state_lock:
             self._next_run_timestamp = value
+            self._next_run_monotonic = next_run_monotonic
+
+    @property
+    def next_run_monotonic(self) -> float:
+        """موعد التشغيل التالي على الساعة الرتيبة (time.monotonic) - للمقارنة في المجدول."""
+        with self._state_lock:
+            return self._next_run_monotonic
+
+    def snapshot(self) -> tuple:
+        """
+        قراءة الحالة كاملة تحت قفل واحد.
+
+        العائد: (enabled, is_scheduled, cancel_requested, next_run_monotonic)
+        الموعد بالساعة الرتيبة - للعرض استخدم next_run_timestamp.
+        """
+        with self._state_lock:
+            return (self._enabled, self._is_scheduled, self._cancel_requested, self._next_run_monotonic)
 
     def reset_next_run_timestamp(self):
         """
@@ -4,6 +4,8 @@ Core Constants for Page Management Application
 This module contains all the constants used throughout the application.
 """
 
+from enum import Enum
+
 # ==================== Single Instance ====================
 SINGLE_INSTANCE_BASE_NAME = "FacebookPageManagementSingleInstance"
 
@@ -30,11 +32,38 @@ WATERMARK_MIN_OUTPUT_RATIO = 0.1  # الحد الأدنى لنسبة حجم ال
 WATERMARK_CLEANUP_DELAY = 1  # تأخير قبل حذف الملف المؤقت بالثواني
 WATERMARK_FILE_CLOSE_DELAY = 0.5  # تأخير بعد FFmpeg للتأكد من إغلاق الملف
 
+
+class WatermarkPos(str, Enum):
+    """مواقع العلامة المائية المدعومة - Supported watermark positions"""
+    TOP_LEFT = 'top_left'
+    TOP_RIGHT = 'top_right'
+    BOTTOM_LEFT = 'bottom_left'
+    BOTTOM_RIGHT = 'bottom_right'
+    CENTER = 'center'
+
+    @property
+    def overlay(self) -> str:
+        """خيارات مرشح overlay في FFmpeg لهذا الموقع."""
+        return WATERMARK_OVERLAY[self]
+
+
+# خيارات overlay المحسوبة مسبقاً لكل موقع (W/H للفيديو، w/h للشعار)
+WATERMARK_OVERLAY = {
+    WatermarkPos.TOP_LEFT: 'x=10:y=10',
+    WatermarkPos.TOP_RIGHT: 'x=W-w-10:y=10',
+    WatermarkPos.BOTTOM_LEFT: 'x=10:y=H-h-10',
+    WatermarkPos.BOTTOM_RIGHT: 'x=W-w-10:y=H-h-10',
+    WatermarkPos.CENTER: 'x=(W-w)/2:y=(H-h)/2',
+}
+
 # ==================== File Extensions ====================
 # الامتدادات المدعومة للصور (للستوري)
 IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 # الامتدادات المدعومة للفيديوهات
 VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv')
+# نفس الامتدادات كمجموعة لفحص العضوية O(1) (ext in VIDEO_EXTENSIONS_SET)
+# أما str.endswith فيقبل VIDEO_EXTENSIONS (tuple) مباشرة
+VIDEO_EXTENSIONS_SET = frozenset(VIDEO_EXTENSIONS)
 # جميع الامتدادات المدعومة للستوري (صور + فيديوهات)
 STORY_EXTENSIONS = IMAGE_EXTENSIONS + VIDEO_EXTENSIONS
 
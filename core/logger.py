@@ -228,6 +228,10 @@ class UnifiedLogger:
         for handler in self._logger.handlers:
             handler.setLevel(level)
     
+    def is_debug_enabled(self) -> bool:
+        """هل مستوى DEBUG مفعّل؟ (لتجنب تنسيق الرسائل التفصيلية المكلفة عند عدم الحاجة)"""
+        return self._logger.isEnabledFor(logging.DEBUG)
+    
     def _notify_callback(self, message: str):
         """إرسال الرسالة لدالة الاستدعاء إن وجدت."""
         with self._callback_lock:
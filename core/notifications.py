@@ -280,9 +280,16 @@ class NotificationSystem:
     
     @staticmethod
     def notify(log_fn, level, message, job_name=None):
-        """إرسال إشعار."""
+        """
+        إرسال إشعار.
+
+        message يمكن أن يكون نصاً أو دالة بدون معاملات تُرجع النص،
+        وفي هذه الحالة لا يُبنى النص إلا عند وجود log_fn.
+        """
         if log_fn is None:
             return
+        if callable(message):
+            message = message()
         prefix = f'[{job_name}] ' if job_name else ''
         log_fn(f'{level} {prefix}{message}')
 
@@ -6,76 +6,140 @@ This module provides background thread classes for non-blocking operations.
 
 import json
 import requests
-from PySide6.QtCore import QThread, Signal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PySide6.QtCore import QObject, QRunnable, QThread, Signal
 from core.constants import FACEBOOK_API_VERSION, FACEBOOK_API_TIMEOUT
 from services.token_manager import get_pages
 
 
+# جلسة مشتركة بين جميع threads جلب التوكن لإعادة استخدام اتصال TLS مع graph.facebook.com
+# (requests.Session آمنة لطلبات GET المتزامنة عبر مجمّع اتصالات urllib3)
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                                            max_retries=Retry(total=2, backoff_factor=0.3)))
+
+
+# رسالة الخطأ الافتراضية عند عدم العثور على التوكن
+DEFAULT_TOKEN_NOT_FOUND_MSG = 'لم يتم العثور على التوكن في الاستجابة'
+
+
+def _extract_fb_error_message(data: dict, fallback: str = None) -> str:
+    """
+    استخراج رسالة الخطأ من استجابة Facebook API.
+    
+    Args:
+        data: قاموس الاستجابة من Facebook API
+        fallback: رسالة بديلة في حالة عدم وجود رسالة خطأ
+    
+    Returns:
+        رسالة الخطأ المستخرجة أو الرسالة البديلة
+    """
+    if fallback is None:
+        fallback = DEFAULT_TOKEN_NOT_FOUND_MSG
+    error_info = data.get('error', {})
+    if isinstance(error_info, dict):
+        return error_info.get('message', fallback)
+    return fallback
+
+
+def _exchange_token(app_id: str, app_secret: str, short_token: str):
+    """
+    تبديل التوكن القصير بتوكن طويل عبر الجلسة المشتركة.
+    
+    Returns:
+        tuple: (بيانات الاستجابة أو None, رسالة الخطأ أو None)
+    """
+    try:
+        url = f"https://graph.facebook.com/{FACEBOOK_API_VERSION}/oauth/access_token"
+        params = {
+            "grant_type": "fb_exchange_token",
+            "client_id": app_id,
+            "client_secret": app_secret,
+            "fb_exchange_token": short_token,
+        }
+        r = _HTTP_SESSION.get(url, params=params, timeout=FACEBOOK_API_TIMEOUT)
+        r.raise_for_status()
+        data = r.json()
+        if "access_token" in data:
+            return data, None
+        # استخراج رسالة الخطأ من الاستجابة بدون عرض البيانات الحساسة
+        return None, _extract_fb_error_message(data)
+    except requests.exceptions.Timeout:
+        return None, 'انتهت مهلة الاتصال بالخادم'
+    except requests.exceptions.ConnectionError:
+        return None, 'فشل الاتصال بالخادم - تحقق من اتصالك بالإنترنت'
+    except requests.exceptions.HTTPError as e:
+        # محاولة استخراج رسالة خطأ من استجابة Facebook
+        try:
+            error_data = e.response.json()
+            return None, _extract_fb_error_message(error_data, str(e))
+        except (ValueError, json.JSONDecodeError):
+            return None, str(e)
+    except Exception as e:
+        return None, str(e)
+
+
 class TokenExchangeThread(QThread):
     """Thread منفصل لجلب التوكن الطويل بدون تجميد الواجهة"""
     # استخدام اسم مختلف لتجنب تعارض مع QThread.finished
     token_received = Signal(object)
     error = Signal(str)
 
+    DEFAULT_TOKEN_NOT_FOUND_MSG = DEFAULT_TOKEN_NOT_FOUND_MSG
+
     def __init__(self, app_id: str, app_secret: str, short_token: str):
         super().__init__()
         self.app_id = app_id
         self.app_secret = app_secret
         self.short_token = short_token
 
-    # رسالة الخطأ الافتراضية عند عدم العثور على التوكن
-    DEFAULT_TOKEN_NOT_FOUND_MSG = 'لم يتم العثور على التوكن في الاستجابة'
-    
     def _extract_fb_error_message(self, data: dict, fallback: str = None) -> str:
-        """
-        استخراج رسالة الخطأ من استجابة Facebook API.
-        
-        Args:
-            data: قاموس الاستجابة من Facebook API
-            fallback: رسالة بديلة في حالة عدم وجود رسالة خطأ
-        
-        Returns:
-            رسالة الخطأ المستخرجة أو الرسالة البديلة
-        """
-        if fallback is None:
-            fallback = self.DEFAULT_TOKEN_NOT_FOUND_MSG
-        error_info = data.get('error', {})
-        if isinstance(error_info, dict):
-            return error_info.get('message', fallback)
-        return fallback
+        return _extract_fb_error_message(data, fallback)
+
+    def run(self):
+        data, error_msg = _exchange_token(self.app_id, self.app_secret, self.short_token)
+        if data is not None:
+            self.token_received.emit(data)
+        else:
+            self.error.emit(error_msg)
+
+
+class TokenExchangeSignals(QObject):
+    """
+    إشارات TokenExchangeRunnable (QRunnable ليس QObject فلا يملك إشارات).
     
+    كل إشارة تحمل مفتاح الطلب (key) أولاً ليحدد المستقبل الطلب بدون closure.
+    """
+    token_received = Signal(object, object)  # (key, data)
+    error = Signal(object, str)  # (key, رسالة الخطأ)
+    finished = Signal(object)  # (key)
+
+
+class TokenExchangeRunnable(QRunnable):
+    """
+    مهمة جلب التوكن الطويل تُنفَّذ على QThreadPool بدلاً من إنشاء QThread لكل طلب.
+    
+    يجب أن يحتفظ المستدعي بمرجع للمهمة حتى إشارة finished.
+    """
+
+    def __init__(self, app_id: str, app_secret: str, short_token: str, key=None):
+        super().__init__()
+        self.key = key
+        self.app_id = app_id
+        self.app_secret = app_secret
+        self.short_token = short_token
+        self.signals = TokenExchangeSignals()
+
     def run(self):
         try:
-            url = f"https://graph.facebook.com/{FACEBOOK_API_VERSION}/oauth/access_token"
-            params = {
-                "grant_type": "fb_exchange_token",
-                "client_id": self.app_id,
-                "client_secret": self.app_secret,
-                "fb_exchange_token": self.short_token,
-            }
-            r = requests.get(url, params=params, timeout=FACEBOOK_API_TIMEOUT)
-            r.raise_for_status()
-            data = r.json()
-            if "access_token" in data:
-                self.token_received.emit(data)
+            data, error_msg = _exchange_token(self.app_id, self.app_secret, self.short_token)
+            if data is not None:
+                self.signals.token_received.emit(self.key, data)
             else:
-                # استخراج رسالة الخطأ من الاستجابة بدون عرض البيانات الحساسة
-                error_msg = self._extract_fb_error_message(data)
-                self.error.emit(error_msg)
-        except requests.exceptions.Timeout:
-            self.error.emit('انتهت مهلة الاتصال بالخادم')
-        except requests.exceptions.ConnectionError:
-            self.error.emit('فشل الاتصال بالخادم - تحقق من اتصالك بالإنترنت')
-        except requests.exceptions.HTTPError as e:
-            # محاولة استخراج رسالة خطأ من استجابة Facebook
-            try:
-                error_data = e.response.json()
-                error_msg = self._extract_fb_error_message(error_data, str(e))
-            except (ValueError, json.JSONDecodeError):
-                error_msg = str(e)
-            self.error.emit(error_msg)
-        except Exception as e:
-            self.error.emit(str(e))
+                self.signals.error.emit(self.key, error_msg)
+        finally:
+            self.signals.finished.emit(self.key)
 
 
 class FetchPagesThread(QThread):
@@ -144,5 +208,7 @@ class FetchPagesThread(QThread):
 
 __all__ = [
     'TokenExchangeThread',
+    'TokenExchangeSignals',
+    'TokenExchangeRunnable',
     'FetchPagesThread',
 ]
@@ -25,7 +25,7 @@ import random
 from pathlib import Path
 from typing import Optional, Tuple, Callable
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import wraps, lru_cache
 
 import requests
 
@@ -1528,6 +1528,59 @@ def get_date_placeholder(format_type: str = "ymd") -> str:
         return now.strftime("%Y-%m-%d")
 
 
+# المتغيرات المدعومة في قوالب العناوين - Supported title placeholders
+_TITLE_PLACEHOLDER_RE = re.compile(r"\{(filename|date|date_ymd|date_dmy|date_time|random_emoji)\}")
+_TITLE_EMOJIS = ("🔥", "❤️", "💯", "✨", "🎉", "👍", "💪", "🌟", "😍", "🎊")
+_DATE_FORMATS = {
+    "date": "%Y-%m-%d",
+    "date_ymd": "%Y-%m-%d",
+    "date_dmy": "%d/%m/%Y",
+    "date_time": "%Y-%m-%d %H:%M",
+}
+
+
+@lru_cache(maxsize=128)
+def compile_title_template(title: str) -> Callable[[str], str]:
+    """
+    تحليل قالب العنوان مرة واحدة وإرجاع دالة تطبيق سريعة
+    
+    القالب يُقسَّم إلى أجزاء نصية ومتغيرات عند أول استخدام فقط، والنتيجة
+    مخزنة حسب نص القالب (تعديل القالب ينتج دالة جديدة تلقائياً).
+    
+    Args:
+        title: قالب العنوان
+    
+    Returns:
+        دالة render(filename="") تُرجع العنوان بعد استبدال المتغيرات
+    """
+    # الأجزاء الزوجية نصوص ثابتة والفردية أسماء متغيرات
+    parts = tuple(_TITLE_PLACEHOLDER_RE.split(title))
+    if len(parts) == 1:
+        return lambda filename="": title
+    
+    def render(filename: str = "") -> str:
+        now = None
+        emoji = None
+        out = []
+        for i, part in enumerate(parts):
+            if not i % 2:
+                out.append(part)
+            elif part == "filename":
+                # بدون اسم ملف يبقى المتغير كما هو
+                out.append(os.path.splitext(filename)[0] if filename else "{filename}")
+            elif part == "random_emoji":
+                if emoji is None:
+                    emoji = random.choice(_TITLE_EMOJIS)
+                out.append(emoji)
+            else:
+                if now is None:
+                    now = datetime.now()
+                out.append(now.strftime(_DATE_FORMATS[part]))
+        return "".join(out)
+    
+    return render
+
+
 def apply_title_placeholders(title: str, filename: str = "") -> str:
     """
     تطبيق جميع المتغيرات على العنوان
@@ -1554,20 +1607,4 @@ def apply_title_placeholders(title: str, filename: str = "") -> str:
     if not title:
         return title
     
-    # استبدال {filename}
-    if filename:
-        # إزالة الامتداد من اسم الملف
-        name_without_ext = os.path.splitext(filename)[0]
-        title = title.replace("{filename}", name_without_ext)
-    
-    # استبدال متغيرات التاريخ
-    title = title.replace("{date}", get_date_placeholder("ymd"))
-    title = title.replace("{date_ymd}", get_date_placeholder("ymd"))
-    title = title.replace("{date_dmy}", get_date_placeholder("dmy"))
-    title = title.replace("{date_time}", get_date_placeholder("time"))
-    
-    # استبدال {random_emoji}
-    emojis = ["🔥", "❤️", "💯", "✨", "🎉", "👍", "💪", "🌟", "😍", "🎊"]
-    title = title.replace("{random_emoji}", random.choice(emojis))
-    
-    return title
+    return compile_title_template(title)(filename)
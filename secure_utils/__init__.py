@@ -7,6 +7,7 @@
 Exported Functions:
 - encrypt_text(plain): Encrypt plaintext using Fernet (or legacy XOR as fallback)
 - decrypt_text(token): Decrypt ciphertext (supports both Fernet and legacy XOR)
+- decrypt_many(tokens): Decrypt a list of ciphertexts with one key load
 - get_or_create_key(): Get or create the Fernet encryption key
 - is_cryptography_available(): Check if cryptography library is installed
 - migrate_encrypted_value(old_value): Migrate legacy XOR-encrypted data to Fernet
@@ -22,6 +23,7 @@ from .secure_storage import (
     get_or_create_key,
     encrypt_text,
     decrypt_text,
+    decrypt_many,
     SECURE_KEY_FILE,
     is_cryptography_available,
     migrate_encrypted_value
@@ -31,6 +33,7 @@ __all__ = [
     'get_or_create_key',
     'encrypt_text',
     'decrypt_text',
+    'decrypt_many',
     'SECURE_KEY_FILE',
     'is_cryptography_available',
     'migrate_encrypted_value',
@@ -21,7 +21,7 @@ import sys
 import base64
 import warnings
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Try to import cryptography, fall back gracefully if not available
 try:
@@ -113,6 +113,20 @@ def _get_fernet() -> Optional['Fernet']:
 
 # ==================== Legacy XOR Encryption (for backward compatibility) ====================
 
+def _xor_bytes(data: bytes, key: bytes) -> bytes:
+    """
+    XOR data with a repeating key in one big-integer operation.
+    
+    Equivalent to bytes(b ^ key[i % len(key)] for i, b in enumerate(data)),
+    but the XOR runs in C instead of a per-byte Python generator.
+    """
+    n = len(data)
+    if not n:
+        return b''
+    keystream = (key * (n // len(key) + 1))[:n]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')).to_bytes(n, 'big')
+
+
 def _legacy_xor_encrypt(plain: str, key: bytes = LEGACY_SECRET_KEY) -> str:
     """
     Legacy XOR encryption for backward compatibility.
@@ -131,8 +145,7 @@ def _legacy_xor_encrypt(plain: str, key: bytes = LEGACY_SECRET_KEY) -> str:
         return ''
     
     try:
-        data = plain.encode('utf-8')
-        encrypted = bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+        encrypted = _xor_bytes(plain.encode('utf-8'), key)
         return base64.urlsafe_b64encode(encrypted).decode('utf-8')
     except Exception:
         return ''
@@ -157,7 +170,7 @@ def _legacy_xor_decrypt(token: str, key: bytes = LEGACY_SECRET_KEY) -> str:
     
     try:
         encrypted = base64.urlsafe_b64decode(token.encode('utf-8'))
-        decrypted = bytes(b ^ key[i % len(key)] for i, b in enumerate(encrypted))
+        decrypted = _xor_bytes(encrypted, key)
         return decrypted.decode('utf-8')
     except Exception:
         return ''
@@ -213,26 +226,64 @@ def decrypt_text(token: str) -> str:
     
     # Check if this is Fernet-encrypted data (prefixed with 'FRN:')
     if token.startswith('FRN:'):
-        fernet = _get_fernet()
-        if fernet is not None:
-            try:
-                encrypted_data = token[4:].encode('utf-8')  # Remove 'FRN:' prefix
-                decrypted = fernet.decrypt(encrypted_data)
-                return decrypted.decode('utf-8')
-            except InvalidToken:
-                # Token might be corrupted or key changed
-                pass
-            except Exception:
-                pass
-        
-        # If Fernet decryption failed, return empty (can't fall back for Fernet data)
-        return ''
+        return _fernet_decrypt(token, _get_fernet())
     
     # Non-prefixed tokens are legacy XOR-encrypted data
     # Fall back to legacy XOR decryption for backward compatibility
     return _legacy_xor_decrypt(token)
 
 
+def decrypt_many(tokens: List[str]) -> List[str]:
+    """
+    Decrypt several ciphertexts, in order.
+    
+    Same result as [decrypt_text(t) for t in tokens], but the key file is
+    read and the Fernet instance built once for the whole list instead of
+    once per token.
+    
+    Args:
+        tokens: Base64-encoded ciphertexts
+    
+    Returns:
+        Decrypted plaintexts ('' for empty or undecryptable entries)
+    """
+    fernet = None
+    if any(token and token.startswith('FRN:') for token in tokens):
+        fernet = _get_fernet()
+    
+    result = []
+    for token in tokens:
+        if not token:
+            result.append('')
+        elif token.startswith('FRN:'):
+            result.append(_fernet_decrypt(token, fernet))
+        else:
+            result.append(_legacy_xor_decrypt(token))
+    return result
+
+
+def _fernet_decrypt(token: str, fernet: Optional['Fernet']) -> str:
+    """
+    Decrypt a 'FRN:'-prefixed token with the given Fernet instance.
+    
+    Returns:
+        Decrypted plaintext, or empty string if decryption fails
+    """
+    if fernet is not None:
+        try:
+            encrypted_data = token[4:].encode('utf-8')  # Remove 'FRN:' prefix
+            decrypted = fernet.decrypt(encrypted_data)
+            return decrypted.decode('utf-8')
+        except InvalidToken:
+            # Token might be corrupted or key changed
+            pass
+        except Exception:
+            pass
+    
+    # If Fernet decryption failed, return empty (can't fall back for Fernet data)
+    return ''
+
+
 def migrate_encrypted_value(old_value: str) -> str:
     """
     Migrate a legacy-encrypted value to the new secure encryption.
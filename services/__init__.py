@@ -18,11 +18,11 @@ from .data_access import (
     get_settings_file, get_jobs_file, get_database_file, migrate_old_files,
     save_hashtag_group, get_hashtag_groups, delete_hashtag_group,
     is_within_working_hours, calculate_time_to_working_hours_start,
-    log_upload, get_upload_stats, reset_upload_stats, generate_text_chart,
+    log_upload, log_upload_many, get_upload_stats, reset_upload_stats, generate_text_chart,
     init_default_templates, ensure_default_templates,
     get_all_templates, get_template_by_id, save_template, delete_template,
     get_default_template, set_default_template, get_schedule_times_for_template,
-    migrate_json_to_sqlite
+    migrate_json_to_sqlite, ALL_WEEKDAYS_STR
 )
 
 # تصدير الخدمات - Export services
@@ -49,6 +49,7 @@ __all__ = [
     'is_within_working_hours',
     'calculate_time_to_working_hours_start',
     'log_upload',
+    'log_upload_many',
     'get_upload_stats',
     'reset_upload_stats',
     'generate_text_chart',
@@ -62,4 +63,5 @@ __all__ = [
     'set_default_template',
     'get_schedule_times_for_template',
     'migrate_json_to_sqlite',
+    'ALL_WEEKDAYS_STR',
 ]
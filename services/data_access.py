@@ -219,6 +219,36 @@ def log_upload(page_id: str, page_name: str, file_path: str, file_name: str,
         log_error(f'[DataAccess] Failed to log upload: {e}')
 
 
+def log_upload_many(rows: list):
+    """
+    تسجيل عدة عمليات رفع دفعة واحدة (معاملة واحدة بدلاً من معاملة لكل ملف).
+    Log several uploads in a single transaction.
+    
+    المعاملات / Args:
+        rows: قائمة صفوف بنفس ترتيب معاملات log_upload - List of tuples in log_upload order:
+              (page_id, page_name, file_path, file_name, upload_type,
+               video_id, video_url, status, error_message)
+    """
+    if not rows:
+        return
+    try:
+        conn = sqlite3.connect(str(get_database_file()))
+        try:
+            # WAL مفعّل من DatabaseManager - مع NORMAL تكفي مزامنة واحدة لكل معاملة
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with conn:
+                conn.executemany('''
+                    INSERT INTO upload_history
+                    (page_id, page_name, file_path, file_name, upload_type,
+                     video_id, video_url, status, error_message)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+        finally:
+            conn.close()
+    except Exception as e:
+        log_error(f'[DataAccess] Failed to log uploads: {e}')
+
+
 def get_upload_stats(page_id: str = None, days: int = 30) -> dict:
     """
     الحصول على إحصائيات الرفع.
@@ -132,6 +132,8 @@ class DatabaseManager:
             
             # Enable WAL mode for better concurrency
             self._conn.execute("PRAGMA journal_mode=WAL;")
+            # With WAL, NORMAL syncs only at checkpoints - still safe against corruption
+            self._conn.execute("PRAGMA synchronous=NORMAL;")
             
             # Enable foreign keys
             self._conn.execute("PRAGMA foreign_keys=ON;")
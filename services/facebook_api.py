@@ -174,55 +174,10 @@ class FacebookAPIService:
         """
         try:
             conn = sqlite3.connect(str(db_file_path))
-            cursor = conn.cursor()
-            
-            # تشفير البيانات الحساسة
-            encrypted_secret = encrypt_fn(app_secret) if app_secret else ''
-            encrypted_short = encrypt_fn(short_lived_token) if short_lived_token else ''
-            encrypted_long = encrypt_fn(long_lived_token) if long_lived_token else ''
-            
-            if token_id:
-                # عند التحديث: الاحتفاظ بالقيم القديمة إذا كانت القيم الجديدة فارغة
-                cursor.execute('''
-                    SELECT app_secret, short_lived_token FROM app_tokens WHERE id = ?
-                ''', (token_id,))
-                existing_row = cursor.fetchone()
-                
-                if existing_row:
-                    if not encrypted_secret and existing_row[0]:
-                        encrypted_secret = existing_row[0]
-                        log_info(f'[TokenManager] الاحتفاظ بـ app_secret الموجود للتطبيق {app_name} (id={token_id})')
-                    if not encrypted_short and existing_row[1]:
-                        encrypted_short = existing_row[1]
-                        log_info(f'[TokenManager] الاحتفاظ بـ short_lived_token الموجود للتطبيق {app_name} (id={token_id})')
-                
-                log_info(f'[TokenManager] تحديث التوكينات للتطبيق {app_name} (id={token_id})')
-                
-                cursor.execute('''
-                    UPDATE app_tokens SET
-                        app_name = ?,
-                        app_id = ?,
-                        app_secret = ?,
-                        short_lived_token = ?,
-                        long_lived_token = ?,
-                        token_expires_at = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                ''', (app_name, app_id, encrypted_secret, encrypted_short,
-                      encrypted_long, token_expires_at, token_id))
-                result_id = token_id
-            else:
-                log_info(f'[TokenManager] إضافة تطبيق جديد: {app_name}')
-                
-                cursor.execute('''
-                    INSERT INTO app_tokens 
-                    (app_name, app_id, app_secret, short_lived_token, long_lived_token, token_expires_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (app_name, app_id, encrypted_secret, encrypted_short,
-                      encrypted_long, token_expires_at))
-                result_id = cursor.lastrowid
-                log_info(f'[TokenManager] تم إنشاء التطبيق {app_name} بمعرف {result_id}')
-            
+            result_id = FacebookAPIService._write_app_token(
+                conn.cursor(), encrypt_fn, app_name, app_id, app_secret,
+                short_lived_token, long_lived_token, token_expires_at, token_id
+            )
             conn.commit()
             conn.close()
             return True, result_id
@@ -230,6 +185,127 @@ class FacebookAPIService:
             log_error(f'[TokenManager] خطأ في حفظ التطبيق {app_name}: {e}')
             return False, None
     
+    @staticmethod
+    def save_app_tokens_bulk(db_file_path: Path, encrypt_fn,
+                             rows: List[Dict[str, Any]]) -> List[Tuple[bool, Optional[int]]]:
+        """
+        حفظ عدة تطبيقات في معاملة واحدة
+        Save several applications in a single transaction
+        
+        كل صف يُكتب داخل SAVEPOINT خاص به، فالصف الفاشل يُتراجع عنه وحده
+        بينما تُثبَّت بقية الصفوف بعملية commit واحدة.
+        
+        Args:
+            db_file_path: مسار ملف قاعدة البيانات - Database file path
+            encrypt_fn: دالة التشفير - Encryption function
+            rows: قائمة قواميس بمفاتيح معاملات save_app_token - List of dicts keyed
+                  like save_app_token's arguments (app_name, app_id, app_secret,
+                  short_lived_token, long_lived_token, token_expires_at, token_id)
+        
+        Returns:
+            قائمة (نجاح، معرف السجل) بنفس ترتيب rows
+            List of (success, record ID) in the same order as rows
+        """
+        if not rows:
+            return []
+        results: List[Tuple[bool, Optional[int]]] = []
+        try:
+            # isolation_level=None: التحكم اليدوي بـ BEGIN/SAVEPOINT/COMMIT
+            conn = sqlite3.connect(str(db_file_path), isolation_level=None)
+        except Exception as e:
+            log_error(f'[TokenManager] خطأ في فتح قاعدة البيانات للحفظ الجماعي: {e}')
+            return [(False, None)] * len(rows)
+        try:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN')
+            for row in rows:
+                cursor.execute('SAVEPOINT app_row')
+                try:
+                    result_id = FacebookAPIService._write_app_token(
+                        cursor, encrypt_fn, row['app_name'], row['app_id'],
+                        row.get('app_secret', ''), row.get('short_lived_token', ''),
+                        row.get('long_lived_token', ''), row.get('token_expires_at'),
+                        row.get('token_id')
+                    )
+                    cursor.execute('RELEASE app_row')
+                    results.append((True, result_id))
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO app_row')
+                    cursor.execute('RELEASE app_row')
+                    log_error(f'[TokenManager] خطأ في حفظ التطبيق {row.get("app_name")}: {e}')
+                    results.append((False, None))
+            cursor.execute('COMMIT')
+            return results
+        except Exception as e:
+            log_error(f'[TokenManager] خطأ في الحفظ الجماعي للتطبيقات: {e}')
+            try:
+                conn.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass
+            return [(False, None)] * len(rows)
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _write_app_token(cursor: sqlite3.Cursor, encrypt_fn, app_name: str, app_id: str,
+                         app_secret: str, short_lived_token: str, long_lived_token: str,
+                         token_expires_at: Optional[str], token_id: Optional[int]) -> int:
+        """
+        كتابة صف تطبيق واحد (إدراج أو تحديث) دون commit
+        Write one app row (insert or update) without committing
+        
+        Returns:
+            معرف السجل - Record ID
+        """
+        # تشفير البيانات الحساسة
+        encrypted_secret = encrypt_fn(app_secret) if app_secret else ''
+        encrypted_short = encrypt_fn(short_lived_token) if short_lived_token else ''
+        encrypted_long = encrypt_fn(long_lived_token) if long_lived_token else ''
+        
+        if token_id:
+            # عند التحديث: الاحتفاظ بالقيم القديمة إذا كانت القيم الجديدة فارغة
+            cursor.execute('''
+                SELECT app_secret, short_lived_token FROM app_tokens WHERE id = ?
+            ''', (token_id,))
+            existing_row = cursor.fetchone()
+            
+            if existing_row:
+                if not encrypted_secret and existing_row[0]:
+                    encrypted_secret = existing_row[0]
+                    log_info(f'[TokenManager] الاحتفاظ بـ app_secret الموجود للتطبيق {app_name} (id={token_id})')
+                if not encrypted_short and existing_row[1]:
+                    encrypted_short = existing_row[1]
+                    log_info(f'[TokenManager] الاحتفاظ بـ short_lived_token الموجود للتطبيق {app_name} (id={token_id})')
+            
+            log_info(f'[TokenManager] تحديث التوكينات للتطبيق {app_name} (id={token_id})')
+            
+            cursor.execute('''
+                UPDATE app_tokens SET
+                    app_name = ?,
+                    app_id = ?,
+                    app_secret = ?,
+                    short_lived_token = ?,
+                    long_lived_token = ?,
+                    token_expires_at = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (app_name, app_id, encrypted_secret, encrypted_short,
+                  encrypted_long, token_expires_at, token_id))
+            result_id = token_id
+        else:
+            log_info(f'[TokenManager] إضافة تطبيق جديد: {app_name}')
+            
+            cursor.execute('''
+                INSERT INTO app_tokens 
+                (app_name, app_id, app_secret, short_lived_token, long_lived_token, token_expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (app_name, app_id, encrypted_secret, encrypted_short,
+                  encrypted_long, token_expires_at))
+            result_id = cursor.lastrowid
+            log_info(f'[TokenManager] تم إنشاء التطبيق {app_name} بمعرف {result_id}')
+        
+        return result_id
+    
     @staticmethod
     def delete_app_token(db_file_path: Path, token_id: int) -> bool:
         """
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, Callable
 
 from core.logger import log_info, log_error, log_warning, log_debug
+from core.constants import WatermarkPos, WATERMARK_OVERLAY
 
 
 class UploadService:
@@ -201,7 +202,7 @@ class UploadService:
                         speed = (bytes_sent / 1024 / 1024) / elapsed if elapsed > 0 else 0
                         remaining = max(0, file_size - bytes_sent)
                         eta = int(remaining / (bytes_sent / elapsed)) if bytes_sent > 0 and elapsed > 0 else 0
-                        ui_signals.progress_signal.emit(percent, f'رفع مجزأ {percent}% | سرعة {speed:.2f} MB/s | متبقٍ ~{eta} ث')
+                        ui_signals.emit_progress(percent, f'رفع مجزأ {percent}% | سرعة {speed:.2f} MB/s | متبقٍ ~{eta} ث')
             except Exception as e:
                 log(f'خطأ قراءة/نقل: {e}')
                 return None, {'error': 'file_read_or_transfer', 'detail': str(e)}
@@ -221,7 +222,7 @@ class UploadService:
                 log(f'فشل الإنهاء: {e}')
                 return None, {'error': 'finish_failed', 'detail': str(e)}
             
-            ui_signals.progress_signal.emit(100, 'تم الرفع المجزأ 100%')
+            ui_signals.emit_progress(100, 'تم الرفع المجزأ 100%')
             log(f'انتهى الرفع المجزأ: {resp3}')
             return r3.status_code if hasattr(r3, 'status_code') else 200, resp3
     
@@ -303,15 +304,11 @@ class UploadService:
             if (watermark_x is not None and watermark_y is not None and
                 isinstance(watermark_x, (int, float)) and isinstance(watermark_y, (int, float))):
                 overlay_pos = f'x={int(watermark_x)}:y={int(watermark_y)}'
+            elif isinstance(position, WatermarkPos):
+                # الموقع متحقق منه مسبقاً عند إنشاء الوظيفة
+                overlay_pos = position.overlay
             else:
-                position_map = {
-                    'top_left': 'x=10:y=10',
-                    'top_right': 'x=W-w-10:y=10',
-                    'bottom_left': 'x=10:y=H-h-10',
-                    'bottom_right': 'x=W-w-10:y=H-h-10',
-                    'center': 'x=(W-w)/2:y=(H-h)/2'
-                }
-                overlay_pos = position_map.get(position, position_map['bottom_right'])
+                overlay_pos = WATERMARK_OVERLAY.get(position, WatermarkPos.BOTTOM_RIGHT.overlay)
             
             # بناء أمر FFmpeg
             filter_complex = (
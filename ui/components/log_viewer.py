@@ -8,7 +8,7 @@ from typing import Optional
 from enum import Enum
 from datetime import datetime
 
-from PySide6.QtWidgets import QTextEdit
+from PySide6.QtWidgets import QPlainTextEdit
 from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
 from PySide6.QtCore import Qt
 
@@ -22,10 +22,13 @@ class LogLevel(Enum):
     DEBUG = "debug"
 
 
-class LogViewer(QTextEdit):
+class LogViewer(QPlainTextEdit):
     """
     عارض السجلات مع دعم الألوان والمستويات
     Log viewer with color coding and log levels
+
+    QPlainTextEdit: تخطيط نصي أبسط من QTextEdit للسجلات التي تُضاف في النهاية فقط
+    (Plain-text layout - much cheaper than QTextEdit for append-only logs)
     """
     
     # Log level colors (matching admin.py theme)
@@ -36,13 +39,20 @@ class LogViewer(QTextEdit):
         LogLevel.SUCCESS: QColor("#4CAF50"),   # Green
         LogLevel.DEBUG: QColor("#9E9E9E"),     # Gray
     }
+
+    # أقصى عدد أسطر محفوظة - الأقدم يُحذف تلقائياً (Max retained log lines)
+    MAX_BLOCKS = 2000
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
         
         # Enable text wrapping
-        self.setLineWrapMode(QTextEdit.WidgetWidth)
+        self.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+
+        # حد لعدد الأسطر حتى لا تبطؤ الإضافة في الجلسات الطويلة
+        # Bound the document so appends stay cheap over long sessions
+        self.setMaximumBlockCount(self.MAX_BLOCKS)
     
     def log(self, message: str, level: LogLevel = LogLevel.INFO, include_timestamp: bool = True):
         """
@@ -9,7 +9,7 @@ Functions added in Phase 6:
 - Token utility (mask_token)
 
 Functions added during refactoring:
-- simple_encrypt, simple_decrypt
+- simple_encrypt, simple_decrypt, simple_decrypt_many
 - check_ffmpeg_available
 - add_watermark
 - _set_windows_app_id
@@ -19,13 +19,15 @@ import os
 import sys
 import ctypes
 import subprocess
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional, Callable
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush, QFont, QAction
 from PySide6.QtWidgets import QPushButton
-from core import get_resource_path, run_subprocess, create_popen
-from secure_utils import encrypt_text as secure_encrypt, decrypt_text as secure_decrypt
+from core import get_resource_path, run_subprocess, create_popen, WatermarkPos
+from secure_utils import encrypt_text as secure_encrypt, decrypt_text as secure_decrypt, decrypt_many as secure_decrypt_many
 
 
 def create_fallback_icon() -> QIcon:
@@ -55,10 +57,12 @@ def create_fallback_icon() -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=1)
 def load_app_icon() -> QIcon:
     """
     تحميل أيقونة التطبيق من مسارات محددة بالترتيب.
     يدعم كل من وضع التطوير والتشغيل بعد التجميع بـ PyInstaller.
+    النتيجة مخزنة مؤقتاً: الملف يُقرأ ويُفك مرة واحدة لكل العمليات.
     
     المسارات التي يتم البحث فيها:
         1. assets/favicon.ico (عبر get_resource_path)
@@ -110,9 +114,12 @@ except ImportError:
     HAS_QDARKTHEME = False
 
 
+@lru_cache(maxsize=128)
 def get_icon(icon_name: str, color: str = None, fallback_text: str = '') -> QIcon:
     """
     الحصول على أيقونة qtawesome أو أيقونة فارغة كبديل.
+    النتيجة مخزنة مؤقتاً لكل (اسم، لون): QIcon مشترك ضمنياً فيُعاد استخدامه
+    بين الأزرار والإجراءات بدلاً من إعادة رسمه (get_icon.cache_clear عند تغيير الثيم).
     
     المعاملات:
         icon_name: اسم الأيقونة من Font Awesome (مثل 'fa5s.save')
@@ -474,6 +481,21 @@ def simple_decrypt(enc: str) -> str:
     return secure_decrypt(enc)
 
 
+def simple_decrypt_many(values: list) -> list:
+    """
+    فك تشفير قائمة نصوص مع تحميل مفتاح التشفير مرة واحدة للقائمة كلها.
+    
+    Decrypt a list of texts, loading the encryption key once for the whole list.
+    
+    Args:
+        values: النصوص المشفرة - Encrypted texts
+    
+    Returns:
+        النصوص الأصلية بنفس الترتيب - Decrypted texts in the same order
+    """
+    return secure_decrypt_many(values)
+
+
 # ==================== FFmpeg Functions ====================
 
 def check_ffmpeg_available() -> dict:
@@ -514,8 +536,45 @@ def check_ffmpeg_available() -> dict:
     return result
 
 
+@lru_cache(maxsize=64)
+def _probe_duration(video_path: str, mtime: float) -> float:
+    """
+    مدة الفيديو بالثواني عبر ffprobe (مخزنة حسب المسار ووقت التعديل).
+    Video duration in seconds via ffprobe, cached per (path, mtime).
+    """
+    try:
+        output = run_subprocess(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'csv=p=0', video_path],
+            timeout=30, text=True
+        )
+        if output.returncode == 0 and output.stdout.strip():
+            return float(output.stdout.strip())
+    except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+        pass
+    except Exception:
+        pass
+    return 0.0
+
+
+def _read_ffmpeg_progress(stream, total_duration: float, progress_callback: Callable):
+    """
+    قراءة أسطر key=value من ffmpeg -progress pipe:1 واستدعاء progress_callback(percent, stage).
+    """
+    for raw in stream:
+        key, _, value = raw.decode('ascii', 'replace').strip().partition('=')
+        if key == 'out_time_us' and total_duration > 0:
+            try:
+                percent = int(int(value) / (total_duration * 1_000_000) * 100)
+            except ValueError:
+                continue
+            progress_callback(max(0, min(100, percent)), 'watermark')
+        elif key == 'progress' and value == 'end':
+            progress_callback(100, 'done')
+
+
 def add_watermark(video_path: str, logo_path: str, output_path: str,
-                  position: str = 'bottom_right', opacity: float = 0.8,
+                  position: WatermarkPos = WatermarkPos.BOTTOM_RIGHT, opacity: float = 0.8,
                   progress_callback: Optional[Callable] = None) -> dict:
     """
     إضافة علامة مائية على الفيديو باستخدام FFmpeg.
@@ -525,9 +584,9 @@ def add_watermark(video_path: str, logo_path: str, output_path: str,
         video_path: مسار الفيديو الأصلي - Path to original video
         logo_path: مسار ملف الشعار - Path to logo file
         output_path: مسار الفيديو الناتج - Path to output video
-        position: موقع الشعار - Logo position (top_left, top_right, bottom_left, bottom_right, center)
+        position: موقع الشعار - Logo position (WatermarkPos أو قيمته النصية)
         opacity: مستوى الشفافية - Opacity level (0.0 - 1.0)
-        progress_callback: دالة لإظهار التقدم - Function to show progress
+        progress_callback: دالة لإظهار التقدم progress_callback(percent, stage) - Function to show progress
     
     العائد / Returns:
         dict يحتوي على نجاح/فشل العملية - dict containing success/failure status
@@ -543,36 +602,52 @@ def add_watermark(video_path: str, logo_path: str, output_path: str,
         return result
     
     # تحديد موقع الشعار
-    position_map = {
-        'top_left': 'overlay=10:10',
-        'top_right': 'overlay=main_w-overlay_w-10:10',
-        'bottom_left': 'overlay=10:main_h-overlay_h-10',
-        'bottom_right': 'overlay=main_w-overlay_w-10:main_h-overlay_h-10',
-        'center': 'overlay=(main_w-overlay_w)/2:(main_h-overlay_h)/2'
-    }
-    
-    overlay_filter = position_map.get(position, position_map['bottom_right'])
+    try:
+        position = WatermarkPos(position)
+    except ValueError:
+        result['error'] = f'موقع الشعار غير مدعوم: {position}'
+        return result
     
     # بناء الأمر
-    filter_complex = f"[1:v]format=rgba,colorchannelmixer=aa={opacity}[logo];[0:v][logo]{overlay_filter}"
+    filter_complex = f"[1:v]format=rgba,colorchannelmixer=aa={opacity}[logo];[0:v][logo]overlay={position.overlay}"
     
+    # -nostats -loglevel error: stderr يبقى شبه فارغ إلا عند الفشل
     cmd = [
-        'ffmpeg', '-y', '-i', video_path, '-i', logo_path,
+        'ffmpeg', '-y', '-nostats', '-loglevel', 'error',
+        '-i', video_path, '-i', logo_path,
         '-filter_complex', filter_complex,
         '-codec:a', 'copy',
-        output_path
     ]
+    if progress_callback is not None:
+        # تقدم منظم (key=value) على stdout بدلاً من تحليل stderr
+        cmd += ['-progress', 'pipe:1']
+    cmd.append(output_path)
     
     try:
+        # stdout غير مستخدم بدون progress_callback، و stderr يُقرأ كبايتات بدون فك ترميز كامل
         process = create_popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            cmd,
+            stdout=subprocess.PIPE if progress_callback is not None else subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
-        _, stderr = process.communicate()
+        if progress_callback is not None:
+            total_duration = _probe_duration(video_path, os.path.getmtime(video_path))
+            reader = threading.Thread(
+                target=_read_ffmpeg_progress,
+                args=(process.stdout, total_duration, progress_callback),
+                daemon=True
+            )
+            reader.start()
+            stderr = process.stderr.read()
+            process.wait()
+            reader.join()
+        else:
+            _, stderr = process.communicate()
         
         if process.returncode == 0:
             result['success'] = True
         else:
-            result['error'] = f'فشل FFmpeg: {stderr[:500]}'
+            result['error'] = f"فشل FFmpeg: {(stderr or b'')[-500:].decode('utf-8', 'replace')}"
     except FileNotFoundError:
         result['error'] = 'FFmpeg غير مثبت على النظام'
     except Exception as e:
@@ -602,6 +677,7 @@ __all__ = [
     # Encryption functions
     'simple_encrypt',
     'simple_decrypt',
+    'simple_decrypt_many',
     # FFmpeg functions
     'check_ffmpeg_available',
     'add_watermark',
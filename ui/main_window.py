@@ -18,17 +18,41 @@ import socket
 import subprocess
 import random
 import re
-import gc
+import reprlib
+import bisect
+import heapq
+import itertools
 import traceback
-from functools import partial
+from functools import partial, lru_cache
 from pathlib import Path
-import concurrent.futures
+import queue
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 from core import get_logger, log_info, log_error, log_warning, log_debug
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# محاولة استيراد requests_toolbelt لرفع الملفات كتدفق بدلاً من تحميلها في الذاكرة
+HAS_TOOLBELT = False
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    HAS_TOOLBELT = True
+except ImportError:
+    HAS_TOOLBELT = False
+
+# محاولة استيراد orjson لتحليل ملفات الإعدادات والوظائف بشكل أسرع (اختياري)
+# json.loads يقبل bytes أيضاً فيعمل بديلاً مباشراً
+HAS_ORJSON = False
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
 
 # استيراد وحدات قاعدة البيانات والتشفير الآمن
 from services import DatabaseManager, get_database_manager, initialize_database
@@ -37,11 +61,11 @@ from services import (
     get_settings_file, get_jobs_file, get_database_file, migrate_old_files,
     save_hashtag_group, get_hashtag_groups, delete_hashtag_group,
     is_within_working_hours, calculate_time_to_working_hours_start,
-    log_upload, get_upload_stats, reset_upload_stats, generate_text_chart,
+    log_upload, log_upload_many, get_upload_stats, reset_upload_stats, generate_text_chart,
     init_default_templates, ensure_default_templates,
     get_all_templates, get_template_by_id, save_template, delete_template,
     get_default_template, set_default_template, get_schedule_times_for_template,
-    migrate_json_to_sqlite
+    migrate_json_to_sqlite, ALL_WEEKDAYS_STR
 )
 from secure_utils import encrypt_text as secure_encrypt, decrypt_text as secure_decrypt
 
@@ -55,7 +79,11 @@ from controllers.story_controller import (
     get_random_emoji, get_random_delay, simulate_human_behavior, log_error_to_file,
     safe_process_story_job
 )
-from controllers.reels_controller import ReelsJob, get_reels_files, count_reels_files, check_reels_duration
+from controllers.reels_controller import (
+    ReelsJob, get_reels_files, count_reels_files, check_reels_duration,
+    upload_reels_with_retry, is_reels_upload_successful,
+    log_error_to_file as reels_log_error_to_file
+)
 from services import get_pages, PageFetchWorker, TokenExchangeWorker, AllPagesFetchWorker
 from core import (
     get_resource_path, get_subprocess_args, run_subprocess, create_popen, SmartUploadScheduler,
@@ -63,27 +91,28 @@ from core import (
     API_CALLS_PER_STORY, get_date_placeholder, apply_title_placeholders,
     make_job_key, get_job_key
 )
-from PySide6.QtCore import Qt, Signal, QObject, QTimer, QTime, QThread
-from PySide6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor, QBrush, QFont, QFontMetrics, QTextCursor
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QTimer, QTime, QThread, QThreadPool, QEvent
+from PySide6.QtGui import QAction, QIcon, QPixmap, QPainter, QColor, QBrush, QFont, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit, QPushButton, QListWidget, QListWidgetItem,
     QFileDialog, QSpinBox, QDoubleSpinBox, QTextEdit, QHBoxLayout, QVBoxLayout, QFormLayout, QGroupBox,
     QMessageBox, QComboBox, QProgressBar, QCheckBox, QFrame, QMenuBar, QStatusBar, QSystemTrayIcon, QMenu,
     QTabWidget, QTimeEdit, QDialog, QDialogButtonBox, QSlider, QTableWidget, QTableWidgetItem, QHeaderView,
-    QScrollArea, QSizePolicy, QRadioButton, QTreeWidget, QTreeWidgetItem
+    QScrollArea, QSizePolicy, QRadioButton, QTreeWidget, QTreeWidgetItem, QAbstractSpinBox, QGridLayout,
+    QLayout
 )
 from PySide6.QtNetwork import QLocalSocket, QLocalServer
 
 # استيراد الوحدات المعاد هيكلتها
 from core import (
     SingleInstanceManager, SINGLE_INSTANCE_BASE_NAME,
-    TokenExchangeThread, FetchPagesThread,
+    TokenExchangeRunnable, FetchPagesThread,
     TelegramNotifier, NotificationSystem,
     APP_TITLE, APP_DATA_FOLDER,
     RESUMABLE_THRESHOLD_BYTES, CHUNK_SIZE_DEFAULT,
     UPLOAD_TIMEOUT_START, UPLOAD_TIMEOUT_TRANSFER, UPLOAD_TIMEOUT_FINISH,
     UPLOADED_FOLDER_NAME, WATERMARK_FFMPEG_TIMEOUT, WATERMARK_MIN_OUTPUT_RATIO,
-    WATERMARK_CLEANUP_DELAY, WATERMARK_FILE_CLOSE_DELAY,
+    WATERMARK_CLEANUP_DELAY, WATERMARK_FILE_CLOSE_DELAY, WatermarkPos,
     IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, STORY_EXTENSIONS,
     MAX_VIDEO_DURATION_SECONDS, INTERNET_CHECK_INTERVAL, INTERNET_CHECK_MAX_ATTEMPTS,
     PAGES_FETCH_LIMIT, PAGES_FETCH_MAX_ITERATIONS, PAGES_CACHE_DURATION_SECONDS,
@@ -100,7 +129,7 @@ from ui.helpers import (
     mask_token, seconds_to_value_unit, format_remaining_time,
     format_time_12h, format_datetime_12h,
     # Import helper functions (Phase 7 Refactoring)
-    _set_windows_app_id, simple_encrypt, simple_decrypt,
+    _set_windows_app_id, simple_encrypt, simple_decrypt, simple_decrypt_many,
     check_ffmpeg_available, add_watermark
 )
 from ui.components import JobsTable, LogViewer, LogLevel, ProgressWidget
@@ -175,6 +204,21 @@ def save_app_token(app_name: str, app_id: str, app_secret: str = '',
     )
 
 
+def save_app_tokens_bulk(rows: list) -> list:
+    """
+    حفظ عدة تطبيقات في معاملة واحدة.
+    Save several applications in a single transaction.
+
+    المعاملات:
+        rows: قائمة قواميس بمفاتيح معاملات save_app_token - List of dicts keyed like save_app_token
+
+    العائد:
+        قائمة (نجاح، معرف السجل) بنفس ترتيب rows
+        List of (success, record ID) in the same order as rows
+    """
+    return FacebookAPIService.save_app_tokens_bulk(get_database_file(), simple_encrypt, rows)
+
+
 def delete_app_token(token_id: int) -> bool:
     """
     حذف تطبيق من قاعدة البيانات.
@@ -219,7 +263,7 @@ def get_all_long_lived_tokens() -> list:
 
 
 # ==================== Thread Classes ====================
-# TokenExchangeThread and FetchPagesThread have been moved to core/threads.py
+# TokenExchangeThread, TokenExchangeRunnable and FetchPagesThread have been moved to core/threads.py
 # They are imported above from core
 
 
@@ -257,6 +301,11 @@ def send_telegram_error(error_type: str, message: str, job_name: str = None):
 # ==================== نظام قوالب الجداول الذكية ====================
 # Template management functions moved to services/data_access.py
 
+# نصوص عرض أوقات القالب والساعة (ثابتة - تُجمع بالربط بدلاً من f-string)
+_TIMES_PREFIX = '📋 الأوقات: '
+_TIMES_NONE = _TIMES_PREFIX + '--'
+_CLOCK_PREFIX = '🕐 '
+
 
 # ==================== Internet Connectivity Check ====================
 
@@ -292,6 +341,35 @@ def check_internet_connection(timeout: int = 5, hosts: list = None) -> bool:
     return False
 
 
+# نتيجة آخر فحص للاتصال - تُشارك بين كل المجدولات (فيديو/ستوري/ريلز)
+INTERNET_CHECK_CACHE_TTL = 15.0
+_NET_CACHE = {'t': float('-inf'), 'ok': True}
+_NET_LOCK = threading.Lock()
+
+
+def cached_check_internet_connection() -> bool:
+    """
+    فحص الاتصال مع تخزين النتيجة لمدة INTERNET_CHECK_CACHE_TTL ثانية.
+
+    الوظائف المتزامنة تنتظر فحصاً واحداً بدلاً من فتح اتصال لكل وظيفة.
+    حلقات انتظار عودة الاتصال تستخدم fresh_check_internet_connection (فحص جديد دائماً).
+    """
+    with _NET_LOCK:
+        if time.monotonic() - _NET_CACHE['t'] < INTERNET_CHECK_CACHE_TTL:
+            return _NET_CACHE['ok']
+        ok = check_internet_connection()
+        _NET_CACHE.update(t=time.monotonic(), ok=ok)
+        return ok
+
+
+def fresh_check_internet_connection() -> bool:
+    """فحص جديد للاتصال (بدون الذاكرة المؤقتة) مع تحديثها بالنتيجة."""
+    ok = check_internet_connection()
+    with _NET_LOCK:
+        _NET_CACHE.update(t=time.monotonic(), ok=ok)
+    return ok
+
+
 def wait_for_internet(log_fn=None, check_interval: int = 60, max_attempts: int = 0) -> bool:
     """
     الانتظار حتى يعود الاتصال بالإنترنت (وضع الغفوة).
@@ -652,6 +730,12 @@ def calculate_jitter_interval(base_interval: int, jitter_percent: int = 10) -> i
 
 # ==================== Video Sorting ====================
 
+# ترتيب خيارات sort_by_combo وموقع العلامة المائية في الواجهة (الفهرس <-> القيمة المحفوظة)
+_SORT_BY_OPTIONS = ('name', 'random', 'date_created', 'date_modified')
+_SORT_BY_TO_INDEX = {name: i for i, name in enumerate(_SORT_BY_OPTIONS)}
+_WATERMARK_POSITIONS = tuple(pos.value for pos in WatermarkPos)
+_WATERMARK_POS_TO_INDEX = {pos: i for i, pos in enumerate(_WATERMARK_POSITIONS)}
+
 def sort_video_files(files: list, sort_by: str = 'name', reverse: bool = False) -> list:
     """
     ترتيب ملفات الفيديو حسب المعيار المحدد.
@@ -757,17 +841,31 @@ def validate_video(video_path: str, log_fn=None) -> dict:
 
 
 # ==================== Module Initialization ====================
-# تهيئة قاعدة البيانات عند تحميل الوحدة
 # Database is initialized in admin.py before this module is imported
-# تنفيذ الترحيل عند تحميل الوحدة - Execute migration when module loads
-migrate_old_files()
+# الترحيل وتهيئة القوالب مؤجلة إلى أول إنشاء للنافذة بدلاً من وقت الاستيراد
+# حتى لا يدفع كل استيراد للوحدة (الاختبارات، الأدوات) تكلفة فتح قاعدة البيانات
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def _ensure_initialized():
+    """تنفيذ الترحيل وتهيئة القوالب مرة واحدة فقط (آمن للاستدعاء المتكرر من عدة threads)."""
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        # تنفيذ ترحيل الملفات القديمة - Execute file migration
+        migrate_old_files()
 
-# Step 1: Run legacy database initialization for other tables
-migrate_json_to_sqlite()
+        # Step 1: Run legacy database initialization for other tables
+        migrate_json_to_sqlite()
 
-# Step 2: Run legacy template initialization (for backwards compatibility)
-init_default_templates()  # إنشاء قوالب الجداول الافتراضية
-ensure_default_templates()  # ضمان وجود القوالب الافتراضية (للترقية)
+        # Step 2: Run legacy template initialization (for backwards compatibility)
+        init_default_templates()  # إنشاء قوالب الجداول الافتراضية
+        ensure_default_templates()  # ضمان وجود القوالب الافتراضية (للترقية)
+        _initialized = True
 
 
 # ==================== Notification Systems ====================
@@ -780,7 +878,22 @@ telegram_notifier = TelegramNotifier()
 
 # ==================== Light Theme Fallback ====================
 
-LIGHT_THEME_FALLBACK = """
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE_RE = re.compile(r'\s+')
+_QSS_PUNCT_RE = re.compile(r'\s*([{};:,])\s*')
+
+
+def _minify_qss(qss: str) -> str:
+    """
+    تصغير نص QSS مرة واحدة عند الاستيراد: حذف التعليقات وضغط المسافات
+    حول { } ; : , لتقليل عمل محلل Qt عند كل setStyleSheet.
+    """
+    qss = _QSS_COMMENT_RE.sub('', qss)
+    qss = _QSS_SPACE_RE.sub(' ', qss)
+    return _QSS_PUNCT_RE.sub(r'\1', qss).strip()
+
+
+LIGHT_THEME_FALLBACK = _minify_qss("""
 QWidget {
     background-color: #f5f5f5;
     color: #333333;
@@ -982,9 +1095,9 @@ QToolTip {
     border-radius: 4px;
     padding: 4px 8px;
 }
-"""
+""")
 
-CUSTOM_STYLES = """
+CUSTOM_STYLES = _minify_qss("""
 QPushButton {
   background-color: #2e3440;
   color: #e6e6e6;
@@ -1086,7 +1199,7 @@ QComboBox QAbstractItemView {
   selection-color: #88c0d0;
   border: 1px solid #3b4252;
 }
-"""
+""")
 
 # ألوان العدّاد الزمني للوظائف
 COUNTDOWN_COLOR_GREEN = '#27ae60'   # أخضر: ≥5 دقائق
@@ -1094,6 +1207,21 @@ COUNTDOWN_COLOR_YELLOW = '#f39c12'  # أصفر: 1-5 دقائق
 COUNTDOWN_COLOR_RED = '#e74c3c'     # أحمر: <1 دقيقة
 COUNTDOWN_COLOR_GRAY = '#808080'    # رمادي: معطّل
 
+# ستايلات العدّاد المحسوبة مسبقاً (واحد لكل حالة) - بدلاً من بناء f-string في كل تحديث
+_COUNTDOWN_SS_BASE = 'font-weight: bold; padding: 4px 8px; border-radius: 4px;'
+_COUNTDOWN_SS_DISABLED = f'color: {COUNTDOWN_COLOR_GRAY}; background-color: #1a1d23; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_OUTSIDE = f'color: #FF9800; background-color: #2a1f10; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_IDLE = f'color: {COUNTDOWN_COLOR_YELLOW}; background-color: #2a2510; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_NONE = f'color: {COUNTDOWN_COLOR_GRAY}; background-color: #1a1d23; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_GREEN = f'color: {COUNTDOWN_COLOR_GREEN}; background-color: #0d2818; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_YELLOW = f'color: {COUNTDOWN_COLOR_YELLOW}; background-color: #2a2510; {_COUNTDOWN_SS_BASE}'
+_COUNTDOWN_SS_RED = f'color: {COUNTDOWN_COLOR_RED}; background-color: #2a1010; {_COUNTDOWN_SS_BASE}'
+
+# ستايلات مؤشر الحالة
+_STATUS_SS_GRAY = f'color: {COUNTDOWN_COLOR_GRAY}; font-weight: bold;'
+_STATUS_SS_YELLOW = f'color: {COUNTDOWN_COLOR_YELLOW}; font-weight: bold;'
+_STATUS_SS_GREEN = f'color: {COUNTDOWN_COLOR_GREEN}; font-weight: bold;'
+
 # نصوص الوقت المتبقي
 REMAINING_TIME_RUNNING = "⏰ جاري التشغيل..."  # نص يظهر عند تشغيل الوظيفة
 REMAINING_TIME_NOT_SCHEDULED = "---"  # نص يظهر للوظائف غير المجدولة
@@ -1112,12 +1240,23 @@ def _get_jobs_file() -> Path:
     return get_jobs_file()
 
 
+def _make_upload_session(pool_maxsize: int = 4) -> requests.Session:
+    """جلسة requests مع تجميع اتصالات HTTPS وبدون إعادة محاولة تلقائية (منطق الإعادة في المجدول)."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize,
+                                          max_retries=Retry(total=0, backoff_factor=0)))
+    return session
+
+
 class PageJob:
     """
     تمثيل وظيفة رفع فيديوهات لصفحة فيسبوك.
 
     ملاحظة ترتيب الأقفال:
-    - _state_lock: قفل خفيف لحماية enabled و cancel_requested (لا يجب الاحتفاظ به أثناء I/O)
+    - enabled و is_scheduled و cancel_requested سمات عادية
+      (الإسناد والقراءة ذريان تحت الـ GIL)
+    - next_run_timestamp خاصية تحدّث معها next_run_monotonic (موعد المجدول على الساعة الرتيبة)
+    - _state_lock: قفل خفيف لعملية check_and_reset_cancel فقط (لا يجب الاحتفاظ به أثناء I/O)
     - lock: قفل لمنع التشغيل المتزامن لعمليات الرفع (يمكن الاحتفاظ به لفترة طويلة)
 
     لا يجب أبداً الحصول على _state_lock أثناء الاحتفاظ بـ lock لتجنب حالات الجمود.
@@ -1126,6 +1265,22 @@ class PageJob:
     - enabled: حالة التفعيل (مفعّل/معطّل) - لا يؤثر على العدّاد أو الجدولة
     - is_scheduled: حالة الجدولة الفعلية - عند True يبدأ العدّاد والجدولة
     """
+    # الحقول المحفوظة في ملف الوظائف بالترتيب (to_dict)
+    _SERIALIZABLE = (
+        'page_id', 'page_name', 'app_name', 'folder', 'interval_seconds',
+        'page_access_token', 'next_index', 'title_template', 'description_template',
+        'chunk_size', 'use_filename_as_title', 'enabled', 'is_scheduled',
+        'next_run_timestamp', 'sort_by', 'jitter_enabled', 'jitter_percent',
+        'watermark_enabled', 'watermark_path', 'watermark_position',
+        'watermark_opacity', 'watermark_scale', 'watermark_x', 'watermark_y',
+        'use_smart_schedule', 'template_id',
+    )
+    # بدون __dict__ لكل نسخة - توفير الذاكرة مع وجود وظائف كثيرة
+    # next_run_timestamp و watermark_position خاصيتان (انظر أدناه) فتُخزّنان في _next_run_timestamp و _watermark_position
+    __slots__ = tuple(k for k in _SERIALIZABLE if k not in ('next_run_timestamp', 'watermark_position')) + (
+        '_next_run_timestamp', '_watermark_position', 'next_run_monotonic', 'cancel_requested', '_state_lock', 'lock',
+        '_file_cache', '_file_cache_lock', '_session')
+
     def __init__(self, page_id, page_name, folder,
                  interval_seconds=10800,
                  page_access_token=None,
@@ -1158,12 +1313,13 @@ class PageJob:
         self.description_template = description_template
         self.chunk_size = chunk_size
         self.use_filename_as_title = use_filename_as_title
-        self._enabled = enabled
-        self._is_scheduled = is_scheduled
-        self._cancel_requested = False
+        # حالات بسيطة: إسناد/قراءة سمة واحدة ذري تحت الـ GIL فلا تحتاج قفلاً
+        self.enabled = enabled
+        self.is_scheduled = is_scheduled
+        self.cancel_requested = False
         # ختم وقت يونكس للتشغيل التالي - إذا لم يُحدد يتم تعيينه إلى الآن + الفاصل الزمني
-        self._next_run_timestamp = next_run_timestamp if next_run_timestamp is not None else (time.time() + max(1, int(interval_seconds)))
-        # قفل خفيف لحماية القيم البولية - لا يحتفظ به أثناء عمليات I/O
+        self.next_run_timestamp = next_run_timestamp if next_run_timestamp is not None else (time.time() + max(1, int(interval_seconds)))
+        # قفل خفيف لعملية الفحص وإعادة الضبط الذرية (check_and_reset_cancel) فقط
         self._state_lock = threading.Lock()
         # قفل لمنع التشغيل المتزامن لعمليات الرفع - قد يحتفظ به لفترة طويلة
         self.lock = threading.Lock()
@@ -1183,62 +1339,65 @@ class PageJob:
         # إعدادات الجدولة الذكية
         self.use_smart_schedule = use_smart_schedule
         self.template_id = template_id
+        # قائمة ملفات المجلد المرتبة: (mtime_ns للمجلد, sort_by, files) - تُستخدم من SchedulerThread
+        self._file_cache = None
+        self._file_cache_lock = threading.Lock()
+        # جلسة HTTP تُنشأ عند أول رفع وتبقي اتصال TLS مفتوحاً بين عمليات الرفع
+        self._session = None
 
     @property
-    def enabled(self):
-        """الحصول على حالة التفعيل بشكل آمن من الـ threads."""
-        with self._state_lock:
-            return self._enabled
-
-    @enabled.setter
-    def enabled(self, value):
-        """تعيين حالة التفعيل بشكل آمن من الـ threads."""
-        with self._state_lock:
-            self._enabled = value
-
-    @property
-    def is_scheduled(self):
-        """الحصول على حالة الجدولة بشكل آمن من الـ threads."""
-        with self._state_lock:
-            return self._is_scheduled
-
-    @is_scheduled.setter
-    def is_scheduled(self, value):
-        """تعيين حالة الجدولة بشكل آمن من الـ threads."""
-        with self._state_lock:
-            self._is_scheduled = value
-
-    @property
-    def cancel_requested(self):
-        """الحصول على حالة طلب الإلغاء بشكل آمن من الـ threads."""
-        with self._state_lock:
-            return self._cancel_requested
-
-    @cancel_requested.setter
-    def cancel_requested(self, value):
-        """تعيين حالة طلب الإلغاء بشكل آمن من الـ threads."""
-        with self._state_lock:
-            self._cancel_requested = value
+    def session(self):
+        """جلسة requests الخاصة بهذه الوظيفة (تُنشأ عند الحاجة)."""
+        if self._session is None:
+            self._session = _make_upload_session()
+        return self._session
+
+    def close_session(self):
+        """إغلاق جلسة HTTP إن وُجدت (عند حذف الوظيفة أو إيقاف المجدول)."""
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
 
     def check_and_reset_cancel(self):
         """التحقق من حالة الإلغاء وإعادة ضبطها بشكل ذري."""
         with self._state_lock:
-            if self._cancel_requested:
-                self._cancel_requested = False
+            if self.cancel_requested:
+                self.cancel_requested = False
                 return True
             return False
 
     @property
     def next_run_timestamp(self):
-        """الحصول على ختم وقت التشغيل التالي بشكل آمن من الـ threads."""
-        with self._state_lock:
-            return self._next_run_timestamp
+        """ختم وقت يونكس للتشغيل التالي (للعرض والحفظ)."""
+        return self._next_run_timestamp
 
     @next_run_timestamp.setter
     def next_run_timestamp(self, value):
-        """تعيين ختم وقت التشغيل التالي بشكل آمن من الـ threads."""
-        with self._state_lock:
-            self._next_run_timestamp = value
+        # المجدول يقارن بالساعة الرتيبة - لا يتأثر برجوع ساعة النظام أو تقدمها
+        self.next_run_monotonic = time.monotonic() + (value - time.time())
+        self._next_run_timestamp = value
+
+    @property
+    def watermark_position(self) -> WatermarkPos:
+        """موقع العلامة المائية (WatermarkPos دائماً)."""
+        return self._watermark_position
+
+    @watermark_position.setter
+    def watermark_position(self, value):
+        # التحويل عند كل تعيين - الواجهة تعيّن قيماً نصية (ValueError للقيم غير المدعومة)
+        self._watermark_position = WatermarkPos(value)
+
+    def snapshot(self):
+        """
+        قراءة الحالة كاملة دفعة واحدة.
+
+        العائد: (enabled, is_scheduled, cancel_requested, next_run_monotonic)
+        الموعد بالساعة الرتيبة - للعرض استخدم next_run_timestamp.
+        """
+        return (self.enabled, self.is_scheduled, self.cancel_requested, self.next_run_monotonic)
 
     def reset_next_run_timestamp(self):
         """
@@ -1286,40 +1445,20 @@ class PageJob:
         self.next_run_timestamp = next_time
 
     def to_dict(self):
-        return {
-            'page_id': self.page_id,
-            'page_name': self.page_name,
-            'app_name': self.app_name,
-            'folder': self.folder,
-            'interval_seconds': self.interval_seconds,
-            'page_access_token': self.page_access_token,
-            'next_index': self.next_index,
-            'title_template': self.title_template,
-            'description_template': self.description_template,
-            'chunk_size': self.chunk_size,
-            'use_filename_as_title': self.use_filename_as_title,
-            'enabled': self.enabled,
-            'is_scheduled': self.is_scheduled,
-            'next_run_timestamp': self.next_run_timestamp,
-            'sort_by': self.sort_by,
-            'jitter_enabled': self.jitter_enabled,
-            'jitter_percent': self.jitter_percent,
-            'watermark_enabled': self.watermark_enabled,
-            'watermark_path': self.watermark_path,
-            'watermark_position': self.watermark_position,
-            'watermark_opacity': self.watermark_opacity,
-            'watermark_scale': self.watermark_scale,
-            'watermark_x': self.watermark_x,
-            'watermark_y': self.watermark_y,
-            'use_smart_schedule': self.use_smart_schedule,
-            'template_id': self.template_id
-        }
+        d = {k: getattr(self, k) for k in self._SERIALIZABLE}
+        d['watermark_position'] = WatermarkPos(self.watermark_position).value
+        return d
 
     @classmethod
     def from_dict(cls, d):
         secs = d.get('interval_seconds', 10800)
         # إذا كان next_run_timestamp محفوظاً نستخدمه، وإلا نعيّنه إلى الآن + الفاصل الزمني
         saved_timestamp = d.get('next_run_timestamp')
+        # الملفات القديمة قد تحتوي على موقع غير مدعوم - نعود للموقع الافتراضي بدلاً من تخطي الوظيفة
+        try:
+            watermark_position = WatermarkPos(d.get('watermark_position', 'bottom_right'))
+        except ValueError:
+            watermark_position = WatermarkPos.BOTTOM_RIGHT
         obj = cls(
             d['page_id'],
             d.get('page_name', ''),
@@ -1338,7 +1477,7 @@ class PageJob:
             jitter_percent=d.get('jitter_percent', 10),
             watermark_enabled=d.get('watermark_enabled', False),
             watermark_path=d.get('watermark_path', ''),
-            watermark_position=d.get('watermark_position', 'bottom_right'),
+            watermark_position=watermark_position,
             watermark_opacity=d.get('watermark_opacity', 0.8),
             watermark_scale=d.get('watermark_scale', 0.15),
             use_smart_schedule=d.get('use_smart_schedule', False),
@@ -1394,123 +1533,180 @@ def apply_template(template_str, page_job: PageJob, filename: str, file_index: i
     return out
 
 
-def move_video_to_uploaded_folder(video_path: str, log_fn=None) -> bool:
+def _maybe_apply(template_str, page_job: PageJob, filename: str, file_index: int, total_files: int):
     """
-    نقل ملف الفيديو إلى مجلد فرعي باسم 'Uploaded' داخل نفس المجلد الأب.
+    مثل apply_template لكن يتخطى التنسيق للقوالب الفارغة أو الثابتة (بدون متغيرات).
 
-    - إذا لم يكن مجلد 'Uploaded' موجوداً يتم إنشاؤه تلقائياً.
-    - في حالة وجود ملف بنفس الاسم في مجلد Uploaded، يتم إعادة تسميته بإضافة رقم مميز.
-    - يتم إرجاع True فقط إذا تم نقل الملف فعلياً والتأكد من وجوده في الوجهة.
-    - جميع الأخطاء تُسجل في السجل بوضوح.
+    لا يوجد تخزين مؤقت للنتائج لأن {datetime} و {random_emoji} تتغير في كل استدعاء.
+    """
+    if not template_str:
+        return ''
+    if '{' not in template_str:
+        return template_str
+    return apply_template(template_str, page_job, filename, file_index, total_files)
+
+
+def move_videos_to_uploaded_folder(video_paths, log_fn=None) -> list:
+    """
+    نقل عدة ملفات إلى مجلد فرعي باسم 'Uploaded' داخل المجلد الأب لكل ملف.
+
+    - يتم التحقق من مجلد Uploaded وإنشاؤه مرة واحدة لكل مجلد أب.
+    - تُقرأ أسماء الملفات الموجودة في الوجهة مرة واحدة عبر os.scandir ويُحل التكرار
+      في الذاكرة بدلاً من فحص exists() لكل اسم مرشّح.
+    - في حالة وجود ملف بنفس الاسم، يتم إعادة تسميته بإضافة لاحقة فريدة.
 
     المعاملات:
-        video_path: المسار الكامل لملف الفيديو المراد نقله.
+        video_paths: قائمة مسارات الملفات المراد نقلها.
         log_fn: دالة اختيارية للتسجيل (logging).
 
-    الاستخدام:
-        يتم استدعاء هذه الدالة بعد نجاح رفع الفيديو لنقله تلقائياً.
+    العائد:
+        قائمة bool بنفس ترتيب video_paths - True فقط إذا نُقل الملف فعلياً.
     """
 
     def _log(msg):
         if log_fn:
             log_fn(msg)
 
-    # التحقق من صحة المسار المُدخل
-    if not video_path:
-        _log('خطأ: مسار الفيديو فارغ أو غير صالح')
-        return False
+    results = [False] * len(video_paths)
+    # تجميع الملفات الصالحة حسب المجلد الأب
+    by_parent = {}
 
-    try:
-        video_file = Path(video_path)
-    except Exception as e:
-        _log(f'خطأ في تحليل مسار الملف: {video_path} - {e}')
-        return False
+    for i, video_path in enumerate(video_paths):
+        # التحقق من صحة المسار المُدخل
+        if not video_path:
+            _log('خطأ: مسار الفيديو فارغ أو غير صالح')
+            continue
+
+        try:
+            video_file = Path(video_path)
+        except Exception as e:
+            _log(f'خطأ في تحليل مسار الملف: {video_path} - {e}')
+            continue
+
+        # التحقق من وجود الملف المصدر فعلياً
+        if not video_file.exists():
+            _log(f'فشل النقل: الملف المصدر غير موجود: {video_path}')
+            continue
+
+        if not video_file.is_file():
+            _log(f'فشل النقل: المسار ليس ملفاً صالحاً: {video_path}')
+            continue
+
+        by_parent.setdefault(video_file.parent, []).append((i, video_file))
+
+    for parent_folder, items in by_parent.items():
+        uploaded_folder = parent_folder / UPLOADED_FOLDER_NAME
 
-    # التحقق من وجود الملف المصدر فعلياً
-    if not video_file.exists():
-        _log(f'فشل النقل: الملف المصدر غير موجود: {video_path}')
-        return False
+        # إنشاء مجلد Uploaded إذا لم يكن موجوداً
+        if not uploaded_folder.exists():
+            try:
+                uploaded_folder.mkdir(parents=True, exist_ok=True)
+                _log(f'تم إنشاء مجلد Uploaded: {uploaded_folder}')
+            except PermissionError as e:
+                _log(f'فشل إنشاء مجلد Uploaded - خطأ صلاحيات: {uploaded_folder} - {e}')
+                continue
+            except OSError as e:
+                _log(f'فشل إنشاء مجلد Uploaded - خطأ نظام الملفات: {uploaded_folder} - {e}')
+                continue
+            except Exception as e:
+                _log(f'فشل إنشاء مجلد Uploaded - خطأ غير متوقع: {uploaded_folder} - {e}')
+                continue
 
-    if not video_file.is_file():
-        _log(f'فشل النقل: المسار ليس ملفاً صالحاً: {video_path}')
-        return False
+        # التأكد من وجود المجلد بعد الإنشاء
+        if not uploaded_folder.exists():
+            _log(f'فشل النقل: مجلد Uploaded لم يُنشأ رغم عدم وجود خطأ: {uploaded_folder}')
+            continue
 
-    parent_folder = video_file.parent
-    uploaded_folder = parent_folder / UPLOADED_FOLDER_NAME
+        if not uploaded_folder.is_dir():
+            _log(f'فشل النقل: المسار {uploaded_folder} موجود لكنه ليس مجلداً')
+            continue
 
-    # إنشاء مجلد Uploaded إذا لم يكن موجوداً
-    if not uploaded_folder.exists():
+        # قراءة الأسماء الموجودة في الوجهة مرة واحدة - مقارنة بدون حالة الأحرف لأن
+        # Windows و macOS لا يميزان Video.MP4 عن video.mp4 (shutil.move سيستبدل الملف)
         try:
-            uploaded_folder.mkdir(parents=True, exist_ok=True)
-            _log(f'تم إنشاء مجلد Uploaded: {uploaded_folder}')
-        except PermissionError as e:
-            _log(f'فشل إنشاء مجلد Uploaded - خطأ صلاحيات: {uploaded_folder} - {e}')
-            return False
+            with os.scandir(uploaded_folder) as it:
+                existing = {entry.name.casefold() for entry in it}
         except OSError as e:
-            _log(f'فشل إنشاء مجلد Uploaded - خطأ نظام الملفات: {uploaded_folder} - {e}')
-            return False
-        except Exception as e:
-            _log(f'فشل إنشاء مجلد Uploaded - خطأ غير متوقع: {uploaded_folder} - {e}')
-            return False
+            _log(f'فشل قراءة محتويات مجلد Uploaded: {uploaded_folder} - {e}')
+            continue
 
-    # التأكد من وجود المجلد بعد الإنشاء
-    if not uploaded_folder.exists():
-        _log(f'فشل النقل: مجلد Uploaded لم يُنشأ رغم عدم وجود خطأ: {uploaded_folder}')
-        return False
-
-    if not uploaded_folder.is_dir():
-        _log(f'فشل النقل: المسار {uploaded_folder} موجود لكنه ليس مجلداً')
-        return False
-
-    # معالجة حالة تكرار اسم الملف
-    target_path = uploaded_folder / video_file.name
-    if target_path.exists():
-        # إضافة رقم مميز لتجنب التكرار
-        base_name = video_file.stem
-        extension = video_file.suffix
-        counter = 1
-        max_attempts = 1000  # حد أقصى لمنع حلقة لا نهائية
-        while target_path.exists() and counter < max_attempts:
-            new_name = f"{base_name}_{counter}{extension}"
-            target_path = uploaded_folder / new_name
-            counter += 1
-
-        if target_path.exists():
-            _log(f'فشل النقل: لا يمكن إيجاد اسم فريد للملف بعد {max_attempts} محاولة')
-            return False
+        for i, video_file in items:
+            # معالجة حالة تكرار اسم الملف
+            target_name = video_file.name
+            if target_name.casefold() in existing:
+                # إضافة لاحقة فريدة (الوقت بالنانوثانية + رقم العملية) لحل التكرار بدون فحص
+                base_name = video_file.stem
+                extension = video_file.suffix
+                target_name = f"{base_name}_{time.time_ns()}_{os.getpid()}{extension}"
+                counter = 1
+                max_attempts = 1000  # حد أقصى لمنع حلقة لا نهائية
+                # الرجوع للعدّاد فقط في حالة التصادم النادر مع اللاحقة الفريدة
+                while target_name.casefold() in existing and counter < max_attempts:
+                    target_name = f"{base_name}_{counter}{extension}"
+                    counter += 1
+
+                if target_name.casefold() in existing:
+                    _log(f'فشل النقل: لا يمكن إيجاد اسم فريد للملف بعد {max_attempts} محاولة')
+                    continue
+
+                _log(f'تم إعادة تسمية الملف لتجنب التكرار: {target_name}')
+
+            target_path = uploaded_folder / target_name
+
+            # نقل الملف
+            try:
+                shutil.move(str(video_file), str(target_path))
+            except PermissionError as e:
+                _log(f'فشل نقل الفيديو - خطأ صلاحيات: {video_file} -> {target_path} - {e}')
+                continue
+            except shutil.Error as e:
+                _log(f'فشل نقل الفيديو - خطأ shutil: {video_file} -> {target_path} - {e}')
+                continue
+            except OSError as e:
+                _log(f'فشل نقل الفيديو - خطأ نظام الملفات: {video_file} -> {target_path} - {e}')
+                continue
+            except Exception as e:
+                _log(f'فشل نقل الفيديو - خطأ غير متوقع: {video_file} -> {target_path} - {e}')
+                continue
 
-        _log(f'تم إعادة تسمية الملف لتجنب التكرار: {target_path.name}')
+            existing.add(target_name.casefold())
 
-    # نقل الملف
-    try:
-        shutil.move(str(video_file), str(target_path))
-    except PermissionError as e:
-        _log(f'فشل نقل الفيديو - خطأ صلاحيات: {video_file} -> {target_path} - {e}')
-        return False
-    except shutil.Error as e:
-        _log(f'فشل نقل الفيديو - خطأ shutil: {video_file} -> {target_path} - {e}')
-        return False
-    except OSError as e:
-        _log(f'فشل نقل الفيديو - خطأ نظام الملفات: {video_file} -> {target_path} - {e}')
-        return False
-    except Exception as e:
-        _log(f'فشل نقل الفيديو - خطأ غير متوقع: {video_file} -> {target_path} - {e}')
-        return False
+            # التحقق من أن الملف نُقل فعلاً إلى الوجهة
+            if not target_path.exists():
+                _log(f'فشل النقل: الملف لم يظهر في الوجهة بعد عملية النقل: {target_path}')
+                continue
+
+            # التحقق من أن الملف الأصلي لم يعد موجوداً (تم نقله وليس نسخه)
+            # ملاحظة: في حالة النقل بين أنظمة ملفات مختلفة، قد يقوم shutil.move بنسخ ثم حذف
+            # إذا بقي الملف الأصلي، فهذا يعني أن الحذف فشل - نسجل تحذير لكن لا نعتبره فشلاً
+            # لأن الهدف الأساسي (وجود الملف في Uploaded) تحقق
+            if video_file.exists():
+                _log(f'تحذير: الملف الأصلي لا يزال موجوداً بعد النقل (قد يكون نقل عبر أنظمة ملفات): {video_file}')
+
+            _log(f'تم نقل الفيديو بنجاح إلى: {target_path}')
+            results[i] = True
+
+    return results
+
+
+def move_video_to_uploaded_folder(video_path: str, log_fn=None) -> bool:
+    """
+    نقل ملف الفيديو إلى مجلد فرعي باسم 'Uploaded' داخل نفس المجلد الأب.
 
-    # التحقق من أن الملف نُقل فعلاً إلى الوجهة
-    if not target_path.exists():
-        _log(f'فشل النقل: الملف لم يظهر في الوجهة بعد عملية النقل: {target_path}')
-        return False
+    - إذا لم يكن مجلد 'Uploaded' موجوداً يتم إنشاؤه تلقائياً.
+    - في حالة وجود ملف بنفس الاسم في مجلد Uploaded، يتم إعادة تسميته بإضافة لاحقة فريدة.
+    - يتم إرجاع True فقط إذا تم نقل الملف فعلياً والتأكد من وجوده في الوجهة.
+    - جميع الأخطاء تُسجل في السجل بوضوح.
 
-    # التحقق من أن الملف الأصلي لم يعد موجوداً (تم نقله وليس نسخه)
-    # ملاحظة: في حالة النقل بين أنظمة ملفات مختلفة، قد يقوم shutil.move بنسخ ثم حذف
-    # إذا بقي الملف الأصلي، فهذا يعني أن الحذف فشل - نسجل تحذير لكن لا نعتبره فشلاً
-    # لأن الهدف الأساسي (وجود الملف في Uploaded) تحقق
-    if video_file.exists():
-        _log(f'تحذير: الملف الأصلي لا يزال موجوداً بعد النقل (قد يكون نقل عبر أنظمة ملفات): {video_file}')
+    المعاملات:
+        video_path: المسار الكامل لملف الفيديو المراد نقله.
+        log_fn: دالة اختيارية للتسجيل (logging).
 
-    _log(f'تم نقل الفيديو بنجاح إلى: {target_path}')
-    return True
+    الاستخدام:
+        يتم استدعاء هذه الدالة بعد نجاح رفع الفيديو لنقله تلقائياً.
+        لنقل عدة ملفات دفعة واحدة استخدم move_videos_to_uploaded_folder.
+    """
+    return move_videos_to_uploaded_folder([video_path], log_fn)[0]
 
 
 def is_upload_successful(status, body) -> bool:
@@ -1563,6 +1759,15 @@ class JobListItemWidget(QWidget):
     def __init__(self, job, parent=None):  # يقبل PageJob أو StoryJob
         super().__init__(parent)
         self.job = job
+        # آخر قيم مطبّقة - لتخطي setStyleSheet/setText عند عدم التغيير (إعادة تحليل QSS مكلفة)
+        self._last_countdown_ss = ''
+        self._last_status_ss = ''
+        self._last_countdown_text = ''
+        self._last_status_text = ''
+        # آخر قيم للعدّاد + علامة تحديث مؤجل عندما يكون الصف غير مرئي
+        self._last_args = (None, False, 0)
+        self._pending_refresh = False
+        self._last_info_key = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1591,16 +1796,60 @@ class JobListItemWidget(QWidget):
         self.info_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # محاذاة النص لليمين
         layout.addWidget(self.info_label, 1)  # stretch=1 للتمدد
 
+        # الخط ثابت طوال عمر الويدجت - نحسب مقاييسه مرة واحدة ونخزن نتائج الاقتطاع
+        self._fm = QFontMetrics(self.info_label.font())
+        self._elide_cached = lru_cache(maxsize=256)(self._elide_uncached)
+
         self.update_display()
 
+    def changeEvent(self, event):
+        """إعادة حساب مقاييس الخط ومسح ذاكرة الاقتطاع عند تغيّر الخط."""
+        if event.type() == QEvent.FontChange:
+            self._fm = QFontMetrics(self.info_label.font())
+            self._elide_cached.cache_clear()
+            self._last_info_key = None
+        super().changeEvent(event)
+
+    def _elide_uncached(self, text: str, max_width: int) -> str:
+        if self._fm.horizontalAdvance(text) <= max_width:
+            return text
+        return self._fm.elidedText(text, Qt.ElideMiddle, max_width)
+
     def _elide_text(self, text: str, max_width: int) -> str:
         """اقتطاع النص مع إضافة ... إذا تجاوز العرض المحدد."""
-        fm = QFontMetrics(self.info_label.font())
-        return fm.elidedText(text, Qt.ElideMiddle, max_width)
+        return self._elide_cached(text, max_width)
+
+    def _set_ss(self, label, attr, new_ss):
+        """تطبيق الستايل فقط إذا تغيّر عن آخر قيمة مطبّقة."""
+        if getattr(self, attr) == new_ss:
+            return
+        setattr(self, attr, new_ss)
+        label.setStyleSheet(new_ss)
+
+    def _set_text(self, label, attr, text):
+        """تعيين النص فقط إذا تغيّر (تجنب إعادة الرسم)."""
+        if getattr(self, attr) == text:
+            return
+        setattr(self, attr, text)
+        label.setText(text)
 
     def update_display(self, remaining_seconds=None, outside_working_hours=False, time_to_working_hours=0):
         """تحديث عرض معلومات الوظيفة والعدّاد (Requirement 1 - العداد الذكي)."""
+        self._last_args = (remaining_seconds, outside_working_hours, time_to_working_hours)
+        # الصفوف خارج منطقة العرض لا تُرسم - نؤجل التحديث إلى showEvent
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            self._pending_refresh = True
+            return
+        self._render_display(remaining_seconds, outside_working_hours, time_to_working_hours)
+
+    def showEvent(self, event):
+        """عرض آخر حالة مخزنة إذا فات الصف تحديث أثناء إخفائه."""
+        super().showEvent(event)
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self._render_display(*self._last_args)
 
+    def _render_display(self, remaining_seconds, outside_working_hours, time_to_working_hours):
         # التحقق من نظام الجدولة المستخدم (ذكي أو فاصل زمني)
         use_smart_schedule = getattr(self.job, 'use_smart_schedule', False)
         template_id = getattr(self.job, 'template_id', None)
@@ -1628,80 +1877,71 @@ class JobListItemWidget(QWidget):
 
         # حساب العرض المتاح لنص المعلومات (العرض الكلي - عرض الحالة والعدّاد - الهوامش)
         available_width = self.width() - self.COUNTDOWN_WIDTH - self.STATUS_WIDTH - self.MARGINS_WIDTH
-        if available_width > 100:
-            elided_text = self._elide_text(info_text, available_width)
-            self.info_label.setText(elided_text)
-            # عرض النص الكامل كتلميح فقط إذا تم اقتطاع النص
-            if elided_text != info_text:
-                self.info_label.setToolTip(info_text)
+        # النص والعرض لا يتغيران في أغلب الثواني - لا داعي لإعادة الاقتطاع أو التعيين
+        info_key = (info_text, available_width)
+        if info_key != self._last_info_key:
+            self._last_info_key = info_key
+            if available_width > 100:
+                elided_text = self._elide_text(info_text, available_width)
+                self.info_label.setText(elided_text)
+                # عرض النص الكامل كتلميح فقط إذا تم اقتطاع النص
+                if elided_text != info_text:
+                    self.info_label.setToolTip(info_text)
+                else:
+                    self.info_label.setToolTip('')
             else:
+                self.info_label.setText(info_text)
                 self.info_label.setToolTip('')
-        else:
-            self.info_label.setText(info_text)
-            self.info_label.setToolTip('')
-
-        # تحديث حالة الوظيفة
-        if not self.job.enabled:
-            self.status_label.setText('معطّل')
-            self.status_label.setStyleSheet(f'color: {COUNTDOWN_COLOR_GRAY}; font-weight: bold;')
-            self.countdown_label.setText('--:--:--')
-        elif self.job.is_scheduled:
+
+        # تحديث حالة الوظيفة (قراءة الحالة مرة واحدة تحت قفل واحد)
+        enabled, is_scheduled, _, _ = self.job.snapshot()
+        if not enabled:
+            self._set_text(self.status_label, '_last_status_text', 'معطّل')
+            self._set_ss(self.status_label, '_last_status_ss', _STATUS_SS_GRAY)
+            self._set_text(self.countdown_label, '_last_countdown_text', '--:--:--')
+        elif is_scheduled:
             if outside_working_hours:
                 # خارج ساعات العمل - عرض الوقت المتبقي لبداية ساعات العمل (Requirement 1)
-                self.status_label.setText('خارج ساعات العمل')
-                self.status_label.setStyleSheet(f'color: {COUNTDOWN_COLOR_YELLOW}; font-weight: bold;')
-                self.countdown_label.setText(f'⏳ تبدأ بعد: {format_remaining_time(time_to_working_hours)}')
+                self._set_text(self.status_label, '_last_status_text', 'خارج ساعات العمل')
+                self._set_ss(self.status_label, '_last_status_ss', _STATUS_SS_YELLOW)
+                self._set_text(self.countdown_label, '_last_countdown_text', f'⏳ تبدأ بعد: {format_remaining_time(time_to_working_hours)}')
             else:
-                self.status_label.setText('مجدول')
-                self.status_label.setStyleSheet(f'color: {COUNTDOWN_COLOR_GREEN}; font-weight: bold;')
+                self._set_text(self.status_label, '_last_status_text', 'مجدول')
+                self._set_ss(self.status_label, '_last_status_ss', _STATUS_SS_GREEN)
                 if remaining_seconds is not None:
-                    self.countdown_label.setText(format_remaining_time(remaining_seconds))
+                    self._set_text(self.countdown_label, '_last_countdown_text', format_remaining_time(remaining_seconds))
                 else:
-                    self.countdown_label.setText('--:--:--')
+                    self._set_text(self.countdown_label, '_last_countdown_text', '--:--:--')
         else:
             # مفعّل لكن غير مجدول
-            self.status_label.setText('مفعّل')
-            self.status_label.setStyleSheet(f'color: {COUNTDOWN_COLOR_YELLOW}; font-weight: bold;')
-            self.countdown_label.setText('غير مجدول')
+            self._set_text(self.status_label, '_last_status_text', 'مفعّل')
+            self._set_ss(self.status_label, '_last_status_ss', _STATUS_SS_YELLOW)
+            self._set_text(self.countdown_label, '_last_countdown_text', 'غير مجدول')
 
-        self.update_countdown_style(remaining_seconds, outside_working_hours)
+        self.update_countdown_style(remaining_seconds, outside_working_hours, (enabled, is_scheduled))
 
-    def update_countdown_style(self, remaining_seconds=None, outside_working_hours=False):
+    def update_countdown_style(self, remaining_seconds=None, outside_working_hours=False, state=None):
         """تحديث لون العدّاد بناءً على الوقت المتبقي مع خلفية مميزة (Requirement 1)."""
-        # ستايل أساسي للعدّاد مع خلفية داكنة وزوايا مستديرة
-        base_style = 'font-weight: bold; padding: 4px 8px; border-radius: 4px;'
+        # state: (enabled, is_scheduled) مقروءة مسبقاً لتجنب إعادة أخذ القفل
+        if state is None:
+            state = self.job.snapshot()[:2]
+        enabled, is_scheduled = state
 
-        if not self.job.enabled:
-            # رمادي داكن للوظائف المعطّلة
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_GRAY}; background-color: #1a1d23; {base_style}'
-            )
+        if not enabled:
+            ss = _COUNTDOWN_SS_DISABLED  # رمادي داكن للوظائف المعطّلة
         elif outside_working_hours:
-            # برتقالي لخارج ساعات العمل (Requirement 1)
-            self.countdown_label.setStyleSheet(
-                f'color: #FF9800; background-color: #2a1f10; {base_style}'
-            )
-        elif not self.job.is_scheduled:
-            # أصفر للوظائف المفعّلة لكن غير المجدولة
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_YELLOW}; background-color: #2a2510; {base_style}'
-            )
+            ss = _COUNTDOWN_SS_OUTSIDE  # برتقالي لخارج ساعات العمل (Requirement 1)
+        elif not is_scheduled:
+            ss = _COUNTDOWN_SS_IDLE  # أصفر للوظائف المفعّلة لكن غير المجدولة
         elif remaining_seconds is None:
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_GRAY}; background-color: #1a1d23; {base_style}'
-            )
+            ss = _COUNTDOWN_SS_NONE
         elif remaining_seconds >= 300:  # أخضر: ≥5 دقائق
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_GREEN}; background-color: #0d2818; {base_style}'
-            )
+            ss = _COUNTDOWN_SS_GREEN
         elif remaining_seconds >= 60:  # أصفر: 1-5 دقائق
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_YELLOW}; background-color: #2a2510; {base_style}'
-            )
+            ss = _COUNTDOWN_SS_YELLOW
         else:  # أحمر: <1 دقيقة
-            self.countdown_label.setStyleSheet(
-                f'color: {COUNTDOWN_COLOR_RED}; background-color: #2a1010; {base_style}'
-            )
+            ss = _COUNTDOWN_SS_RED
+        self._set_ss(self.countdown_label, '_last_countdown_ss', ss)
 
 def resumable_upload(page_job: PageJob, video_path, token, ui_signals: UiSignals,
                      final_title="", final_description=""):
@@ -1802,6 +2042,46 @@ def cleanup_temp_watermark_file(video_path: str, original_path: str, log_fn=None
     )
 
 
+# معاينة مختصرة لجسم استجابة فيسبوك - لا نبني نصاً كاملاً لاستجابات خطأ قد تكون ضخمة
+_BODY_REPR = reprlib.Repr()
+_BODY_REPR.maxstring = 200
+_BODY_REPR.maxother = 200
+
+
+def _body_preview(body, limit: int = 200) -> str:
+    """تمثيل مختصر لجسم الاستجابة (بحد أقصى limit حرف)."""
+    if isinstance(body, str):
+        return body[:limit]
+    return _BODY_REPR.repr(body)[:limit]
+
+
+def _safe_size(path) -> int:
+    """حجم الملف باستدعاء stat واحد (0 إذا لم يكن موجوداً أو تعذر الوصول)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _parse_fb_response(body):
+    """
+    قراءة حقول استجابة فيسبوك مرة واحدة.
+    Parse a Graph API upload response once.
+
+    العائد - Returns:
+        (video_id, error, error_message) - error هو حقل 'error' كما هو (أو None)
+        و error_message نص الخطأ المختصر للإشعارات.
+    """
+    if not isinstance(body, dict):
+        return None, None, _body_preview(body)
+    err = body.get('error')
+    if isinstance(err, dict):
+        msg = str(err.get('message', ''))
+    else:
+        msg = str(err) if err else ''
+    return body.get('video_id') or body.get('id'), err, msg
+
+
 def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignals,
                       title_tmpl, desc_tmpl, log_fn):
     """
@@ -1810,22 +2090,28 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
     هذه الدالة محمية من الأخطاء لمنع crash البرنامج.
     """
     endpoint = f'https://graph-video.facebook.com/v17.0/{page_job.page_id}/videos'
-    folder = Path(page_job.folder)
 
     # متغيرات للتتبع
     original_video_path = video_path
     video_path_to_upload = video_path
 
     try:
-        # الحصول على قائمة الملفات
+        filename = os.path.basename(video_path)
+
+        # الحصول على قائمة أسماء الملفات (os.scandir يعيد نوع الملف بدون stat إضافي)
         try:
-            files_all = sorted([p for p in folder.iterdir()
-                                if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS])
+            with os.scandir(page_job.folder) as it:
+                files_all = sorted((e.name for e in it
+                                    if e.is_file(follow_symlinks=False)
+                                    and e.name.lower().endswith(VIDEO_EXTENSIONS)), key=str.lower)
         except Exception:
-            files_all = [Path(video_path)]
+            files_all = [filename]
 
-        filename = os.path.basename(video_path)
-        idx = files_all.index(Path(video_path)) if Path(video_path) in files_all else 0
+        # مرور واحد على القائمة بدلاً من (in ثم index)
+        try:
+            idx = files_all.index(filename)
+        except ValueError:
+            idx = 0
 
         # تنظيف اسم الملف تلقائياً (داخلياً)
         original_name = os.path.splitext(filename)[0]
@@ -1834,8 +2120,9 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
         # if display_filename != original_name:
         #     log_fn(f'🧹 تم تنظيف العنوان: "{original_name}" -> "{display_filename}"')
 
-        title = display_filename if page_job.use_filename_as_title else apply_template(title_tmpl, page_job, display_filename, idx + 1, len(files_all))
-        description = apply_template(desc_tmpl, page_job, display_filename, idx + 1, len(files_all))
+        total = len(files_all)
+        title = display_filename if page_job.use_filename_as_title else _maybe_apply(title_tmpl, page_job, display_filename, idx + 1, total)
+        description = _maybe_apply(desc_tmpl, page_job, display_filename, idx + 1, total)
         # Problem 1 fix: إزالة رسالة السجل الزائدة
         # log_fn(f'رفع بسيط: {filename} -> {page_job.page_name} عنوان="{title}"')
 
@@ -1849,19 +2136,24 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
         # محاولة الرفع البسيط
         try:
             with open(video_path_to_upload, 'rb') as f:
+                # حجم الملف من الواصف المفتوح - يُستخدم لاحقاً بدون stat إضافي
+                file_size = os.fstat(f.fileno()).st_size
                 data = {
                     'access_token': token,
                     'title': title,
                     'description': description,
                     'published': 'true'
                 }
-                r = requests.post(endpoint, data=data, files={'source': (filename, f, 'video/mp4')}, timeout=300)
+                if HAS_TOOLBELT:
+                    # جسم multipart يُقرأ من القرص على أجزاء - بدون نسخة كاملة من الملف في الذاكرة
+                    enc = MultipartEncoder(fields={**data, 'source': (filename, f, 'video/mp4')})
+                    r = page_job.session.post(endpoint, data=enc,
+                                              headers={'Content-Type': enc.content_type}, timeout=300)
+                else:
+                    r = page_job.session.post(endpoint, data=data, files={'source': (filename, f, 'video/mp4')}, timeout=300)
         except Exception as e:
             log_fn(f'خطأ رفع بسيط: {e}')
-            try:
-                size = os.path.getsize(original_video_path)
-            except Exception:
-                size = 0
+            size = _safe_size(original_video_path)
 
             if size >= RESUMABLE_THRESHOLD_BYTES:
                 log_fn('تحويل للمجزأ بسبب الحجم.')
@@ -1880,13 +2172,8 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
         except Exception:
             body = r.text
 
-        # التحقق من الحاجة للرفع المجزأ
-        try:
-            file_size = os.path.getsize(video_path_to_upload) if os.path.exists(video_path_to_upload) else 0
-        except Exception:
-            file_size = 0
-
-        if status == 413 or (isinstance(body, dict) and body.get('error', {}).get('code') == 413) \
+        err = body.get('error') if isinstance(body, dict) else None
+        if status == 413 or (err and err.get('code') == 413) \
            or file_size >= RESUMABLE_THRESHOLD_BYTES:
             log_fn('تحويل للمجزأ (413 أو الحجم).')
             try:
@@ -1896,12 +2183,15 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
                 log_fn(f'❌ خطأ في الرفع المجزأ: {res_error}')
                 return None, {'error': 'resumable_exception', 'detail': str(res_error)}
 
-        try:
-            ui_signals.progress_signal.emit(100, 'تم الرفع البسيط 100%')
-        except Exception:
-            pass  # تجاهل أخطاء إرسال الإشارة
+        if ui_signals is not None:
+            try:
+                ui_signals.emit_progress(100, 'تم الرفع البسيط 100%')
+            except RuntimeError:
+                pass  # كائن الإشارات حُذف (إغلاق التطبيق أثناء الرفع)
 
-        log_fn(f'نتيجة الرفع البسيط ({status}): {body}')
+        # جسم الاستجابة الخام للتشخيص فقط - يُنسّق فقط عند تفعيل DEBUG
+        if get_logger().is_debug_enabled():
+            log_fn(f'نتيجة الرفع البسيط ({status}): {_body_preview(body)}')
         return status, body
 
     except Exception as e:
@@ -1925,7 +2215,140 @@ def upload_video_once(page_job: PageJob, video_path, token, ui_signals: UiSignal
             except Exception:
                 pass
 
-class SchedulerThread(threading.Thread):
+class _UploadWorkerPool:
+    """
+    خيوط رفع دائمة تسحب الوظائف من طابور محدود.
+
+    بديل ThreadPoolExecutor: لا Future لكل إرسال، والطابور المحدود يمنع تراكم
+    الوظائف في الذاكرة عندما يكون الرفع أبطأ من الجدولة.
+    """
+
+    def __init__(self, handler, max_workers, stop_event, name):
+        self._handler = handler
+        self._stop_event = stop_event
+        # إشارة إنهاء خاصة بالمجمّع: stop_event مشترك ويُمسح عند إعادة تشغيل المجدول
+        self._closed = threading.Event()
+        self._q = queue.Queue(maxsize=max_workers * 4)
+        self._threads = [threading.Thread(target=self._worker, name=f'{name}-{i}', daemon=True)
+                         for i in range(max_workers)]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, job) -> bool:
+        """إضافة وظيفة للطابور بدون انتظار. العائد False إذا كان الطابور ممتلئاً."""
+        try:
+            self._q.put_nowait(job)
+            return True
+        except queue.Full:
+            return False
+
+    def _worker(self):
+        while not self._closed.is_set() and not self._stop_event.is_set():
+            try:
+                job = self._q.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self._handler(job)
+            except Exception as e:
+                # استثناء غير ملتقط يجب ألا يُنهي خيط العامل الدائم
+                log_error(f'خطأ غير متوقع في خيط الرفع: {e}', exc_info=True)
+
+    def shutdown(self):
+        """إنهاء المجمّع وانتظار الخيوط (تخرج بعد إنهاء الرفع الجاري)."""
+        self._closed.set()
+        for t in self._threads:
+            t.join()
+
+
+# مهلة إعادة المحاولة عند امتلاء طابور الرفع (بالثواني)
+QUEUE_FULL_RETRY_SECONDS = 5
+
+
+class _HeapSchedulerMixin:
+    """
+    جدولة الوظائف بكومة مواعيد (next_run_monotonic, seq, job) بدلاً من المرور على كل
+    الوظائف كل ثانية: الخيط ينام حتى موعد أقرب وظيفة أو حتى الإيقاظ عبر notify_job_changed.
+
+    الفئة المستخدمة توفر stop_event و max_workers و _upload_wrapper وتستدعي _init_heap.
+    """
+    # أقصى مدة نوم قبل إعادة بناء الكومة من قاموس الوظائف لالتقاط أي تغيير لم يُبلَّغ عنه
+    RESCAN_INTERVAL = 30
+
+    def _init_heap(self, jobs_map):
+        self._heap_jobs_map = jobs_map
+        self._heap = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._dirty = True
+
+    def notify_job_changed(self, job=None):
+        """
+        إبلاغ المجدول بتغيّر حالة وظيفة (تفعيل/جدولة/وقت التشغيل) أو بطلب الإيقاف.
+        يوقظ الخيط لإعادة بناء الكومة فوراً.
+        """
+        with self._cv:
+            self._dirty = True
+            self._cv.notify_all()
+
+    def _rebuild_heap(self):
+        """إعادة بناء الكومة من الوظائف المفعّلة والمجدولة فقط."""
+        heap = []
+        for job in list(self._heap_jobs_map.values()):
+            enabled, is_scheduled, _, next_run = job.snapshot()
+            if enabled and is_scheduled:
+                heap.append((next_run, next(self._seq), job))
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def _run_heap_loop(self, pool_name):
+        """حلقة المجدول: إطلاق الوظائف المستحقة على خيوط الرفع ثم النوم حتى الموعد التالي."""
+        next_rescan = 0.0
+        pool = _UploadWorkerPool(self._upload_wrapper, self.max_workers, self.stop_event, pool_name)
+        try:
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                with self._cv:
+                    rebuild = self._dirty or now >= next_rescan
+                    self._dirty = False
+                if rebuild:
+                    self._rebuild_heap()
+                    next_rescan = now + self.RESCAN_INTERVAL
+
+                # إطلاق جميع الوظائف المستحقة
+                while self._heap and self._heap[0][0] <= now and not self.stop_event.is_set():
+                    _, _, job = heapq.heappop(self._heap)
+                    enabled, is_scheduled, _, next_run = job.snapshot()
+                    # تخطّي الوظائف غير المجدولة أو المعطّلة (تُضاف مجدداً عند إعادة البناء)
+                    if not enabled or not is_scheduled:
+                        continue
+
+                    # الوقت تغيّر منذ الإدراج (مثل تأجيل Rate Limit) - إعادة الإدراج بالوقت الحالي
+                    if now < next_run:
+                        heapq.heappush(self._heap, (next_run, next(self._seq), job))
+                        continue
+
+                    if pool.submit(job):
+                        # ضبط الوقت التالي بعد الرفع
+                        job.reset_next_run_timestamp()
+                    else:
+                        # الطابور ممتلئ - إعادة المحاولة بعد قليل
+                        job.next_run_timestamp = time.time() + QUEUE_FULL_RETRY_SECONDS
+                    heapq.heappush(self._heap, (job.next_run_monotonic, next(self._seq), job))
+
+                # النوم حتى موعد أقرب وظيفة (أو إعادة البناء الدورية) ما لم يتم الإيقاظ
+                wait = next_rescan - now
+                if self._heap:
+                    wait = min(wait, self._heap[0][0] - now)
+                with self._cv:
+                    if not self._dirty and not self.stop_event.is_set() and wait > 0:
+                        self._cv.wait(wait)
+        finally:
+            pool.shutdown()
+
+
+class SchedulerThread(_HeapSchedulerMixin, threading.Thread):
+
     def __init__(self, jobs_map, token_getter, ui_signals: UiSignals, stop_event, max_workers=3,
                  auto_move_getter=None, validate_videos_getter=None, internet_check_getter=None):
         super().__init__(daemon=True)
@@ -1940,6 +2363,7 @@ class SchedulerThread(threading.Thread):
         self.validate_videos_getter = validate_videos_getter or (lambda: False)
         # دالة للحصول على حالة فحص الإنترنت
         self.internet_check_getter = internet_check_getter or (lambda: True)
+        self._init_heap(jobs_map)
 
     def log(self, text):
         self.ui.log_signal.emit(text)
@@ -1971,23 +2395,12 @@ class SchedulerThread(threading.Thread):
 
     def run(self):
         self.log('تم تشغيل المجدول')
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            while not self.stop_event.is_set():
-                now = time.time()
-
-                for job in list(self.jobs_map.values()):
-                    if self.stop_event.is_set():
-                        break
-                    # تخطّي الوظائف غير المجدولة أو المعطّلة
-                    if not job.enabled or not job.is_scheduled:
-                        continue
-
-                    # التحقق من وصول الوقت باستخدام job.next_run_timestamp
-                    if now >= job.next_run_timestamp:
-                        executor.submit(self._upload_wrapper, job)
-                        # ضبط الوقت التالي بعد الرفع
-                        job.reset_next_run_timestamp()
-                time.sleep(1)
+        try:
+            self._run_heap_loop('video-upload')
+        finally:
+            # خيوط الرفع انتهت - إغلاق اتصالات الرفع المفتوحة، تُعاد عند أول رفع بعد التشغيل
+            for job in list(self.jobs_map.values()):
+                job.close_session()
         self.log('توقف المجدول.')
 
     def _upload_wrapper(self, job: PageJob):
@@ -2013,15 +2426,38 @@ class SchedulerThread(threading.Thread):
             except Exception:
                 pass  # تجاهل أي خطأ في تحرير القفل
 
+    def _get_sorted_files(self, job: PageJob) -> list:
+        """
+        قائمة فيديوهات المجلد مرتبة حسب job.sort_by مع تخزين مؤقت.
+
+        يُعاد المسح فقط عند تغيّر وقت تعديل المجلد (stat واحد بدلاً من مسح كامل وترتيب).
+        """
+        mtime = os.stat(job.folder).st_mtime_ns
+        with job._file_cache_lock:
+            cache = job._file_cache
+        if cache is not None and cache[0] == mtime and cache[1] == job.sort_by:
+            files = cache[2]
+            # الترتيب العشوائي يُعاد خلطه في كل تشغيل كما كان سابقاً (بدون إعادة المسح)
+            return sort_video_files(files, 'random') if job.sort_by == 'random' else files
+
+        with os.scandir(job.folder) as it:
+            raw_files = [Path(e.path) for e in it
+                         if e.is_file() and e.name.lower().endswith(VIDEO_EXTENSIONS)]
+        files = sort_video_files(raw_files, job.sort_by)
+        with job._file_cache_lock:
+            job._file_cache = (mtime, job.sort_by, files)
+        return files
+
     def _process_job(self, job: PageJob):
         # فحص الاتصال بالإنترنت قبل الرفع (Internet Safety Check)
         if self.internet_check_getter():
-            if not check_internet_connection():
+            if not cached_check_internet_connection():
                 NotificationSystem.notify(self.log, NotificationSystem.NETWORK,
                     'فشل الاتصال بالإنترنت - الدخول في وضع الغفوة', job.page_name)
                 # الانتظار حتى يعود الاتصال
                 attempts = 0
-                while not check_internet_connection() and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
+                online = fresh_check_internet_connection()
+                while not online and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
                     if self.stop_event.is_set():
                         self.log('تم إيقاف المجدول أثناء انتظار الاتصال')
                         return
@@ -2031,8 +2467,9 @@ class SchedulerThread(threading.Thread):
                     attempts += 1
                     self.log(f'📶 المحاولة {attempts}/{INTERNET_CHECK_MAX_ATTEMPTS} - الانتظار {INTERNET_CHECK_INTERVAL} ثانية...')
                     time.sleep(INTERNET_CHECK_INTERVAL)
+                    online = fresh_check_internet_connection()
 
-                if check_internet_connection():
+                if online:
                     NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
                         'عاد الاتصال بالإنترنت - استئناف الرفع', job.page_name)
                 else:
@@ -2047,11 +2484,7 @@ class SchedulerThread(threading.Thread):
             return
 
         # الحصول على الملفات وترتيبها حسب الخيار المحدد
-        raw_files = [p for p in folder.iterdir()
-                     if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS]
-
-        # تطبيق ترتيب الملفات
-        files = sort_video_files(raw_files, job.sort_by)
+        files = self._get_sorted_files(job)
 
         if not files:
             NotificationSystem.notify(self.log, NotificationSystem.WARNING,
@@ -2085,45 +2518,46 @@ class SchedulerThread(threading.Thread):
         status, body = upload_video_once(job, video_path, token, self.ui,
                                          job.title_template, job.description_template, self.log)
 
-        # التحقق من نجاح الرفع ونقل الفيديو إلى مجلد Uploaded
-        upload_success = is_upload_successful(status, body)
-
-        # التحقق من Rate Limit
+        # التحقق من Rate Limit أولاً - التأجيل بدون تسجيل أو تنسيق رسائل
         if is_rate_limit_error(body):
             self._handle_rate_limit(job)
             return  # الخروج فوراً بدون متابعة
 
+        # التحقق من نجاح الرفع ونقل الفيديو إلى مجلد Uploaded
+        upload_success = is_upload_successful(status, body)
+
+        # قراءة حقول الاستجابة مرة واحدة لكل الفحوصات التالية
+        video_id, err, error_msg = _parse_fb_response(body)
+        code = err.get('code') if isinstance(err, dict) else None
+
         # تسجيل الرفع في قاعدة البيانات
-        video_id = body.get('id') if isinstance(body, dict) else None
         video_url = f'https://www.facebook.com/{video_id}' if video_id else None
         log_upload(
             job.page_id, job.page_name, video_path, os.path.basename(video_path),
             'video', video_id=video_id, video_url=video_url,
             status='success' if upload_success else 'failed',
-            error_message=str(body.get('error', '')) if isinstance(body, dict) and not upload_success else None
+            error_message=error_msg if not upload_success else None
         )
 
         if upload_success:
             NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
                 f'تم رفع الفيديو بنجاح: {os.path.basename(video_path)}', job.page_name)
             if self.auto_move_getter():
-                move_video_to_uploaded_folder(video_path, self.log)
+                if move_video_to_uploaded_folder(video_path, self.log):
+                    with job._file_cache_lock:
+                        job._file_cache = None
         else:
-            error_msg = str(body.get('error', {}).get('message', '')) if isinstance(body, dict) else str(body)
             NotificationSystem.notify(self.log, NotificationSystem.ERROR,
-                f'فشل رفع الفيديو: {error_msg[:100]}', job.page_name)
+                lambda: f'فشل رفع الفيديو: {error_msg[:100]}', job.page_name)
 
         if status in (400, 403):
-            if isinstance(body, dict):
-                err = body.get('error', {})
-                msg = err.get('message', '')
-                code = err.get('code', '')
-                if msg and ('permission' in msg.lower() or code == 100):
+            if err is not None:
+                if error_msg and ('permission' in error_msg.lower() or code == 100):
                     NotificationSystem.notify(self.log, NotificationSystem.ERROR,
                         'صلاحيات غير كافية للنشر', job.page_name)
 
 
-class StorySchedulerThread(threading.Thread):
+class StorySchedulerThread(_HeapSchedulerMixin, threading.Thread):
     """
     خيط مجدول لنشر الستوري.
     يعالج وظائف الستوري ويرفعها إلى فيسبوك.
@@ -2141,6 +2575,9 @@ class StorySchedulerThread(threading.Thread):
         self.auto_move_getter = auto_move_getter or (lambda: False)
         # دالة للحصول على حالة فحص الإنترنت
         self.internet_check_getter = internet_check_getter or (lambda: True)
+        self._init_heap(story_jobs_map)
+        # جلسة HTTP واحدة لكل الدفعات والمحاولات - تُغلق عند توقف المجدول فقط
+        self.session = _make_upload_session(max(4, max_workers))
 
     def log(self, text):
         self.ui.log_signal.emit(text)
@@ -2172,23 +2609,10 @@ class StorySchedulerThread(threading.Thread):
 
     def run(self):
         self.log('تم تشغيل مجدول الستوري')
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            while not self.stop_event.is_set():
-                now = time.time()
-
-                for job in list(self.story_jobs_map.values()):
-                    if self.stop_event.is_set():
-                        break
-                    # تخطّي الوظائف غير المجدولة أو المعطّلة
-                    if not job.enabled or not job.is_scheduled:
-                        continue
-
-                    # التحقق من وصول الوقت باستخدام job.next_run_timestamp
-                    if now >= job.next_run_timestamp:
-                        executor.submit(self._upload_wrapper, job)
-                        # ضبط الوقت التالي بعد الرفع
-                        job.reset_next_run_timestamp()
-                time.sleep(1)
+        try:
+            self._run_heap_loop('story-upload')
+        finally:
+            self.session.close()
         self.log('توقف مجدول الستوري.')
 
     def _upload_wrapper(self, job: StoryJob):
@@ -2211,12 +2635,13 @@ class StorySchedulerThread(threading.Thread):
         try:
             # فحص الاتصال بالإنترنت قبل الرفع
             if self.internet_check_getter():
-                if not check_internet_connection():
+                if not cached_check_internet_connection():
                     NotificationSystem.notify(self.log, NotificationSystem.NETWORK,
                         'فشل الاتصال بالإنترنت - الدخول في وضع الغفوة', job.page_name)
                     # الانتظار حتى يعود الاتصال
                     attempts = 0
-                    while not check_internet_connection() and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
+                    online = fresh_check_internet_connection()
+                    while not online and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
                         if self.stop_event.is_set():
                             self.log('تم إيقاف مجدول الستوري أثناء انتظار الاتصال')
                             return
@@ -2226,8 +2651,9 @@ class StorySchedulerThread(threading.Thread):
                         attempts += 1
                         self.log(f'📶 المحاولة {attempts}/{INTERNET_CHECK_MAX_ATTEMPTS} - الانتظار {INTERNET_CHECK_INTERVAL} ثانية...')
                         time.sleep(INTERNET_CHECK_INTERVAL)
+                        online = fresh_check_internet_connection()
 
-                    if check_internet_connection():
+                    if online:
                         NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
                             'عاد الاتصال بالإنترنت - استئناف الرفع', job.page_name)
                     else:
@@ -2293,11 +2719,11 @@ class StorySchedulerThread(threading.Thread):
 
             successful_count = 0
             failed_count = 0
+            pending_logs = []  # سجلات الرفع - تُكتب في قاعدة البيانات بمعاملة واحدة بعد الدفعة
 
-            # استخدام Session لتحسين الأداء مع معالجة استثناءات
-            session = None
+            # جلسة المجدول المشتركة (اتصالات محفوظة بين الدفعات)
+            session = self.session
             try:
-                session = requests.Session()
                 for file_path in batch:
                     try:
                         if self.stop_event.is_set():
@@ -2318,28 +2744,28 @@ class StorySchedulerThread(threading.Thread):
                         except Exception:
                             pass
 
-                        # تسجيل النتيجة
-                        upload_success = is_story_upload_successful(status, body)
-
-                        # التحقق من Rate Limit
+                        # التحقق من Rate Limit أولاً - التأجيل بدون تسجيل أو تنسيق رسائل
                         if is_rate_limit_error(body):
                             self._handle_rate_limit(job)
                             break  # الخروج من حلقة الستوري
 
+                        # تسجيل النتيجة
+                        upload_success = is_story_upload_successful(status, body)
+                        story_id, err, error_msg = _parse_fb_response(body)
+
                         # تسجيل الرفع في قاعدة البيانات
-                        story_id = body.get('id') if isinstance(body, dict) else None
-                        log_upload(
+                        pending_logs.append((
                             job.page_id, job.page_name, str(file_path), file_path.name,
-                            'story', video_id=story_id, video_url=None,
-                            status='success' if upload_success else 'failed',
-                            error_message=str(body.get('error', '')) if isinstance(body, dict) and not upload_success else None
-                        )
+                            'story', story_id, None,
+                            'success' if upload_success else 'failed',
+                            error_msg if not upload_success else None
+                        ))
 
                         if upload_success:
                             successful_count += 1
                             NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
                                 f'تم رفع الستوري بنجاح: {file_path.name}', job.page_name)
-                            # نقل الملف إذا مفعّل
+                            # نقل الملف فور نجاحه - لا يُعاد نشره إن توقف البرنامج وسط الدفعة
                             if self.auto_move_getter():
                                 try:
                                     move_video_to_uploaded_folder(str(file_path), self.log)
@@ -2347,9 +2773,8 @@ class StorySchedulerThread(threading.Thread):
                                     self.log(f'⚠️ فشل نقل الملف: {move_err}')
                         else:
                             failed_count += 1
-                            error_msg = str(body.get('error', {}).get('message', '')) if isinstance(body, dict) else str(body)
                             NotificationSystem.notify(self.log, NotificationSystem.ERROR,
-                                f'فشل رفع الستوري: {error_msg[:50]}', job.page_name)
+                                lambda: f'فشل رفع الستوري: {error_msg[:50]}', job.page_name)
 
                         # تأخير بين كل ستوري لتجنب rate limiting (حماية من الحظر) - Requirement 4
                         if job.anti_ban_enabled and len(batch) > 1:
@@ -2357,7 +2782,10 @@ class StorySchedulerThread(threading.Thread):
                             delay = random.randint(job.random_delay_min, job.random_delay_max)
                             NotificationSystem.notify(self.log, NotificationSystem.INFO,
                                 f'⏳ استراحة حماية لمدة {delay} ثانية', job.page_name)
-                            time.sleep(delay)
+                            # انتظار قابل للمقاطعة - يعود فوراً عند إيقاف المجدول
+                            if self.stop_event.wait(delay):
+                                self.log('تم إيقاف مجدول الستوري أثناء النشر')
+                                break
 
                     except requests.exceptions.Timeout as e:
                         failed_count += 1
@@ -2375,14 +2803,8 @@ class StorySchedulerThread(threading.Thread):
                         log_error_to_file(e, f'Story upload error: {file_path}')
 
             finally:
-                # إغلاق Session بشكل آمن
-                if session:
-                    try:
-                        session.close()
-                    except Exception:
-                        pass
-                # تنظيف الذاكرة بعد انتهاء الدفعة بالكامل
-                gc.collect()
+                # تسجيل نتائج الدفعة في قاعدة البيانات دفعة واحدة
+                log_upload_many(pending_logs)
 
             # تحديث next_index
             job.next_index = (job.next_index + len(batch)) % len(files)
@@ -2394,7 +2816,7 @@ class StorySchedulerThread(threading.Thread):
             log_error_to_file(e, f'Process story job error: {job.page_name}')
 
 
-class ReelsSchedulerThread(threading.Thread):
+class ReelsSchedulerThread(_HeapSchedulerMixin, threading.Thread):
     """
     خيط مجدول لنشر الريلز.
     يعالج وظائف الريلز ويرفعها إلى فيسبوك.
@@ -2413,6 +2835,9 @@ class ReelsSchedulerThread(threading.Thread):
         self.auto_move_getter = auto_move_getter or (lambda: False)
         # دالة للحصول على حالة فحص الإنترنت
         self.internet_check_getter = internet_check_getter or (lambda: True)
+        self._init_heap(reels_jobs_map)
+        # جلسة HTTP واحدة لكل الدفعات والمحاولات - تُغلق عند توقف المجدول فقط
+        self.session = _make_upload_session(max(4, max_workers))
 
     def log(self, text):
         self.ui.log_signal.emit(text)
@@ -2444,23 +2869,10 @@ class ReelsSchedulerThread(threading.Thread):
 
     def run(self):
         self.log('تم تشغيل مجدول الريلز')
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            while not self.stop_event.is_set():
-                now = time.time()
-
-                for job in list(self.reels_jobs_map.values()):
-                    if self.stop_event.is_set():
-                        break
-                    # تخطّي الوظائف غير المجدولة أو المعطّلة
-                    if not job.enabled or not job.is_scheduled:
-                        continue
-
-                    # التحقق من وصول الوقت باستخدام job.next_run_timestamp
-                    if now >= job.next_run_timestamp:
-                        executor.submit(self._upload_wrapper, job)
-                        # ضبط الوقت التالي بعد الرفع
-                        job.reset_next_run_timestamp()
-                time.sleep(1)
+        try:
+            self._run_heap_loop('reels-upload')
+        finally:
+            self.session.close()
         self.log('توقف مجدول الريلز.')
 
     def _upload_wrapper(self, job: ReelsJob):
@@ -2474,21 +2886,16 @@ class ReelsSchedulerThread(threading.Thread):
 
     def _process_reels_job(self, job: ReelsJob):
         """معالجة وظيفة ريلز واحدة مع حماية شاملة من الأخطاء."""
-        # Import from reels_controller
-        from controllers.reels_controller import (
-            get_reels_files, upload_reels_with_retry, is_reels_upload_successful,
-            log_error_to_file, check_reels_duration
-        )
-
         try:
             # فحص الاتصال بالإنترنت قبل الرفع
             if self.internet_check_getter():
-                if not check_internet_connection():
+                if not cached_check_internet_connection():
                     NotificationSystem.notify(self.log, NotificationSystem.NETWORK,
                         'فشل الاتصال بالإنترنت - الدخول في وضع الغفوة', job.page_name)
                     # الانتظار حتى يعود الاتصال
                     attempts = 0
-                    while not check_internet_connection() and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
+                    online = fresh_check_internet_connection()
+                    while not online and attempts < INTERNET_CHECK_MAX_ATTEMPTS:
                         if self.stop_event.is_set():
                             self.log('تم إيقاف مجدول الريلز أثناء انتظار الاتصال')
                             return
@@ -2498,8 +2905,9 @@ class ReelsSchedulerThread(threading.Thread):
                         attempts += 1
                         self.log(f'📶 المحاولة {attempts}/{INTERNET_CHECK_MAX_ATTEMPTS} - الانتظار {INTERNET_CHECK_INTERVAL} ثانية...')
                         time.sleep(INTERNET_CHECK_INTERVAL)
+                        online = fresh_check_internet_connection()
 
-                    if check_internet_connection():
+                    if online:
                         NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
                             'عاد الاتصال بالإنترنت - استئناف الرفع', job.page_name)
                     else:
@@ -2518,7 +2926,7 @@ class ReelsSchedulerThread(threading.Thread):
                 files = get_reels_files(str(folder), job.sort_by)
             except Exception as e:
                 self.log(f'❌ فشل قراءة ملفات الريلز: {e}')
-                log_error_to_file(e, f'get_reels_files error for {folder}')
+                reels_log_error_to_file(e, f'get_reels_files error for {folder}')
                 return
 
             if not files:
@@ -2528,7 +2936,10 @@ class ReelsSchedulerThread(threading.Thread):
 
             # الحصول على الفيديو التالي
             idx = job.next_index % len(files)
-            video_path = str(files[idx])
+            # بناء المسار والاسم مرة واحدة لكل الرسائل والقوالب أدناه
+            video_p = Path(files[idx])
+            video_path = str(video_p)
+            video_name = video_p.name
 
             # فحص مدة الفيديو قبل البدء بالرفع
             is_valid_duration, duration, error_msg = check_reels_duration(video_path)
@@ -2546,13 +2957,13 @@ class ReelsSchedulerThread(threading.Thread):
                 return
 
             NotificationSystem.notify(self.log, NotificationSystem.UPLOAD,
-                f'بدء رفع ريلز: {Path(video_path).name}', job.page_name)
+                f'بدء رفع ريلز: {video_name}', job.page_name)
             if duration > 0:
                 self.log(f'📊 مدة الفيديو: {duration:.1f} ثانية')
 
             # إعداد العنوان والوصف
-            title = apply_title_placeholders(job.title_template, Path(video_path).name) if job.title_template else ''
-            description = apply_title_placeholders(job.description_template, Path(video_path).name) if job.description_template else ''
+            title = apply_title_placeholders(job.title_template, video_name) if job.title_template else ''
+            description = apply_title_placeholders(job.description_template, video_name) if job.description_template else ''
 
             # رفع الريلز
             status, body = upload_reels_with_retry(
@@ -2562,30 +2973,31 @@ class ReelsSchedulerThread(threading.Thread):
                 description=description,
                 title=title,
                 log_fn=self.log,
-                progress_callback=lambda p: self.ui.progress_signal.emit(int(p), f'رفع الريلز {int(p)}%'),
-                stop_event=self.stop_event
+                progress_callback=lambda p: self.ui.emit_progress(int(p), f'رفع الريلز {int(p)}%'),
+                stop_event=self.stop_event,
+                session=self.session
             )
 
-            # التحقق من النجاح
-            upload_success = is_reels_upload_successful(status, body)
-
-            # التحقق من Rate Limit
+            # التحقق من Rate Limit أولاً - التأجيل بدون تسجيل أو تنسيق رسائل
             if is_rate_limit_error(body):
                 self._handle_rate_limit(job)
                 return
 
+            # التحقق من النجاح
+            upload_success = is_reels_upload_successful(status, body)
+            video_id, err, error_msg = _parse_fb_response(body)
+
             # تسجيل الرفع في قاعدة البيانات
-            video_id = body.get('video_id') or body.get('id') if isinstance(body, dict) else None
             log_upload(
-                job.page_id, job.page_name, video_path, Path(video_path).name,
+                job.page_id, job.page_name, video_path, video_name,
                 'reels', video_id=video_id, video_url=None,
                 status='success' if upload_success else 'failed',
-                error_message=str(body.get('error', '')) if isinstance(body, dict) and not upload_success else None
+                error_message=error_msg if not upload_success else None
             )
 
             if upload_success:
                 NotificationSystem.notify(self.log, NotificationSystem.SUCCESS,
-                    f'✅ تم رفع الريلز بنجاح: {Path(video_path).name}', job.page_name)
+                    f'✅ تم رفع الريلز بنجاح: {video_name}', job.page_name)
                 # تحديث next_index للفيديو التالي
                 job.next_index = (job.next_index + 1) % len(files)
                 # نقل الملف إذا مفعّل
@@ -2595,13 +3007,12 @@ class ReelsSchedulerThread(threading.Thread):
                     except Exception as move_err:
                         self.log(f'⚠️ فشل نقل الملف: {move_err}')
             else:
-                error_msg = str(body.get('error', {}).get('message', '')) if isinstance(body, dict) else str(body)
                 NotificationSystem.notify(self.log, NotificationSystem.ERROR,
-                    f'❌ فشل رفع الريلز: {error_msg[:50]}', job.page_name)
+                    lambda: f'❌ فشل رفع الريلز: {error_msg[:50]}', job.page_name)
 
         except Exception as e:
             self.log(f'❌ خطأ غير متوقع في معالجة وظيفة الريلز: {e}')
-            log_error_to_file(e, f'Process reels job error: {job.page_name}')
+            reels_log_error_to_file(e, f'Process reels job error: {job.page_name}')
 
 
 # ==================== Hashtag Manager Dialog ====================
@@ -2633,6 +3044,20 @@ class HashtagManagerDialog(HashtagManagerDialogBase):
 
 # ==================== Helper Dialog Classes ====================
 
+@lru_cache(maxsize=1440)
+def _to_12h(t: str) -> str:
+    """تحويل 'HH:MM' إلى 'hh:MM AM/PM' بدون strptime (النتائج مخزنة - 1440 قيمة ممكنة فقط)."""
+    try:
+        h, m = t.split(':')
+        hour = int(h)
+        minute = int(m)
+    except ValueError:
+        return t
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return t
+    return f'{hour % 12 or 12:02d}:{minute:02d} {"AM" if hour < 12 else "PM"}'
+
+
 class ScheduleTemplatesDialog(QDialog):
     """نافذة إدارة قوالب الجداول الذكية."""
 
@@ -2770,8 +3195,19 @@ class ScheduleTemplatesDialog(QDialog):
 
     def _refresh_list(self):
         """تحديث قائمة القوالب."""
-        self.templates_list.clear()
+        # إيقاف الرسم والإشارات أثناء إعادة البناء - إعادة رسم واحدة في النهاية
+        lw = self.templates_list
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            self._fill_templates_list(lw)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+        lw.viewport().update()
 
+    def _fill_templates_list(self, lw):
+        lw.clear()
         for template in self._templates:
             name = template['name']
             times = template['times']
@@ -2787,14 +3223,15 @@ class ScheduleTemplatesDialog(QDialog):
 
             item = QListWidgetItem(text)
             item.setData(Qt.UserRole, template)
-            self.templates_list.addItem(item)
+            lw.addItem(item)
 
     def _add_time(self):
         """إضافة وقت جديد."""
         time_str = self.time_edit.time().toString('HH:mm')
-        if time_str not in self._times_list:
-            self._times_list.append(time_str)
-            self._times_list.sort()
+        # القائمة مرتبة دائماً - بحث ثنائي للتكرار والإدراج في مكانه
+        idx = bisect.bisect_left(self._times_list, time_str)
+        if idx == len(self._times_list) or self._times_list[idx] != time_str:
+            self._times_list.insert(idx, time_str)
             self._update_times_display()
 
     def _clear_times(self):
@@ -2806,13 +3243,7 @@ class ScheduleTemplatesDialog(QDialog):
         """تحديث عرض الأوقات."""
         if self._times_list:
             # تحويل الأوقات لنظام 12 ساعة
-            formatted_times = []
-            for t in self._times_list:
-                try:
-                    formatted = datetime.strptime(t, '%H:%M').strftime('%I:%M %p')
-                    formatted_times.append(formatted)
-                except Exception:
-                    formatted_times.append(t)
+            formatted_times = [_to_12h(t) for t in self._times_list]
             self.times_display.setText('⏰ ' + ', '.join(formatted_times))
             self.times_display.setStyleSheet('color: #27ae60; padding: 5px; font-weight: bold;')
         else:
@@ -2839,15 +3270,14 @@ class ScheduleTemplatesDialog(QDialog):
         template = items[0].data(Qt.UserRole)
         self._editing_template_id = template['id']
         self.template_name_input.setText(template['name'])
-        self._times_list = list(template['times'])
+        self._times_list = sorted(template['times'])  # مرتبة ليعمل bisect في _add_time
         self._update_times_display()
 
         # تحديث أيام الأسبوع - التعامل مع كلا الصيغتين (نصية أو رقمية)
-        days = template.get('days', ALL_WEEKDAYS_STR)
+        days_set = frozenset(template.get('days', ALL_WEEKDAYS_STR))
         for i, cb in enumerate(self.day_checkboxes):
-            day_str = ALL_WEEKDAYS_STR[i]  # صيغة نصية مثل "sat", "sun"
-            # التحقق من وجود اليوم سواء بصيغة نصية أو رقمية
-            cb.setChecked(day_str in days or i in days)
+            # التحقق من وجود اليوم سواء بصيغة نصية ("sat", "sun") أو رقمية
+            cb.setChecked(ALL_WEEKDAYS_STR[i] in days_set or i in days_set)
 
         self.random_offset_spin.setValue(template.get('random_offset', 15))
 
@@ -2933,6 +3363,153 @@ class ScheduleTemplatesDialog(QDialog):
 
 
 
+class _AppTokenWriterThread(QThread):
+    """
+    كاتب قاعدة بيانات وحيد لحفظ التوكينات خارج thread الواجهة.
+
+    يجمع طلبات الحفظ المتتالية (خلال نافذة قصيرة) ويكتبها بمعاملة واحدة
+    عبر save_app_tokens_bulk، ثم يرسل النتائج إلى الواجهة بإشارة saved.
+    """
+    # قائمة (معرف الطلب، نجاح، معرف السجل)
+    saved = Signal(object)
+
+    BATCH_WINDOW_SECONDS = 0.05
+    MAX_BATCH = 32
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue = queue.Queue()
+
+    def submit(self, request_id: int, row: dict):
+        """إضافة طلب حفظ (row بمفاتيح save_app_token) إلى الطابور."""
+        self._queue.put((request_id, row))
+
+    def stop(self):
+        """إنهاء الكاتب بعد كتابة الطلبات الموجودة في الطابور."""
+        self._queue.put(None)
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    item = self._queue.get(timeout=self.BATCH_WINDOW_SECONDS)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            results = save_app_tokens_bulk([row for _, row in batch])
+            self.saved.emit([(request_id, ok, new_id)
+                             for (request_id, _), (ok, new_id) in zip(batch, results)])
+
+
+# عدّاد مفاتيح AppEntry - لا يتكرر طوال عمر البرنامج
+_app_entry_keys = itertools.count(1)
+
+
+class AppEntry:
+    """مراجع ويدجات تطبيق واحد في نافذة إدارة التوكينات وحالته."""
+    __slots__ = (
+        'widget', 'db_id', 'name_input', 'id_input', 'secret_input',
+        'short_token_input', 'long_token_display', 'expires_label', 'status_label',
+        'fetch_btn', 'save_token_btn', 'delete_btn', 'token_expires_at',
+        'busy', 'title_timer', 'key',
+    )
+
+    def __init__(self, widget, db_id, name_input, id_input, secret_input,
+                 short_token_input, long_token_display, expires_label, status_label,
+                 fetch_btn, save_token_btn, delete_btn, token_expires_at=None):
+        self.widget = widget
+        self.db_id = db_id
+        self.name_input = name_input
+        self.id_input = id_input
+        self.secret_input = secret_input
+        self.short_token_input = short_token_input
+        self.long_token_display = long_token_display
+        self.expires_label = expires_label
+        self.status_label = status_label
+        self.fetch_btn = fetch_btn
+        self.save_token_btn = save_token_btn
+        self.delete_btn = delete_btn
+        self.token_expires_at = token_expires_at
+        # عملية جلب توكن قيد التنفيذ
+        self.busy = False
+        # مؤقت تجميع تحديثات العنوان (ابن widget)
+        self.title_timer = None
+        # مفتاح ثابت في _apps ونتائج الجلب (id() يُعاد استخدامه بعد حذف الكائن)
+        self.key = next(_app_entry_keys)
+
+
+def _set_text_if_changed(widget, text: str):
+    """تعيين النص فقط عند تغيّره (QLineEdit.setText يعيد الضبط ويعيد الرسم حتى للنص نفسه)."""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _app_entry_payload(app_entry: AppEntry) -> Optional[dict]:
+    """
+    قراءة حقول التطبيق مرة واحدة وبناء صف الحفظ (بمفاتيح معاملات save_app_token).
+
+    العائد:
+        القاموس، أو None إذا كان اسم التطبيق أو معرفه فارغاً
+    """
+    app_name = app_entry.name_input.text().strip()
+    app_id_value = app_entry.id_input.text().strip()
+    if not app_name or not app_id_value:
+        return None
+    return {
+        'app_name': app_name,
+        'app_id': app_id_value,
+        'app_secret': app_entry.secret_input.text().strip(),
+        'short_lived_token': app_entry.short_token_input.text().strip(),
+        'long_lived_token': app_entry.long_token_display.text().strip(),
+        'token_expires_at': app_entry.token_expires_at,
+        'token_id': app_entry.db_id
+    }
+
+
+# ألوان حالات التسميات في نافذة التوكينات (تُختار عبر الخاصية state)
+_CSS_OK = 'color: #27ae60;'
+_CSS_WARN = 'color: #f39c12;'
+_CSS_ERR = 'color: #e74c3c;'
+_CSS_INFO = 'color: #7f8c8d;'
+_TOKEN_LABEL_STATES_CSS = (
+    f'QLabel[state="ok"] {{ {_CSS_OK} }}\n'
+    f'QLabel[state="warn"] {{ {_CSS_WARN} }}\n'
+    f'QLabel[state="err"] {{ {_CSS_ERR} }}\n'
+    f'QLabel[state="info"] {{ {_CSS_INFO} }}\n'
+)
+
+# تنسيق ويدجت التطبيق الواحد - مطبّق على مستوى الحوار حتى لا يُحلَّل لكل تطبيق
+_TOKEN_APP_WIDGET_CSS = '''
+    QGroupBox#appEntry {
+        font-weight: bold;
+        border: 1px solid #3498db;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox#appEntry::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit#longTokenDisplay { background: #2d3436; }
+    QPushButton#fetchTokenBtn { background: #9b59b6; color: white; padding: 8px; }
+    QPushButton#saveTokenBtn { background: #3498db; color: white; padding: 8px; }
+    QPushButton#deleteAppBtn { background: #e74c3c; color: white; padding: 8px; }
+'''
+
+# مهلة تجميع تحديثات عنوان مجموعة التطبيق أثناء الكتابة (بالمللي ثانية)
+TITLE_UPDATE_DEBOUNCE_MS = 80
+
+
 class TokenManagementDialog(QDialog):
     """
     نافذة إدارة التوكينات - تمكن من إضافة عدة تطبيقات وتحويل التوكينات القصيرة إلى طويلة.
@@ -2942,7 +3519,18 @@ class TokenManagementDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle('🔑 إدارة التوكينات')
         self.setMinimumSize(700, 500)
-        self._apps = []  # قائمة التطبيقات المحلية
+        # التطبيقات المحلية: app_entry.key -> AppEntry (ترتيب الإدراج = ترتيب العرض، وحذف O(1))
+        self._apps = {}
+        # مجمّع threads مشترك لجلب التوكينات بدلاً من QThread لكل طلب
+        self._token_pool = QThreadPool(self)
+        self._token_pool.setMaxThreadCount(4)
+        self._token_runnables = {}  # app_entry.key -> مهمة الجلب الجارية
+        # حفظ التوكن بعد الجلب يتم في thread كاتب منفصل حتى لا يوقف fsync الواجهة
+        self._save_request_ids = itertools.count(1)
+        self._pending_saves = {}  # معرف الطلب -> AppEntry
+        self._db_writer = _AppTokenWriterThread(self)
+        self._db_writer.saved.connect(self._on_tokens_saved)
+        self._db_writer.start()
         self._build_ui()
         self._load_apps()
 
@@ -2991,6 +3579,12 @@ class TokenManagementDialog(QDialog):
         save_btn.clicked.connect(self._save_all)
         btns_row.addWidget(save_btn)
 
+        fetch_all_btn = QPushButton('🔄 جلب الكل')
+        fetch_all_btn.setStyleSheet('background: #8e44ad; color: white; padding: 8px 16px;')
+        fetch_all_btn.setToolTip('جلب التوكن الطويل لكل التطبيقات المكتملة بالتوازي')
+        fetch_all_btn.clicked.connect(self._fetch_all_tokens)
+        btns_row.addWidget(fetch_all_btn)
+
         btns_row.addStretch()
 
         close_btn = QPushButton('إغلاق')
@@ -2999,16 +3593,67 @@ class TokenManagementDialog(QDialog):
 
         layout.addLayout(btns_row)
 
+        # تنسيق ويدجات التطبيقات وألوان حالات التسميات يُطبَّق مرة واحدة هنا
+        # بدلاً من setStyleSheet لكل ويدجت أو لكل تحديث
+        self.setStyleSheet(_TOKEN_APP_WIDGET_CSS + _TOKEN_LABEL_STATES_CSS)
+
+    _set_text = staticmethod(_set_text_if_changed)
+
+    @classmethod
+    def _set_label(cls, label: QLabel, text: str, state: str):
+        """تعيين نص التسمية وحالة لونها مع تخطي ما لم يتغير."""
+        cls._set_text(label, text)
+        cls._set_label_state(label, state)
+
+    @staticmethod
+    def _set_label_state(label: QLabel, state: str):
+        """تعيين حالة لون التسمية (ok/warn/err/info) مع إعادة التنسيق فقط عند التغيير."""
+        if label.property('state') == state:
+            return
+        label.setProperty('state', state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
     def _load_apps(self):
-        """تحميل التطبيقات المحفوظة من قاعدة البيانات."""
+        """
+        تحميل التطبيقات المحفوظة من قاعدة البيانات.
+
+        عند إعادة فتح النافذة تُعاد استخدام الويدجات الموجودة (حسب db_id):
+        يُنشأ ويدجت فقط للتطبيقات الجديدة ويُحذف ويدجت التطبيقات المحذوفة
+        أو غير المحفوظة، وتُحدَّث حقول الباقي في مكانها.
+        """
         apps = get_all_app_tokens()
+        existing = {e.db_id: e for e in self._apps.values() if e.db_id is not None}
+        current_ids = {app['id'] for app in apps}
 
-        if not apps:
-            # إضافة تطبيق افتراضي فارغ
-            self._add_new_app()
-        else:
-            for app in apps:
-                self._add_app_widget(app)
+        # تجميع إنشاء الويدجات في تحديث واحد للحاوية
+        self.apps_container.setUpdatesEnabled(False)
+        try:
+            for entry in self._apps.values():
+                if entry.db_id not in current_ids:
+                    self._cancel_token_fetch(entry)
+                    self.apps_layout.removeWidget(entry.widget)
+                    entry.widget.deleteLater()
+            self._apps = {}
+
+            for index, app in enumerate(apps):
+                entry = existing.get(app['id'])
+                if entry is None:
+                    self._add_app_widget(app, index)
+                    continue
+                self._update_app_widget(entry, app)
+                widget = entry.widget
+                if self.apps_layout.indexOf(widget) != index:
+                    self.apps_layout.removeWidget(widget)
+                    self.apps_layout.insertWidget(index, widget)
+                self._apps[entry.key] = entry
+
+            if not apps:
+                # إضافة تطبيق افتراضي فارغ
+                self._add_new_app()
+        finally:
+            self.apps_container.setUpdatesEnabled(True)
 
     def _add_new_app(self):
         """إضافة تطبيق جديد فارغ."""
@@ -3024,25 +3669,19 @@ class TokenManagementDialog(QDialog):
         }
         self._add_app_widget(app_data)
 
-    def _add_app_widget(self, app_data: dict):
-        """إضافة ويدجت تطبيق جديد."""
+    def _add_app_widget(self, app_data: dict, index: int = -1):
+        """إضافة ويدجت تطبيق جديد (في الموضع index أو في النهاية)."""
         app_widget = QGroupBox(f"📱 {app_data.get('app_name', 'تطبيق جديد')}")
-        app_widget.setStyleSheet('''
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3498db;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        ''')
+        # التنسيق من ستايل الحوار (_TOKEN_APP_WIDGET_CSS) عبر objectName
+        app_widget.setObjectName('appEntry')
+        # تجميع بناء الصفوف في تحديث واحد للويدجت
+        app_widget.setUpdatesEnabled(False)
 
+        # سياسات ثابتة بدلاً من قراءتها من نمط المنصة، والتخطيط لا يُربط
+        # بالويدجت إلا بعد إضافة كل الصفوف (حل هندسي واحد بدل حل لكل addRow)
         app_layout = QFormLayout()
+        app_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        app_layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
 
         # اسم التطبيق
         name_input = QLineEdit()
@@ -3075,34 +3714,32 @@ class TokenManagementDialog(QDialog):
         long_token_display.setText(app_data.get('long_lived_token', ''))
         long_token_display.setPlaceholderText('سيظهر هنا بعد جلب التوكن الطويل')
         long_token_display.setReadOnly(True)
-        long_token_display.setStyleSheet('background: #2d3436;')
+        long_token_display.setObjectName('longTokenDisplay')
         app_layout.addRow('🔑 التوكن الطويل:', long_token_display)
 
         # تاريخ انتهاء التوكن
         expires_label = QLabel()
         if app_data.get('token_expires_at'):
-            expires_label.setText(f"📅 ينتهي في: {app_data['token_expires_at']}")
-            expires_label.setStyleSheet('color: #27ae60;')
+            self._set_label(expires_label, f"📅 ينتهي في: {app_data['token_expires_at']}", 'ok')
         else:
-            expires_label.setText('📅 لم يتم جلب التوكن الطويل بعد')
-            expires_label.setStyleSheet('color: #7f8c8d;')
+            self._set_label(expires_label, '📅 لم يتم جلب التوكن الطويل بعد', 'info')
         app_layout.addRow('', expires_label)
 
         # أزرار الإجراءات
         btns_row = QHBoxLayout()
 
         fetch_btn = QPushButton('🔄 جلب التوكن الطويل')
-        fetch_btn.setStyleSheet('background: #9b59b6; color: white; padding: 8px;')
+        fetch_btn.setObjectName('fetchTokenBtn')
         btns_row.addWidget(fetch_btn)
 
         # زر حفظ التوكن
         save_token_btn = QPushButton('💾 حفظ التوكن')
-        save_token_btn.setStyleSheet('background: #3498db; color: white; padding: 8px;')
+        save_token_btn.setObjectName('saveTokenBtn')
         save_token_btn.setToolTip('حفظ هذا التطبيق والتوكن في قاعدة البيانات')
         btns_row.addWidget(save_token_btn)
 
         delete_btn = QPushButton('🗑️ حذف')
-        delete_btn.setStyleSheet('background: #e74c3c; color: white; padding: 8px;')
+        delete_btn.setObjectName('deleteAppBtn')
         btns_row.addWidget(delete_btn)
 
         btns_row.addStretch()
@@ -3114,180 +3751,227 @@ class TokenManagementDialog(QDialog):
         app_layout.addRow('', status_label)
 
         app_widget.setLayout(app_layout)
-        self.apps_layout.addWidget(app_widget)
+        app_widget.setUpdatesEnabled(True)
+        self.apps_layout.insertWidget(index, app_widget)
 
         # تخزين المراجع
-        app_entry = {
-            'widget': app_widget,
-            'db_id': app_data.get('id'),
-            'name_input': name_input,
-            'id_input': id_input,
-            'secret_input': secret_input,
-            'short_token_input': short_token_input,
-            'long_token_display': long_token_display,
-            'expires_label': expires_label,
-            'status_label': status_label,
-            'fetch_btn': fetch_btn,
-            'save_token_btn': save_token_btn,
-            'delete_btn': delete_btn,
-            'token_expires_at': app_data.get('token_expires_at')
-        }
-        self._apps.append(app_entry)
+        app_entry = AppEntry(
+            widget=app_widget,
+            db_id=app_data.get('id'),
+            name_input=name_input,
+            id_input=id_input,
+            secret_input=secret_input,
+            short_token_input=short_token_input,
+            long_token_display=long_token_display,
+            expires_label=expires_label,
+            status_label=status_label,
+            fetch_btn=fetch_btn,
+            save_token_btn=save_token_btn,
+            delete_btn=delete_btn,
+            token_expires_at=app_data.get('token_expires_at')
+        )
+        self._apps[app_entry.key] = app_entry
+
+        # تحديث عنوان المجموعة بعد توقف الكتابة بدلاً من إعادة الرسم مع كل حرف
+        # (المؤقت ابن app_widget فيُحذف معه)
+        title_timer = QTimer(app_widget)
+        title_timer.setSingleShot(True)
+        title_timer.setInterval(TITLE_UPDATE_DEBOUNCE_MS)
+        title_timer.timeout.connect(lambda: app_widget.setTitle(f"📱 {name_input.text()}"))
+        app_entry.title_timer = title_timer
 
         # ربط الأحداث باستخدام partial لضمان الربط الصحيح
         fetch_btn.clicked.connect(partial(self._fetch_long_token, app_entry))
         save_token_btn.clicked.connect(partial(self._save_single_app, app_entry))
         delete_btn.clicked.connect(partial(self._delete_app, app_entry))
-        name_input.textChanged.connect(lambda text: app_widget.setTitle(f"📱 {text}"))
+        name_input.textChanged.connect(lambda _text: title_timer.start())
+
+    def _update_app_widget(self, app_entry: AppEntry, app_data: dict):
+        """تحديث حقول ويدجت تطبيق موجود بالقيم المحفوظة."""
+        # تعيين الاسم بدون textChanged (لا حاجة لمؤقت العنوان) ثم تحديث العنوان مباشرة
+        app_name = app_data.get('app_name', '')
+        name_input = app_entry.name_input
+        if name_input.text() != app_name:
+            name_input.blockSignals(True)
+            try:
+                name_input.setText(app_name)
+            finally:
+                name_input.blockSignals(False)
+            app_entry.widget.setTitle(f"📱 {app_name}")
+        self._set_text(app_entry.id_input, app_data.get('app_id', ''))
+        self._set_text(app_entry.secret_input, app_data.get('app_secret', ''))
+        self._set_text(app_entry.short_token_input, app_data.get('short_lived_token', ''))
+        self._set_text(app_entry.long_token_display, app_data.get('long_lived_token', ''))
+        expires_at = app_data.get('token_expires_at')
+        expires_label = app_entry.expires_label
+        app_entry.token_expires_at = expires_at
+        if expires_at:
+            self._set_label(expires_label, f"📅 ينتهي في: {expires_at}", 'ok')
+        else:
+            self._set_label(expires_label, '📅 لم يتم جلب التوكن الطويل بعد', 'info')
+        self._set_text(app_entry.status_label, '')
 
-    def _fetch_long_token(self, app_entry: dict):
-        """جلب التوكن الطويل لتطبيق معين باستخدام QThread."""
-        app_id = app_entry['id_input'].text().strip()
-        app_secret = app_entry['secret_input'].text().strip()
-        short_token = app_entry['short_token_input'].text().strip()
+    def _fetch_long_token(self, app_entry: AppEntry):
+        """جلب التوكن الطويل لتطبيق معين على مجمّع threads الحوار."""
+        status_label = app_entry.status_label
 
-        if not app_id or not app_secret or not short_token:
-            app_entry['status_label'].setText('❌ يرجى ملء جميع الحقول')
-            app_entry['status_label'].setStyleSheet('color: #e74c3c;')
+        # التحقق من عدم وجود عملية جلب قيد التنفيذ لهذا التطبيق
+        if app_entry.busy:
+            self._set_label(status_label, '⚠️ عملية جلب التوكن قيد التنفيذ بالفعل', 'warn')
             return
 
-        app_entry['status_label'].setText('⏳ جاري جلب التوكن الطويل...')
-        app_entry['status_label'].setStyleSheet('color: #f39c12;')
-        app_entry['fetch_btn'].setEnabled(False)
+        app_id = app_entry.id_input.text().strip()
+        app_secret = app_entry.secret_input.text().strip()
+        short_token = app_entry.short_token_input.text().strip()
 
-        # التحقق من عدم وجود Thread يعمل بالفعل
-        existing_thread = app_entry.get('_active_thread')
-        if existing_thread and existing_thread.isRunning():
-            app_entry['status_label'].setText('⚠️ عملية جلب التوكن قيد التنفيذ بالفعل')
-            app_entry['status_label'].setStyleSheet('color: #f39c12;')
-            app_entry['fetch_btn'].setEnabled(True)
+        if not app_id or not app_secret or not short_token:
+            self._set_label(status_label, '❌ يرجى ملء جميع الحقول', 'err')
             return
 
-        # إنشاء Thread منفصل لجلب التوكن
-        thread = TokenExchangeThread(app_id, app_secret, short_token)
+        self._set_label(status_label, '⏳ جاري جلب التوكن الطويل...', 'warn')
+        app_entry.fetch_btn.setEnabled(False)
+
+        entry_key = app_entry.key
+        runnable = TokenExchangeRunnable(app_id, app_secret, short_token, key=entry_key)
+        signals = runnable.signals
+        # slots دوال على الحوار (بدون closures) وتُستدعى دائماً في thread الواجهة
+        signals.token_received.connect(self._on_token_received, Qt.QueuedConnection)
+        signals.error.connect(self._on_token_error, Qt.QueuedConnection)
+        signals.finished.connect(self._on_token_fetch_finished, Qt.QueuedConnection)
+
+        # الاحتفاظ بمرجع للمهمة (وإشاراتها) حتى تنتهي
+        app_entry.busy = True
+        self._token_runnables[entry_key] = runnable
+        self._token_pool.start(runnable)
+
+    def _fetch_all_tokens(self):
+        """جلب التوكن الطويل لكل التطبيقات المكتملة بالتوازي على مجمّع threads الحوار."""
+        started = 0
+        for app_entry in list(self._apps.values()):
+            if app_entry.busy:
+                continue
+            if not (app_entry.id_input.text().strip()
+                    and app_entry.secret_input.text().strip()
+                    and app_entry.short_token_input.text().strip()):
+                continue
+            self._fetch_long_token(app_entry)
+            started += 1
+
+        if started == 0:
+            QMessageBox.warning(self, 'تحذير', 'لا توجد تطبيقات مكتملة لجلب توكناتها')
+
+    @Slot(object, object)
+    def _on_token_received(self, entry_key: int, data: dict):
+        """نجاح جلب التوكن الطويل لتطبيق (entry_key = app_entry.key)."""
+        app_entry = self._apps.get(entry_key)
+        if app_entry is None:
+            return  # حُذف التطبيق أثناء الجلب
+        long_token = data.get('access_token', '')
+        expires_in = data.get('expires_in', DEFAULT_TOKEN_EXPIRY_SECONDS)
+        expires_at = datetime.now() + timedelta(seconds=expires_in)
+        # تنسيق مباشر للمكونات بدلاً من strftime (نفس الناتج '%Y-%m-%d %H:%M:%S')
+        expires_at_str = (f'{expires_at.year:04d}-{expires_at.month:02d}-{expires_at.day:02d} '
+                          f'{expires_at.hour:02d}:{expires_at.minute:02d}:{expires_at.second:02d}')
+        self._update_fetch_result(app_entry, True, long_token, expires_at_str)
+
+    @Slot(object, str)
+    def _on_token_error(self, entry_key: int, error_msg: str):
+        """فشل جلب التوكن الطويل لتطبيق."""
+        app_entry = self._apps.get(entry_key)
+        if app_entry is not None:
+            self._update_fetch_result(app_entry, False, f'❌ {error_msg}', None)
 
-        # ربط إشارة النجاح
-        def on_exchange_success(data):
-            long_token = data.get('access_token', '')
-            expires_in = data.get('expires_in', DEFAULT_TOKEN_EXPIRY_SECONDS)
-            expires_at = datetime.now() + timedelta(seconds=expires_in)
-            expires_at_str = expires_at.strftime('%Y-%m-%d %H:%M:%S')
-            self._update_fetch_result(app_entry, True, long_token, expires_at_str)
+    @Slot(object)
+    def _on_token_fetch_finished(self, entry_key: int):
+        """تحرير التطبيق ومرجع المهمة عند انتهائها."""
+        self._token_runnables.pop(entry_key, None)
+        app_entry = self._apps.get(entry_key)
+        if app_entry is not None:
+            app_entry.busy = False
 
-        # ربط إشارة الخطأ
-        def on_exchange_error(error_msg):
-            self._update_fetch_result(app_entry, False, f'❌ {error_msg}', None)
+    def _cancel_token_fetch(self, app_entry: AppEntry):
+        """
+        إلغاء جلب التوكن لتطبيق يُزال: يُسحب من المجمّع إن لم يبدأ بعد،
+        وإلا تُتجاهل نتيجته لأن مفتاحه لم يعد في _apps (المرجع يبقى حتى finished).
+        """
+        runnable = self._token_runnables.get(app_entry.key)
+        if runnable is not None and self._token_pool.tryTake(runnable):
+            del self._token_runnables[app_entry.key]
+
+    def stop_background_work(self, msecs: int) -> bool:
+        """انتظار انتهاء عمليات الجلب ثم إيقاف كاتب قاعدة البيانات (عند إغلاق التطبيق)."""
+        fetches_done = self._token_pool.waitForDone(msecs)
+        self._db_writer.stop()
+        return self._db_writer.wait(msecs) and fetches_done
 
-        # دالة تنظيف تُستدعى عند انتهاء الـ Thread فعلياً
-        def on_thread_finished():
-            # تنظيف مرجع الـ Thread بعد انتهائه
-            active_thread = app_entry.pop('_active_thread', None)
-            if active_thread:
-                active_thread.wait()  # التأكد من الانتهاء الكامل
-            # إزالة الـ Thread من قائمة الـ threads النشطة
-            self._cleanup_finished_token_threads()
-
-        thread.token_received.connect(on_exchange_success)
-        thread.error.connect(on_exchange_error)
-        # ربط إشارة QThread.finished الحقيقية لتنظيف المرجع بأمان
-        thread.finished.connect(on_thread_finished)
-
-        # حفظ مرجع للـ Thread لمنع garbage collection
-        app_entry['_active_thread'] = thread
-
-        # إضافة الـ Thread لقائمة الـ threads النشطة للتنظيف عند الإغلاق
-        if not hasattr(self, '_active_token_threads'):
-            self._active_token_threads = []
-        self._active_token_threads.append(thread)
-
-        # بدء الـ Thread
-        thread.start()
-
-    def _cleanup_finished_token_threads(self):
-        """إزالة الـ threads المنتهية من قائمة الـ threads النشطة."""
-        if hasattr(self, '_active_token_threads'):
-            self._active_token_threads = [t for t in self._active_token_threads if t.isRunning()]
-
-    def _update_fetch_result(self, app_entry: dict, success: bool,
+    def _update_fetch_result(self, app_entry: AppEntry, success: bool,
                               result: str, expires_at: str):
         """تحديث نتيجة جلب التوكن وحفظه تلقائياً."""
-        app_entry['fetch_btn'].setEnabled(True)
+        status_label = app_entry.status_label
+        app_entry.fetch_btn.setEnabled(True)
 
         if success:
             # تحديث الواجهة بالتوكن الطويل
-            app_entry['long_token_display'].setText(result)
-            app_entry['expires_label'].setText(f"📅 ينتهي في: {expires_at}")
-            app_entry['expires_label'].setStyleSheet('color: #27ae60;')
-            app_entry['token_expires_at'] = expires_at
-
-            # حفظ التوكن الطويل تلقائياً في قاعدة البيانات
-            app_name = app_entry['name_input'].text().strip()
-            app_id_value = app_entry['id_input'].text().strip()
-
-            if app_name and app_id_value:
-                save_success, new_id = save_app_token(
-                    app_name=app_name,
-                    app_id=app_id_value,
-                    app_secret=app_entry['secret_input'].text().strip(),
-                    short_lived_token=app_entry['short_token_input'].text().strip(),
-                    long_lived_token=result,
-                    token_expires_at=expires_at,
-                    token_id=app_entry.get('db_id')
-                )
-
-                if save_success:
-                    # تحديث معرف قاعدة البيانات إذا كان هذا إدراج جديد
-                    if new_id is not None and not app_entry.get('db_id'):
-                        app_entry['db_id'] = new_id
-
-                    app_entry['status_label'].setText('✅ تم جلب وحفظ التوكن الطويل بنجاح!')
-                    app_entry['status_label'].setStyleSheet('color: #27ae60;')
-                else:
-                    app_entry['status_label'].setText('✅ تم جلب التوكن - ⚠️ فشل الحفظ التلقائي')
-                    app_entry['status_label'].setStyleSheet('color: #f39c12;')
+            self._set_text(app_entry.long_token_display, result)
+            expires_label = app_entry.expires_label
+            self._set_label(expires_label, f"📅 ينتهي في: {expires_at}", 'ok')
+            app_entry.token_expires_at = expires_at
+
+            # حفظ التوكن الطويل تلقائياً في قاعدة البيانات (في thread الكاتب)
+            payload = _app_entry_payload(app_entry)
+
+            if payload is not None:
+                request_id = next(self._save_request_ids)
+                self._pending_saves[request_id] = app_entry
+                self._db_writer.submit(request_id, payload)
+                self._set_label(status_label, '✅ تم جلب التوكن - ⏳ جاري الحفظ...', 'warn')
             else:
-                app_entry['status_label'].setText('✅ تم جلب التوكن - ⚠️ أكمل بيانات التطبيق للحفظ')
-                app_entry['status_label'].setStyleSheet('color: #f39c12;')
+                self._set_label(status_label, '✅ تم جلب التوكن - ⚠️ أكمل بيانات التطبيق للحفظ', 'warn')
         else:
             # اختصار رسائل الخطأ الطويلة (لتجنب عرض بيانات حساسة)
             error_msg = result
             if len(error_msg) > 150:
                 error_msg = error_msg[:147] + '...'
-            app_entry['status_label'].setText(error_msg)
-            app_entry['status_label'].setStyleSheet('color: #e74c3c;')
+            self._set_label(status_label, error_msg, 'err')
+
+    def _on_tokens_saved(self, results: list):
+        """تحديث الواجهة بنتائج الحفظ التلقائي القادمة من thread الكاتب."""
+        for request_id, save_success, new_id in results:
+            app_entry = self._pending_saves.pop(request_id, None)
+            # تجاهل نتائج تطبيق حُذف (أو أزاله _load_apps) أثناء الحفظ - ويدجاته محذوفة
+            if app_entry is None or self._apps.get(app_entry.key) is not app_entry:
+                continue
+            status_label = app_entry.status_label
+            if save_success:
+                # تحديث معرف قاعدة البيانات إذا كان هذا إدراج جديد
+                if new_id is not None and not app_entry.db_id:
+                    app_entry.db_id = new_id
 
-    def _save_single_app(self, app_entry: dict):
+                self._set_label(status_label, '✅ تم جلب وحفظ التوكن الطويل بنجاح!', 'ok')
+            else:
+                self._set_label(status_label, '✅ تم جلب التوكن - ⚠️ فشل الحفظ التلقائي', 'warn')
+
+    def _save_single_app(self, app_entry: AppEntry):
         """حفظ تطبيق واحد."""
-        app_name = app_entry['name_input'].text().strip()
-        app_id_value = app_entry['id_input'].text().strip()
+        status_label = app_entry.status_label
+        payload = _app_entry_payload(app_entry)
 
-        if not app_name or not app_id_value:
-            app_entry['status_label'].setText('❌ يرجى ملء اسم التطبيق ومعرف التطبيق')
-            app_entry['status_label'].setStyleSheet('color: #e74c3c;')
+        if payload is None:
+            self._set_label(status_label, '❌ يرجى ملء اسم التطبيق ومعرف التطبيق', 'err')
             return
 
-        save_success, new_id = save_app_token(
-            app_name=app_name,
-            app_id=app_id_value,
-            app_secret=app_entry['secret_input'].text().strip(),
-            short_lived_token=app_entry['short_token_input'].text().strip(),
-            long_lived_token=app_entry['long_token_display'].text().strip(),
-            token_expires_at=app_entry.get('token_expires_at'),
-            token_id=app_entry.get('db_id')
-        )
+        save_success, new_id = save_app_token(**payload)
 
         if save_success:
             # تحديث معرف قاعدة البيانات إذا كان هذا إدراج جديد
-            if new_id is not None and not app_entry.get('db_id'):
-                app_entry['db_id'] = new_id
+            if new_id is not None and not app_entry.db_id:
+                app_entry.db_id = new_id
 
-            app_entry['status_label'].setText('✅ تم حفظ التطبيق بنجاح!')
-            app_entry['status_label'].setStyleSheet('color: #27ae60;')
+            self._set_label(status_label, '✅ تم حفظ التطبيق بنجاح!', 'ok')
         else:
-            app_entry['status_label'].setText('❌ فشل حفظ التطبيق')
-            app_entry['status_label'].setStyleSheet('color: #e74c3c;')
+            self._set_label(status_label, '❌ فشل حفظ التطبيق', 'err')
 
-    def _delete_app(self, app_entry: dict):
+    def _delete_app(self, app_entry: AppEntry):
         """حذف تطبيق."""
         reply = QMessageBox.question(
             self, 'تأكيد الحذف',
@@ -3300,38 +3984,32 @@ class TokenManagementDialog(QDialog):
             return
 
         # حذف من قاعدة البيانات إذا كان محفوظاً
-        if app_entry.get('db_id'):
-            delete_app_token(app_entry['db_id'])
+        if app_entry.db_id:
+            delete_app_token(app_entry.db_id)
 
         # إزالة من الواجهة
-        app_entry['widget'].deleteLater()
-        self._apps.remove(app_entry)
+        self._cancel_token_fetch(app_entry)
+        app_entry.widget.deleteLater()
+        self._apps.pop(app_entry.key, None)
 
     def _save_all(self):
-        """حفظ جميع التطبيقات."""
-        saved_count = 0
+        """حفظ جميع التطبيقات في معاملة قاعدة بيانات واحدة."""
+        # المرحلة 1: قراءة الحقول والتحقق (بدون أي وصول لقاعدة البيانات)
+        pending = []
+        for app_entry in self._apps.values():
+            payload = _app_entry_payload(app_entry)
+            if payload is not None:
+                pending.append((app_entry, payload))
 
-        for app_entry in self._apps:
-            app_name = app_entry['name_input'].text().strip()
-            app_id_value = app_entry['id_input'].text().strip()
-
-            if not app_name or not app_id_value:
-                continue
-
-            save_success, new_id = save_app_token(
-                app_name=app_name,
-                app_id=app_id_value,
-                app_secret=app_entry['secret_input'].text().strip(),
-                short_lived_token=app_entry['short_token_input'].text().strip(),
-                long_lived_token=app_entry['long_token_display'].text().strip(),
-                token_expires_at=app_entry.get('token_expires_at'),
-                token_id=app_entry.get('db_id')
-            )
+        # المرحلة 2: كتابة واحدة لكل الصفوف
+        results = save_app_tokens_bulk([payload for _, payload in pending])
 
+        saved_count = 0
+        for (app_entry, _), (save_success, new_id) in zip(pending, results):
             if save_success:
                 # تحديث معرف قاعدة البيانات إذا كان هذا إدراج جديد
-                if new_id is not None and not app_entry.get('db_id'):
-                    app_entry['db_id'] = new_id
+                if new_id is not None and not app_entry.db_id:
+                    app_entry.db_id = new_id
                 saved_count += 1
 
         if saved_count > 0:
@@ -3343,11 +4021,68 @@ class TokenManagementDialog(QDialog):
 
 
 
+# ==================== Windows Window API ====================
+
+# ثوابت Windows API المستخدمة في _show_from_tray
+SW_RESTORE = 9
+SW_SHOW = 5
+HWND_TOP = 0
+HWND_TOPMOST = -1
+HWND_NOTOPMOST = -2
+SWP_SHOWWINDOW = 0x0040
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+
+
+def _load_win32_window_api():
+    """
+    ربط دوال user32/kernel32 المستخدمة لجلب النافذة للأمام مرة واحدة مع argtypes/restype.
+    Bind the user32/kernel32 functions once with explicit prototypes.
+
+    العائد:
+        tuple: (user32, GetCurrentThreadId) أو (None, None) خارج Windows
+    """
+    if sys.platform != 'win32':
+        return None, None
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    HWND, BOOL, DWORD = wintypes.HWND, wintypes.BOOL, wintypes.DWORD
+    user32.ShowWindow.argtypes = [HWND, ctypes.c_int]
+    user32.ShowWindow.restype = BOOL
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = HWND
+    user32.GetWindowThreadProcessId.argtypes = [HWND, ctypes.POINTER(DWORD)]
+    user32.GetWindowThreadProcessId.restype = DWORD
+    user32.AttachThreadInput.argtypes = [DWORD, DWORD, BOOL]
+    user32.AttachThreadInput.restype = BOOL
+    user32.SetForegroundWindow.argtypes = [HWND]
+    user32.SetForegroundWindow.restype = BOOL
+    user32.SetActiveWindow.argtypes = [HWND]
+    user32.SetActiveWindow.restype = HWND
+    user32.SetWindowPos.argtypes = [HWND, HWND, ctypes.c_int, ctypes.c_int,
+                                    ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    user32.SetWindowPos.restype = BOOL
+    user32.BringWindowToTop.argtypes = [HWND]
+    user32.BringWindowToTop.restype = BOOL
+    get_current_thread_id = ctypes.windll.kernel32.GetCurrentThreadId
+    get_current_thread_id.argtypes = []
+    get_current_thread_id.restype = DWORD
+    return user32, get_current_thread_id
+
+
 # ==================== Main Window Class ====================
 
+# فترة تجميع رسائل السجل قبل إضافتها للعرض دفعة واحدة
+LOG_FLUSH_INTERVAL_MS = 50
+# مدة صلاحية التوكن المخزن في token_getter (يُلغى أيضاً عند إغلاق نافذة التوكينات)
+TOKEN_CACHE_TTL = 300.0
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # الترحيل وتهيئة القوالب قبل قراءة أي إعدادات أو وظائف
+        _ensure_initialized()
         self.setWindowTitle(APP_TITLE)
         # تعيين أيقونة النافذة الرئيسية
         self.setWindowIcon(load_app_icon())
@@ -3382,11 +4117,23 @@ class MainWindow(QMainWindow):
         self._pages_cache_grouped = {}  # النتائج مجمعة حسب التطبيق
         self._pages_cache_time = 0
         self._pages_cache_duration = PAGES_CACHE_DURATION_SECONDS
+        # نافذة إدارة التوكينات - تُنشأ مرة واحدة ويُعاد استخدامها
+        self._token_dialog = None
+        # (التوكن، وقت انتهاء الصلاحية monotonic) - يُقرأ من threads الجدولة أيضاً
+        self._tok_cache = (None, 0.0)
 
-        # تتبع الـ Threads النشطة لضمان التنظيف الآمن عند الإغلاق
-        self._active_token_threads = []  # قائمة بجميع threads جلب التوكن النشطة
+        # دوال Windows API لجلب النافذة للأمام - تُربط مرة واحدة
+        try:
+            self._user32, self._get_current_thread_id = _load_win32_window_api()
+        except (OSError, AttributeError) as e:
+            log_debug(f'[Window] تعذر تحميل Windows API: {e}')
+            self._user32, self._get_current_thread_id = None, None
 
         self.theme = "dark"
+        self._theme_css_cache = {}  # ثيم -> الستايل الكامل
+        # إجراءات قائمة الثيم - تُنشأ في _build_menu_bar
+        self.act_dark = None
+        self.act_light = None
         self._load_settings_basic()
 
         self.countdown_timer = QTimer(self)
@@ -3452,11 +4199,18 @@ class MainWindow(QMainWindow):
         settings_file = get_settings_file()
         if settings_file.exists():
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    st = json.load(f)
+                with open(settings_file, 'rb') as f:
+                    st = _json_loads(f.read())
                 self.theme = st.get('theme', 'dark')
-                self._user_token_buffer = simple_decrypt(st.get('user_token_enc', ''))
-                self._saved_page_tokens_buffer = {pid: simple_decrypt(enc) for pid, enc in st.get('page_tokens_enc', {}).items()}
+                # فك تشفير كل القيم المشفرة دفعة واحدة (تحميل المفتاح مرة واحدة)
+                page_tokens_enc = st.get('page_tokens_enc', {})
+                page_ids = list(page_tokens_enc)
+                decrypted = simple_decrypt_many(
+                    [st.get('user_token_enc', ''), st.get('telegram_bot_token_enc', '')]
+                    + [page_tokens_enc[pid] for pid in page_ids]
+                )
+                self._user_token_buffer = decrypted[0]
+                self._saved_page_tokens_buffer = dict(zip(page_ids, decrypted[2:]))
                 # إعداد نقل الفيديوهات تلقائياً بعد الرفع
                 self.auto_move_uploaded = st.get('auto_move_uploaded', True)
                 # ساعات العمل
@@ -3474,7 +4228,7 @@ class MainWindow(QMainWindow):
                 self.internet_check_enabled = st.get('internet_check_enabled', True)
                 # إعدادات Telegram Bot
                 self.telegram_enabled = st.get('telegram_enabled', False)
-                self.telegram_bot_token = simple_decrypt(st.get('telegram_bot_token_enc', ''))
+                self.telegram_bot_token = decrypted[1]
                 self.telegram_chat_id = st.get('telegram_chat_id', '')
                 # خيارات أنواع الإشعارات
                 self.telegram_notify_success = st.get('telegram_notify_success', True)
@@ -3604,87 +4358,73 @@ class MainWindow(QMainWindow):
 
         # في Windows، استخدام SetForegroundWindow لضمان جلب النافذة للأمام
         # هذا مهم خصوصاً عند استدعاء الإظهار من نسخة أخرى
-        if sys.platform == 'win32':
+        user32 = self._user32
+        if user32 is not None:
             try:
                 # الحصول على handle النافذة
                 hwnd = int(self.winId())
 
-                # استخدام Windows API لجلب النافذة للأمام بشكل قوي
-                # تخزين مؤقت للـ user32 لتجنب البحث المتكرر
-                if not hasattr(self, '_user32'):
-                    self._user32 = ctypes.windll.user32
-
-                # Windows API Constants
-                SW_RESTORE = 9
-                SW_SHOW = 5
-                HWND_TOP = 0
-                HWND_TOPMOST = -1
-                HWND_NOTOPMOST = -2
-                SWP_SHOWWINDOW = 0x0040
-                SWP_NOSIZE = 0x0001
-                SWP_NOMOVE = 0x0002
-
                 # إذا كانت النافذة مصغرة، استعادتها
-                self._user32.ShowWindow(hwnd, SW_RESTORE)
-                self._user32.ShowWindow(hwnd, SW_SHOW)
+                user32.ShowWindow(hwnd, SW_RESTORE)
+                user32.ShowWindow(hwnd, SW_SHOW)
 
                 # محاولة ربط الخيط بالنافذة الأمامية الحالية (لتجاوز قيود Windows)
                 try:
-                    foreground_hwnd = self._user32.GetForegroundWindow()
+                    foreground_hwnd = user32.GetForegroundWindow()
                     if foreground_hwnd and foreground_hwnd != hwnd:
                         # الحصول على معرف الخيط للنافذة الأمامية الحالية
-                        foreground_thread = self._user32.GetWindowThreadProcessId(foreground_hwnd, None)
+                        foreground_thread = user32.GetWindowThreadProcessId(foreground_hwnd, None)
 
                         # التحقق من نجاح الحصول على معرف الخيط
                         if foreground_thread:
                             # الحصول على معرف الخيط الحالي
-                            current_thread = ctypes.windll.kernel32.GetCurrentThreadId()
+                            current_thread = self._get_current_thread_id()
 
                             if foreground_thread != current_thread:
                                 # ربط الخيوط لإعطاء صلاحية SetForegroundWindow
-                                attached = self._user32.AttachThreadInput(foreground_thread, current_thread, True)
+                                attached = user32.AttachThreadInput(foreground_thread, current_thread, True)
                                 if attached:
                                     try:
-                                        self._user32.SetForegroundWindow(hwnd)
+                                        user32.SetForegroundWindow(hwnd)
                                     finally:
                                         # فك الربط دائماً
-                                        self._user32.AttachThreadInput(foreground_thread, current_thread, False)
+                                        user32.AttachThreadInput(foreground_thread, current_thread, False)
                                 else:
                                     # فشل الربط، حاول مباشرة
-                                    self._user32.SetForegroundWindow(hwnd)
+                                    user32.SetForegroundWindow(hwnd)
                             else:
                                 # نفس الخيط، لا حاجة للربط
-                                self._user32.SetForegroundWindow(hwnd)
+                                user32.SetForegroundWindow(hwnd)
                         else:
                             # فشل الحصول على معرف الخيط
-                            self._user32.SetForegroundWindow(hwnd)
+                            user32.SetForegroundWindow(hwnd)
                     else:
                         # لا توجد نافذة أمامية أو نحن بالفعل في المقدمة
-                        self._user32.SetForegroundWindow(hwnd)
+                        user32.SetForegroundWindow(hwnd)
                 except (OSError, AttributeError, ctypes.ArgumentError) as e:
                     # إذا فشل الربط، حاول مباشرة
                     log_debug(f'[Window] خطأ في AttachThreadInput: {e}')
                     try:
-                        self._user32.SetForegroundWindow(hwnd)
+                        user32.SetForegroundWindow(hwnd)
                     except Exception:
                         pass
 
                 # تفعيل النافذة
-                self._user32.SetActiveWindow(hwnd)
+                user32.SetActiveWindow(hwnd)
 
                 # جعل النافذة topmost مؤقتاً ثم إعادتها لحالتها الطبيعية
                 # هذا يضمن ظهورها فوق جميع النوافذ الأخرى
-                self._user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0,
-                                          SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
-                self._user32.SetWindowPos(hwnd, HWND_NOTOPMOST, 0, 0, 0, 0,
-                                          SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
+                user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0,
+                                    SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
+                user32.SetWindowPos(hwnd, HWND_NOTOPMOST, 0, 0, 0, 0,
+                                    SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
 
                 # رفع النافذة لأعلى Z-order
-                self._user32.SetWindowPos(hwnd, HWND_TOP, 0, 0, 0, 0,
-                                          SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
+                user32.SetWindowPos(hwnd, HWND_TOP, 0, 0, 0, 0,
+                                    SWP_SHOWWINDOW | SWP_NOSIZE | SWP_NOMOVE)
 
                 # جلب التركيز للنافذة
-                self._user32.BringWindowToTop(hwnd)
+                user32.BringWindowToTop(hwnd)
 
             except Exception as e:
                 log_debug(f'[Window] خطأ في استخدام Windows API لإظهار النافذة: {e}')
@@ -3708,28 +4448,36 @@ class MainWindow(QMainWindow):
     def apply_theme(self, theme: str, announce=True):
         self.theme = "dark" if theme == "dark" else "light"
         app = QApplication.instance()
-        if HAS_QDARKTHEME:
-            try:
-                css = qdarktheme.load_stylesheet(self.theme)
-            except Exception:
-                css = ""
-        else:
-            # Fallback يدوي إذا لم تتوفر المكتبة
+        # الستايل الكامل لكل ثيم يُبنى مرة واحدة ثم يُعاد استخدامه عند التبديل
+        stylesheet = self._theme_css_cache.get(self.theme)
+        if stylesheet is None:
+            if HAS_QDARKTHEME:
+                try:
+                    css = qdarktheme.load_stylesheet(self.theme)
+                except Exception:
+                    css = ""
+            else:
+                # Fallback يدوي إذا لم تتوفر المكتبة
+                if self.theme == "dark":
+                    css = """
+                    QWidget { background-color: #242933; color: #e6e6e6; }
+                    QMenuBar, QMenu { background-color: #2e3440; color:#e6e6e6; }
+                    """
+                else:
+                    # استخدام Light Theme Fallback للوضع الفاتح
+                    css = LIGHT_THEME_FALLBACK
+
+            # الستايل المناسب حسب الثيم
             if self.theme == "dark":
-                css = """
-                QWidget { background-color: #242933; color: #e6e6e6; }
-                QMenuBar, QMenu { background-color: #2e3440; color:#e6e6e6; }
-                """
+                stylesheet = css + CUSTOM_STYLES
             else:
-                # استخدام Light Theme Fallback للوضع الفاتح
-                css = LIGHT_THEME_FALLBACK
+                # للوضع الفاتح، نستخدم الستايل الفاتح فقط (بدون CUSTOM_STYLES الداكن)
+                stylesheet = css
+            self._theme_css_cache[self.theme] = stylesheet
 
-        # تطبيق الستايل المناسب حسب الثيم
-        if self.theme == "dark":
-            app.setStyleSheet(css + CUSTOM_STYLES)
-        else:
-            # للوضع الفاتح، نستخدم الستايل الفاتح فقط (بدون CUSTOM_STYLES الداكن)
-            app.setStyleSheet(css)
+        app.setStyleSheet(stylesheet)
+        # الأيقونات بدون لون صريح تأخذ لون لوحة الثيم - تُرسم من جديد بعد التبديل
+        get_icon.cache_clear()
 
         # تحديث مؤشرات القائمة
         self._update_theme_menu_indicators()
@@ -3766,25 +4514,11 @@ class MainWindow(QMainWindow):
             self.mode_tabs.addTab(self.pages_panel, 'الصفحات')
 
         # تبويب الإعدادات المتقدمة (تم إزالة ساعات العمل منها - Requirement 4)
-        # إضافة QScrollArea لدعم التمرير بعجلة الماوس (Issue #2)
+        # ويدجت فارغ هنا - منطقة التمرير وكل الإعدادات تُبنى عند أول فتح للتبويب
+        # (_ensure_settings_tab) لأن ويدجاته لا تُستخدم إلا من داخله
         settings_tab = QWidget()
-        settings_tab_layout = QVBoxLayout(settings_tab)
-        settings_tab_layout.setContentsMargins(0, 0, 0, 0)
-
-        # إنشاء منطقة التمرير
-        settings_scroll = QScrollArea()
-        settings_scroll.setWidgetResizable(True)
-        settings_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        settings_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        settings_scroll.setFrameShape(QFrame.NoFrame)
-
-        # ويدجت داخلي يحتوي على جميع الإعدادات
-        settings_content = QWidget()
-        settings_layout = QVBoxLayout(settings_content)
-        self._build_settings_tab(settings_layout)
-
-        settings_scroll.setWidget(settings_content)
-        settings_tab_layout.addWidget(settings_scroll)
+        self._settings_tab = settings_tab
+        self._settings_built = False
 
         if HAS_QTAWESOME:
             self.mode_tabs.addTab(settings_tab, get_icon(ICONS['settings'], ICON_COLORS.get('settings')), 'إعدادات')
@@ -3807,8 +4541,12 @@ class MainWindow(QMainWindow):
         scroll_area.setFrameShape(QFrame.NoFrame)
 
         # ويدجت داخلي يحتوي على جميع الإعدادات
+        # (معتم: التمرير ينسخ البكسلات المرسومة ويرسم الشريط المكشوف فقط بدل إعادة رسم الكل)
         scroll_content = QWidget()
-        page_form = QFormLayout(scroll_content)
+        scroll_content.setAutoFillBackground(True)
+        # شبكة بدلاً من QFormLayout: بدون حسابات التفاف التسميات وعرض عمودها عند كل
+        # تغيير حجم داخل منطقة التمرير - كل صف ويدجت بعرض الشبكة عبر _grid_add_row
+        page_form = QGridLayout(scroll_content)
         page_form.setSpacing(8)
         page_form.setContentsMargins(5, 5, 5, 5)
 
@@ -3817,14 +4555,14 @@ class MainWindow(QMainWindow):
         self.job_type_combo.addItems(['🎥 فيديوهات', '📱 ستوري', '🎬 ريلز'])
         self.job_type_combo.setToolTip('اختر نوع المحتوى: فيديوهات أو ستوري أو ريلز')
         self.job_type_combo.currentIndexChanged.connect(self._on_job_type_changed)
-        page_form.addRow('نوع المحتوى:', self.job_type_combo)
+        self._grid_add_row(page_form, 'نوع المحتوى:', self.job_type_combo)
 
         self.selected_page_label = QLabel('لم يتم اختيار صفحة')
-        page_form.addRow('الصفحة:', self.selected_page_label)
+        self._grid_add_row(page_form, 'الصفحة:', self.selected_page_label)
 
         self.folder_btn = create_icon_button('اختر مجلد الفيديوهات', 'folder')
         self.folder_btn.clicked.connect(self.choose_folder)
-        page_form.addRow('المجلد:', self.folder_btn)
+        self._grid_add_row(page_form, 'المجلد:', self.folder_btn)
 
         # ==================== نظام الجدولة ====================
         schedule_group = QGroupBox('⏰ نظام الجدولة')
@@ -3855,6 +4593,7 @@ class MainWindow(QMainWindow):
 
         # الساعة في اليسار
         self.current_time_label = QLabel()
+        self._last_time_text = ''
         self.current_time_label.setStyleSheet('font-size: 14px; font-weight: bold; color: #3498db;')
         interval_layout.addWidget(self.current_time_label)
 
@@ -3887,7 +4626,6 @@ class MainWindow(QMainWindow):
 
         self.template_combo = NoScrollComboBox()
         self.template_combo.setMinimumWidth(150)
-        self._refresh_templates_combo()
         self.template_combo.currentIndexChanged.connect(self._update_template_times_label)
         template_row.addWidget(self.template_combo)
 
@@ -3899,28 +4637,39 @@ class MainWindow(QMainWindow):
         smart_layout.addLayout(template_row)
 
         # عرض أوقات القالب المختار
-        self.template_times_label = QLabel('📋 الأوقات: --')
+        self.template_times_label = QLabel(_TIMES_NONE)
         self.template_times_label.setStyleSheet('color: #7f8c8d; margin-top: 5px;')
         smart_layout.addWidget(self.template_times_label)
 
+        # القوالب تُقرأ عند أول اختيار للجدول الذكي (_on_schedule_mode_changed)
+        # بدلاً من قراءتها عند كل تشغيل حتى لمن يستخدم الفاصل الزمني فقط
+        self._templates_loaded = False
+        self._templates_by_id = {}
+        self._template_id_to_row = {}
+        self.template_combo.addItem('— جاري التحميل…', None)
+
         schedule_layout.addWidget(self.smart_schedule_widget)
 
         schedule_group.setLayout(schedule_layout)
-        page_form.addRow(schedule_group)
-
-        # Timer لتحديث الوقت الحالي كل ثانية
-        self.time_update_timer = QTimer()
-        self.time_update_timer.timeout.connect(self._update_current_time)
-        self.time_update_timer.start(1000)
+        self._grid_add_row(page_form, schedule_group)
+
+        # Timer لتحديث الوقت الحالي عند بداية كل دقيقة (طلقة واحدة يُعاد ضبطها)
+        # يعمل فقط أثناء ظهور الساعة (النافذة ظاهرة ووضع الفاصل الزمني) - _sync_clock_timer
+        self.time_update_timer = QTimer(self)
+        self.time_update_timer.setSingleShot(True)
+        self.time_update_timer.setTimerType(Qt.PreciseTimer)
+        self.time_update_timer.timeout.connect(self._on_clock_tick)
         self._update_current_time()  # تحديث فوري
 
         # لوحة إعدادات الستوري - Story Panel
         self.story_panel = StoryPanel(self)
         self.story_panel.setVisible(False)  # مخفية افتراضياً (تظهر فقط في وضع الستوري)
-        page_form.addRow(self.story_panel)
+        self._grid_add_row(page_form, self.story_panel)
 
         # التوقيت العشوائي (Anti-Ban) - للفيديو فقط
         jitter_row = QHBoxLayout()
+        # التسمية داخل jitter_widget لتختفي معه في وضع الستوري
+        jitter_row.addWidget(QLabel('🛡️ Anti-Ban:'))
         self.jitter_checkbox = QCheckBox('تفعيل التوقيت العشوائي')
         self.jitter_checkbox.setToolTip('إضافة تباين عشوائي للفاصل الزمني لمحاكاة السلوك البشري')
         jitter_row.addWidget(self.jitter_checkbox)
@@ -3933,7 +4682,7 @@ class MainWindow(QMainWindow):
         jitter_row.addWidget(self.jitter_percent_spin)
         self.jitter_widget = QWidget()
         self.jitter_widget.setLayout(jitter_row)
-        page_form.addRow('🛡️ Anti-Ban:', self.jitter_widget)
+        self._grid_add_row(page_form, self.jitter_widget)
 
         # ترتيب الملفات
         sort_row = QHBoxLayout()
@@ -3941,7 +4690,7 @@ class MainWindow(QMainWindow):
         self.sort_by_combo.addItems(['أبجدي (الافتراضي)', 'عشوائي', 'الأقدم أولاً', 'الأحدث أولاً'])
         self.sort_by_combo.setToolTip('اختر طريقة ترتيب الملفات للنشر')
         sort_row.addWidget(self.sort_by_combo)
-        page_form.addRow('🔀 ترتيب النشر:', sort_row)
+        self._grid_add_row(page_form, '🔀 ترتيب النشر:', sort_row)
 
         # العنوان (للفيديو فقط)
         # العنوان (للفيديو والريلز فقط) - Requirement 5: إزالة من الستوري
@@ -3967,7 +4716,7 @@ class MainWindow(QMainWindow):
         title_row.addWidget(self.use_filename_checkbox, 1)
         self.title_widget = QWidget()
         self.title_widget.setLayout(title_row)
-        page_form.addRow(self.title_widget)
+        self._grid_add_row(page_form, self.title_widget)
 
         # صف الوصف مع زر مدير الهاشتاجات (للفيديو والريلز فقط) - Requirement 5
         desc_row = QHBoxLayout()
@@ -3994,18 +4743,10 @@ class MainWindow(QMainWindow):
         desc_row.addWidget(hashtag_btn, 1)
         self.desc_widget = QWidget()
         self.desc_widget.setLayout(desc_row)
-        page_form.addRow(self.desc_widget)
+        self._grid_add_row(page_form, self.desc_widget)
 
         # مجموعة العلامة المائية (للفيديو فقط) - لكل مهمة
         self.job_watermark_group = QGroupBox('العلامة المائية')
-        if HAS_QTAWESOME:
-            self.job_watermark_group.setTitle('')
-            watermark_title_layout = QHBoxLayout()
-            watermark_icon_label = QLabel()
-            watermark_icon_label.setPixmap(get_icon(ICONS['watermark'], ICON_COLORS.get('watermark')).pixmap(16, 16))
-            watermark_title_layout.addWidget(watermark_icon_label)
-            watermark_title_layout.addWidget(QLabel('العلامة المائية'))
-            watermark_title_layout.addStretch()
         watermark_layout = QFormLayout()
 
         self.job_watermark_checkbox = QCheckBox('تفعيل العلامة المائية')
@@ -4031,24 +4772,19 @@ class MainWindow(QMainWindow):
         self.job_watermark_size_slider = NoScrollSlider(Qt.Horizontal)
         self.job_watermark_size_slider.setRange(10, 100)  # 10% إلى 100%
         self.job_watermark_size_slider.setValue(15)  # 15% افتراضي
-        self.job_watermark_size_label = QLabel('15%')
-        self.job_watermark_size_slider.valueChanged.connect(
-            lambda v: self.job_watermark_size_label.setText(f'{v}%')
-        )
+        # القيمة تُعرض في spin للقراءة فقط مربوط مباشرة بالشريط (بدون كود Python أثناء السحب)
+        self.job_watermark_size_spin = self._percent_readout(self.job_watermark_size_slider)
         size_row.addWidget(self.job_watermark_size_slider, 4)
-        size_row.addWidget(self.job_watermark_size_label, 1)
+        size_row.addWidget(self.job_watermark_size_spin, 1)
         watermark_layout.addRow('الحجم:', size_row)
 
         opacity_row = QHBoxLayout()
         self.job_watermark_opacity_slider = NoScrollSlider(Qt.Horizontal)
         self.job_watermark_opacity_slider.setRange(10, 100)
         self.job_watermark_opacity_slider.setValue(80)
-        self.job_watermark_opacity_label = QLabel('80%')
-        self.job_watermark_opacity_slider.valueChanged.connect(
-            lambda v: self.job_watermark_opacity_label.setText(f'{v}%')
-        )
+        self.job_watermark_opacity_spin = self._percent_readout(self.job_watermark_opacity_slider)
         opacity_row.addWidget(self.job_watermark_opacity_slider, 4)
-        opacity_row.addWidget(self.job_watermark_opacity_label, 1)
+        opacity_row.addWidget(self.job_watermark_opacity_spin, 1)
         watermark_layout.addRow('الشفافية:', opacity_row)
 
         # زر المعاينة
@@ -4059,7 +4795,9 @@ class MainWindow(QMainWindow):
 
         self.job_watermark_group.setLayout(watermark_layout)
         self.job_watermark_group.setVisible(True)  # للفيديو فقط
-        page_form.addRow(self.job_watermark_group)
+        self._grid_add_row(page_form, self.job_watermark_group)
+        # صف فارغ يمتص المساحة الزائدة لتبقى الصفوف في الأعلى (كما في QFormLayout)
+        page_form.setRowStretch(page_form.rowCount(), 1)
 
         # تعيين المحتوى للـ ScrollArea
         scroll_area.setWidget(scroll_content)
@@ -4149,6 +4887,12 @@ class MainWindow(QMainWindow):
         # استخدام مكون LogViewer المستخرج
         # Use extracted LogViewer component
         self.log_text = LogViewer()
+        # تجميع رسائل السجل وإضافتها دفعة واحدة كل LOG_FLUSH_INTERVAL_MS
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         root.addWidget(self.log_text)
 
         # شريط الحالة لرسائل الثيم
@@ -4200,11 +4944,34 @@ class MainWindow(QMainWindow):
             self._save_settings()
 
     def _update_theme_menu_indicators(self):
-        if hasattr(self, 'act_dark') and hasattr(self, 'act_light'):
+        if self.act_dark is not None and self.act_light is not None:
             self.act_dark.setText('🌙 داكن ✓' if self.theme == 'dark' else '🌙 داكن')
             self.act_light.setText('☀️ فاتح ✓' if self.theme == 'light' else '☀️ فاتح')
 
-    def _separator(self):
+    @staticmethod
+    def _grid_add_row(grid: QGridLayout, label, item=None):
+        """
+        إضافة صف بعرض الشبكة (بديل QFormLayout.addRow).
+
+        مع نص تسمية يُجمع النص والعنصر (ويدجت/تخطيط) في ويدجت صف واحد،
+        فلا توجد أعمدة تسميات يُعاد حساب عرضها عند تغيير الحجم.
+        """
+        row = grid.rowCount() if grid.count() else 0
+        if item is not None:
+            row_widget = QWidget()
+            row_layout = QHBoxLayout(row_widget)
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            row_layout.addWidget(QLabel(label))
+            if isinstance(item, QLayout):
+                row_layout.addLayout(item, 1)
+            else:
+                row_layout.addWidget(item, 1)
+            label = row_widget
+        grid.addWidget(label, row, 0, 1, 2)
+
+    @staticmethod
+    def _separator() -> QFrame:
+        """خط فاصل أفقي (لا يعتمد على حالة النافذة)."""
         sep = QFrame()
         sep.setFrameShape(QFrame.HLine)
         sep.setFrameShadow(QFrame.Sunken)
@@ -4216,64 +4983,119 @@ class MainWindow(QMainWindow):
         if checked:
             self.page_title_input.setText('{filename}')
 
+    @staticmethod
+    def _percent_readout(slider) -> NoScrollSpinBox:
+        """عرض نسبة الشريط (للقراءة فقط) مع ربط valueChanged -> setValue داخل Qt مباشرة."""
+        spin = NoScrollSpinBox()
+        spin.setRange(slider.minimum(), slider.maximum())
+        spin.setSuffix('%')
+        spin.setReadOnly(True)
+        spin.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        spin.setFocusPolicy(Qt.NoFocus)
+        spin.setValue(slider.value())
+        slider.valueChanged.connect(spin.setValue)
+        return spin
+
     def _update_current_time(self):
-        """تحديث عرض الوقت الحالي (Requirement 9)."""
+        """تحديث عرض الوقت الحالي (Requirement 9) - setText فقط عند تغيّر النص."""
         now = datetime.now()
-        self.current_time_label.setText(f'🕐 {now.strftime("%I:%M:%S %p")}')
+        text = _CLOCK_PREFIX + now.strftime('%I:%M %p')
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.current_time_label.setText(text)
+        return now
+
+    def _on_clock_tick(self):
+        """تحديث الساعة ثم إعادة ضبط المؤقت لبداية الدقيقة التالية."""
+        self._arm_clock_timer(self._update_current_time())
+
+    def _arm_clock_timer(self, now: datetime):
+        """ضبط مؤقت الساعة ليطلق عند بداية الدقيقة التالية."""
+        self.time_update_timer.start(60000 - (now.second * 1000 + now.microsecond // 1000))
+
+    def _sync_clock_timer(self):
+        """تشغيل مؤقت الساعة فقط عندما تكون معروضة (بدلاً من التحديث في الخلفية)."""
+        if self.isVisible() and self.interval_radio.isChecked():
+            if not self.time_update_timer.isActive():
+                self._arm_clock_timer(self._update_current_time())
+        else:
+            self.time_update_timer.stop()
 
     def _refresh_templates_combo(self):
-        """تحديث قائمة القوالب في الكومبو بوكس."""
+        """
+        تحديث قائمة القوالب في الكومبو بوكس.
+
+        استعلام واحد للقوالب: القالب الافتراضي يُحدَّد من علامة is_default أثناء
+        التعبئة، وتُخزَّن القوالب حسب المعرف لـ _update_template_times_label.
+        الرسم والإشارات موقوفة أثناء إعادة البناء ثم يُحدَّث عرض الأوقات مرة واحدة.
+        """
+        combo = self.template_combo
+        self._templates_by_id = {}
+        self._template_id_to_row = {}
+        self._templates_loaded = True
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
         try:
-            self.template_combo.clear()
+            combo.clear()
             templates = get_all_templates()
+            self._templates_by_id = {t['id']: t for t in templates}
+            self._template_id_to_row = {t['id']: row for row, t in enumerate(templates)}
 
-            for template in templates:
+            default_row = -1
+            for row, template in enumerate(templates):
                 name = template['name']
                 if template['is_default']:
                     name = f'⭐ {name}'
-                self.template_combo.addItem(name, template['id'])
-
-            # تحديد القالب الافتراضي
-            default_template = get_default_template()
-            if default_template:
-                for i in range(self.template_combo.count()):
-                    if self.template_combo.itemData(i) == default_template['id']:
-                        self.template_combo.setCurrentIndex(i)
-                        break
+                    if default_row < 0:
+                        default_row = row
+                combo.addItem(name, template['id'])
+
+            # تحديد القالب الافتراضي (get_default_template ينشئ القوالب الافتراضية إن لم توجد)
+            if default_row < 0:
+                default_template = get_default_template()
+                if default_template:
+                    default_row = self._template_id_to_row.get(default_template['id'], -1)
+            if default_row >= 0:
+                combo.setCurrentIndex(default_row)
         except Exception:
-            self.template_combo.addItem('الافتراضي', 0)
+            combo.addItem('الافتراضي', 0)
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+        self._update_template_times_label()
+
+    def _select_template(self, template_id):
+        """تحديد قالب في الكومبو حسب المعرف (بحث في القاموس بدلاً من مسح العناصر)."""
+        row = self._template_id_to_row.get(template_id, -1)
+        if row >= 0:
+            self.template_combo.setCurrentIndex(row)
 
     def _on_schedule_mode_changed(self, checked):
         """التبديل بين نظام الفاصل الزمني والجدول الذكي."""
         use_interval = self.interval_radio.isChecked()
         self.interval_widget.setVisible(use_interval)
         self.smart_schedule_widget.setVisible(not use_interval)
+        self._sync_clock_timer()
 
-        # تحديث عرض أوقات القالب عند التبديل للجدول الذكي
-        if not use_interval:
-            self._update_template_times_label()
+        # تحميل القوالب عند أول تبديل للجدول الذكي - بعد ذلك يبقى عرض الأوقات
+        # محدَّثاً عبر currentIndexChanged حتى أثناء إخفاء اللوحة
+        if not use_interval and not self._templates_loaded:
+            self._refresh_templates_combo()
 
     def _update_template_times_label(self):
-        """تحديث عرض أوقات القالب المختار."""
-        try:
-            template_id = self.template_combo.currentData()
-            if template_id:
-                template = get_template_by_id(template_id)
-                if template and 'times' in template:
-                    times_str = ', '.join(template['times'])
-                    self.template_times_label.setText(f'📋 الأوقات: {times_str}')
-                else:
-                    self.template_times_label.setText('📋 الأوقات: --')
-            else:
-                self.template_times_label.setText('📋 الأوقات: --')
-        except Exception:
-            self.template_times_label.setText('📋 الأوقات: --')
+        """تحديث عرض أوقات القالب المختار (من القوالب المخزنة في _refresh_templates_combo)."""
+        template = self._templates_by_id.get(self.template_combo.currentData())
+        if template and template.get('times'):
+            text = _TIMES_PREFIX + ', '.join(template['times'])
+        else:
+            text = _TIMES_NONE
+        if self.template_times_label.text() != text:
+            self.template_times_label.setText(text)
 
     def _open_schedule_templates_dialog_and_refresh(self):
         """فتح نافذة إدارة القوالب ثم تحديث القائمة."""
         self._open_schedule_templates_dialog()
         self._refresh_templates_combo()
-        self._update_template_times_label()
 
     def _on_job_double_clicked(self, item):
         """فتح نافذة تعديل المهمة عند الضغط المزدوج (للتوافق مع الكود القديم)."""
@@ -4285,44 +5107,84 @@ class MainWindow(QMainWindow):
         self._load_job_to_form(job)
 
     def _load_job_to_form(self, job):
-        """تحميل بيانات المهمة إلى نموذج التعديل (Requirement 3)."""
+        """
+        تحميل بيانات المهمة إلى نموذج التعديل (Requirement 3).
+
+        الرسم وإشارات الحقول ذات المعالجات موقوفة أثناء التعبئة، ثم يُستدعى كل
+        معالج مرة واحدة بالقيم النهائية بدلاً من استدعائه مع كل حقل.
+        """
         # Store the job being edited so add_update_job() can update it directly
         self._editing_job = job
 
+        use_smart_schedule = getattr(job, 'use_smart_schedule', False)
+        template_id = getattr(job, 'template_id', None)
+        signal_widgets = (self.job_type_combo, self.use_filename_checkbox,
+                          self.interval_radio, self.smart_schedule_radio)
+
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in signal_widgets:
+                widget.blockSignals(True)
+            try:
+                self._fill_job_form(job, use_smart_schedule)
+            finally:
+                for widget in signal_widgets:
+                    widget.blockSignals(False)
+
+            if not isinstance(job, StoryJob):
+                self._toggle_title_editable(self.use_filename_checkbox.checkState())
+            # يحمّل القوالب عند الحاجة قبل تحديد قالب المهمة
+            self._on_schedule_mode_changed(use_smart_schedule)
+            if use_smart_schedule and template_id:
+                self._select_template(template_id)
+
+            # البحث في الصفحات وتحديدها باستخدام pages_panel
+            job_app_name = getattr(job, 'app_name', '')  # الحصول على اسم التطبيق من المهمة
+            self.pages_panel.find_and_select_page(job.page_id, job_app_name)
+
+            # تطبيق تغيير نوع المحتوى
+            self._on_job_type_changed(self.job_type_combo.currentIndex())
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._log_append(f'📝 تم تحميل إعدادات المهمة: {job.page_name}')
+
+    def _fill_job_form(self, job, use_smart_schedule: bool):
+        """تعبئة حقول النموذج من المهمة (بدون معالجات - يستدعيها _load_job_to_form)."""
         # تحديد نوع المهمة
         if isinstance(job, StoryJob):
             self.job_type_combo.setCurrentIndex(1)  # ستوري
-            self.folder_btn.setText(job.folder if job.folder else 'اختر مجلد الستوري')
+            _set_text_if_changed(self.folder_btn, job.folder if job.folder else 'اختر مجلد الستوري')
             self.story_panel.set_stories_per_schedule(job.stories_per_schedule)
             self.story_panel.set_anti_ban_enabled(job.anti_ban_enabled)
             self.story_panel.set_random_delay_min(job.random_delay_min if job.random_delay_min > 0 else DEFAULT_RANDOM_DELAY_MIN)
             self.story_panel.set_random_delay_max(job.random_delay_max if job.random_delay_max > 0 else DEFAULT_RANDOM_DELAY_MAX)
         elif isinstance(job, ReelsJob):
             self.job_type_combo.setCurrentIndex(2)  # ريلز
-            self.folder_btn.setText(job.folder if job.folder else 'اختر مجلد الريلز')
-            self.page_title_input.setText(job.title_template or '{filename}')
-            self.page_desc_input.setText(job.description_template or '')
+            _set_text_if_changed(self.folder_btn, job.folder if job.folder else 'اختر مجلد الريلز')
+            _set_text_if_changed(self.page_title_input, job.title_template or '{filename}')
+            _set_text_if_changed(self.page_desc_input, job.description_template or '')
             self.use_filename_checkbox.setChecked(job.use_filename_as_title)
             self.jitter_checkbox.setChecked(job.jitter_enabled)
             self.jitter_percent_spin.setValue(job.jitter_percent)
             # العلامة المائية
             self.job_watermark_checkbox.setChecked(job.watermark_enabled)
             if job.watermark_path:
-                self.job_watermark_path_label.setText(job.watermark_path)
+                _set_text_if_changed(self.job_watermark_path_label, job.watermark_path)
                 self.job_watermark_path_label.setStyleSheet('')
             else:
-                self.job_watermark_path_label.setText('لم يتم اختيار شعار')
+                _set_text_if_changed(self.job_watermark_path_label, 'لم يتم اختيار شعار')
                 self.job_watermark_path_label.setStyleSheet('color: gray;')
-            position_index = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4}.get(job.watermark_position, 3)
+            position_index = _WATERMARK_POS_TO_INDEX.get(job.watermark_position, 3)
             self.job_watermark_position_combo.setCurrentIndex(position_index)
             self.job_watermark_opacity_slider.setValue(int(job.watermark_opacity * 100))
             self.job_watermark_size_slider.setValue(int(job.watermark_scale * 100))
         else:
             # فيديو
             self.job_type_combo.setCurrentIndex(0)
-            self.folder_btn.setText(job.folder if job.folder else 'اختر مجلد الفيديوهات')
-            self.page_title_input.setText(job.title_template or '{filename}')
-            self.page_desc_input.setText(job.description_template or '')
+            _set_text_if_changed(self.folder_btn, job.folder if job.folder else 'اختر مجلد الفيديوهات')
+            _set_text_if_changed(self.page_title_input, job.title_template or '{filename}')
+            _set_text_if_changed(self.page_desc_input, job.description_template or '')
             self.use_filename_checkbox.setChecked(job.use_filename_as_title)
             self.jitter_checkbox.setChecked(job.jitter_enabled)
             self.jitter_percent_spin.setValue(job.jitter_percent)
@@ -4330,12 +5192,12 @@ class MainWindow(QMainWindow):
             if hasattr(job, 'watermark_enabled'):
                 self.job_watermark_checkbox.setChecked(job.watermark_enabled)
                 if job.watermark_path:
-                    self.job_watermark_path_label.setText(job.watermark_path)
+                    _set_text_if_changed(self.job_watermark_path_label, job.watermark_path)
                     self.job_watermark_path_label.setStyleSheet('')
                 else:
-                    self.job_watermark_path_label.setText('لم يتم اختيار شعار')
+                    _set_text_if_changed(self.job_watermark_path_label, 'لم يتم اختيار شعار')
                     self.job_watermark_path_label.setStyleSheet('color: gray;')
-                position_index = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4}.get(job.watermark_position, 3)
+                position_index = _WATERMARK_POS_TO_INDEX.get(job.watermark_position, 3)
                 self.job_watermark_position_combo.setCurrentIndex(position_index)
                 self.job_watermark_opacity_slider.setValue(int(job.watermark_opacity * 100))
                 self.job_watermark_size_slider.setValue(int(job.watermark_scale * 100))
@@ -4347,39 +5209,25 @@ class MainWindow(QMainWindow):
         if idx >= 0:
             self.interval_unit_combo.setCurrentIndex(idx)
 
-        sort_index = {'name': 0, 'random': 1, 'date_created': 2, 'date_modified': 3}.get(job.sort_by, 0)
+        sort_index = _SORT_BY_TO_INDEX.get(job.sort_by, 0)
         self.sort_by_combo.setCurrentIndex(sort_index)
 
-        # تحميل إعدادات نظام الجدولة (الفاصل الزمني أو الجدول الذكي)
-        use_smart_schedule = getattr(job, 'use_smart_schedule', False)
-        template_id = getattr(job, 'template_id', None)
-
+        # نظام الجدولة (الفاصل الزمني أو الجدول الذكي)
         if use_smart_schedule:
             self.smart_schedule_radio.setChecked(True)
-            # تحديد القالب إذا كان موجوداً
-            if template_id:
-                for i in range(self.template_combo.count()):
-                    if self.template_combo.itemData(i) == template_id:
-                        self.template_combo.setCurrentIndex(i)
-                        break
         else:
             self.interval_radio.setChecked(True)
 
-        # البحث في الصفحات وتحديدها باستخدام pages_panel
-        job_app_name = getattr(job, 'app_name', '')  # الحصول على اسم التطبيق من المهمة
-        self.pages_panel.find_and_select_page(job.page_id, job_app_name)
-
-        # تطبيق تغيير نوع المحتوى
-        self._on_job_type_changed(self.job_type_combo.currentIndex())
-
-        self._log_append(f'📝 تم تحميل إعدادات المهمة: {job.page_name}')
-
     def _on_stop_upload(self):
         """إيقاف عملية الرفع الجارية (Requirement 6)."""
         self._upload_stop_requested.set()
-        # إيقاف الوظيفة الحالية إذا كانت موجودة (للفيديو)
-        if self._current_uploading_job is not None:
-            self._current_uploading_job.cancel_requested = True
+        # إيقاف الوظيفة الحالية إذا كانت موجودة (للفيديو) - قراءة واحدة للمرجع؛
+        # حلقة الرفع تفحص job.check_and_reset_cancel() وليس حدث الإيقاف.
+        # في PageJob السمة cancel_requested عادية (بدون قفل)، و _state_lock يحمي فقط
+        # الفحص وإعادة الضبط في check_and_reset_cancel
+        job = self._current_uploading_job
+        if job is not None:
+            job.cancel_requested = True
         self._log_append('⏹️ جاري إيقاف الرفع...')
         self.stop_upload_btn.setEnabled(False)
         self.stop_upload_btn.setText('⏹️ جاري الإيقاف...')
@@ -4450,13 +5298,19 @@ class MainWindow(QMainWindow):
             return
 
         ts = format_datetime_12h()
-        self.log_text.append(f'[{ts}] {text}')
-
-        # التمرير التلقائي للأسفل
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_text.setTextCursor(cursor)
-        self.log_text.ensureCursorVisible()
+        # الوقت يُسجَّل عند الاستلام، والإضافة للعرض مجمّعة في _flush_log
+        self._log_buffer.append(f'[{ts}] {text}')
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """إضافة رسائل السجل المجمّعة بعملية واحدة (تخطيط وتمرير واحد لكل دفعة)."""
+        if not self._log_buffer:
+            return
+        pending = '\n'.join(self._log_buffer)
+        self._log_buffer.clear()
+        # نص عادي بدون تحليل HTML - QPlainTextEdit يمرر للأسفل تلقائياً إذا كان العرض في النهاية
+        self.log_text.appendPlainText(pending)
 
     def _update_progress(self, percent, status_text):
         """تحديث شريط التقدم والحالة - Update progress bar and status"""
@@ -4470,18 +5324,31 @@ class MainWindow(QMainWindow):
         """
         الحصول على التوكن للاستخدام.
         يستخدم أول توكن طويل متاح من نظام إدارة التوكينات.
+        النتيجة مخزنة لمدة TOKEN_CACHE_TTL بدلاً من قراءة وفك تشفير قاعدة البيانات
+        مع كل رفع (استبدال الـ tuple ذري فيُستدعى بأمان من threads الجدولة).
         """
+        now = time.monotonic()
+        token, expires = self._tok_cache
+        if token and now < expires:
+            return token
+
         # الحصول على التوكينات الطويلة من نظام إدارة التوكينات
         tokens = get_all_long_lived_tokens()
         if tokens:
+            self._tok_cache = (tokens[0], now + TOKEN_CACHE_TTL)
             return tokens[0]  # استخدام أول توكن متاح
         return None
 
     def _open_token_management(self):
         """فتح نافذة إدارة التوكينات."""
-        dialog = TokenManagementDialog(self)
-        dialog.exec()
+        if self._token_dialog is None:
+            self._token_dialog = TokenManagementDialog(self)
+        else:
+            # إعادة المزامنة مع قاعدة البيانات - إنشاء/حذف الفرق فقط
+            self._token_dialog._load_apps()
+        self._token_dialog.exec()
         # إعادة تعيين الـ Cache بعد تحديث التوكينات
+        self._tok_cache = (None, 0.0)
         self._pages_cache = []
         self._pages_cache_grouped = {}
         self._pages_cache_time = 0
@@ -4596,17 +5463,14 @@ class MainWindow(QMainWindow):
             self.page_title_input.setReadOnly(existing_video.use_filename_as_title)
             self.jitter_checkbox.setChecked(existing_video.jitter_enabled)
             self.jitter_percent_spin.setValue(existing_video.jitter_percent)
-            sort_index = {'name': 0, 'random': 1, 'date_created': 2, 'date_modified': 3}.get(existing_video.sort_by, 0)
+            sort_index = _SORT_BY_TO_INDEX.get(existing_video.sort_by, 0)
             self.sort_by_combo.setCurrentIndex(sort_index)
             # تحميل إعدادات نظام الجدولة
             if getattr(existing_video, 'use_smart_schedule', False):
                 self.smart_schedule_radio.setChecked(True)
                 template_id = getattr(existing_video, 'template_id', None)
                 if template_id:
-                    for i in range(self.template_combo.count()):
-                        if self.template_combo.itemData(i) == template_id:
-                            self.template_combo.setCurrentIndex(i)
-                            break
+                    self._select_template(template_id)
             else:
                 self.interval_radio.setChecked(True)
             # تحميل إعدادات العلامة المائية
@@ -4617,8 +5481,7 @@ class MainWindow(QMainWindow):
             else:
                 self.job_watermark_path_label.setText('لم يتم اختيار شعار')
                 self.job_watermark_path_label.setStyleSheet('color: gray;')
-            positions = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4}
-            self.job_watermark_position_combo.setCurrentIndex(positions.get(existing_video.watermark_position, 3))
+            self.job_watermark_position_combo.setCurrentIndex(_WATERMARK_POS_TO_INDEX.get(existing_video.watermark_position, 3))
             self.job_watermark_opacity_slider.setValue(int(existing_video.watermark_opacity * 100))
             self.job_watermark_size_slider.setValue(int(existing_video.watermark_scale * 100))
         elif existing_reels:
@@ -4635,17 +5498,14 @@ class MainWindow(QMainWindow):
             self.page_title_input.setReadOnly(existing_reels.use_filename_as_title)
             self.jitter_checkbox.setChecked(existing_reels.jitter_enabled)
             self.jitter_percent_spin.setValue(existing_reels.jitter_percent)
-            sort_index = {'name': 0, 'random': 1, 'date_created': 2, 'date_modified': 3}.get(existing_reels.sort_by, 0)
+            sort_index = _SORT_BY_TO_INDEX.get(existing_reels.sort_by, 0)
             self.sort_by_combo.setCurrentIndex(sort_index)
             # تحميل إعدادات نظام الجدولة
             if getattr(existing_reels, 'use_smart_schedule', False):
                 self.smart_schedule_radio.setChecked(True)
                 template_id = getattr(existing_reels, 'template_id', None)
                 if template_id:
-                    for i in range(self.template_combo.count()):
-                        if self.template_combo.itemData(i) == template_id:
-                            self.template_combo.setCurrentIndex(i)
-                            break
+                    self._select_template(template_id)
             else:
                 self.interval_radio.setChecked(True)
             # تحميل إعدادات العلامة المائية
@@ -4656,8 +5516,7 @@ class MainWindow(QMainWindow):
             else:
                 self.job_watermark_path_label.setText('لم يتم اختيار شعار')
                 self.job_watermark_path_label.setStyleSheet('color: gray;')
-            positions = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4}
-            self.job_watermark_position_combo.setCurrentIndex(positions.get(existing_reels.watermark_position, 3))
+            self.job_watermark_position_combo.setCurrentIndex(_WATERMARK_POS_TO_INDEX.get(existing_reels.watermark_position, 3))
             self.job_watermark_opacity_slider.setValue(int(existing_reels.watermark_opacity * 100))
             self.job_watermark_size_slider.setValue(int(existing_reels.watermark_scale * 100))
         elif existing_story:
@@ -4668,7 +5527,7 @@ class MainWindow(QMainWindow):
             idx = self.interval_unit_combo.findText(unit)
             if idx >= 0:
                 self.interval_unit_combo.setCurrentIndex(idx)
-            sort_index = {'name': 0, 'random': 1, 'date_created': 2, 'date_modified': 3}.get(existing_story.sort_by, 0)
+            sort_index = _SORT_BY_TO_INDEX.get(existing_story.sort_by, 0)
             self.sort_by_combo.setCurrentIndex(sort_index)
             self.story_panel.set_stories_per_schedule(existing_story.stories_per_schedule)
             # تحميل إعدادات نظام الجدولة
@@ -4676,10 +5535,7 @@ class MainWindow(QMainWindow):
                 self.smart_schedule_radio.setChecked(True)
                 template_id = getattr(existing_story, 'template_id', None)
                 if template_id:
-                    for i in range(self.template_combo.count()):
-                        if self.template_combo.itemData(i) == template_id:
-                            self.template_combo.setCurrentIndex(i)
-                            break
+                    self._select_template(template_id)
             else:
                 self.interval_radio.setChecked(True)
             # تحميل إعدادات الحماية من الحظر
@@ -4793,7 +5649,7 @@ class MainWindow(QMainWindow):
             page_name = editing_job_page_name
 
         sort_index = self.sort_by_combo.currentIndex()
-        sort_by = ['name', 'random', 'date_created', 'date_modified'][sort_index]
+        sort_by = _SORT_BY_OPTIONS[sort_index]
 
         if is_story_mode:
             # إنشاء/تحديث وظيفة ستوري
@@ -4843,8 +5699,7 @@ class MainWindow(QMainWindow):
             watermark_path = self.job_watermark_path_label.text()
             if watermark_path == 'لم يتم اختيار شعار':
                 watermark_path = ''
-            positions = ['top_left', 'top_right', 'bottom_left', 'bottom_right', 'center']
-            watermark_position = positions[self.job_watermark_position_combo.currentIndex()]
+            watermark_position = _WATERMARK_POSITIONS[self.job_watermark_position_combo.currentIndex()]
             watermark_opacity = self.job_watermark_opacity_slider.value() / 100.0
             watermark_scale = self.job_watermark_size_slider.value() / 100.0
 
@@ -4900,8 +5755,7 @@ class MainWindow(QMainWindow):
             watermark_path = self.job_watermark_path_label.text()
             if watermark_path == 'لم يتم اختيار شعار':
                 watermark_path = ''
-            positions = ['top_left', 'top_right', 'bottom_left', 'bottom_right', 'center']
-            watermark_position = positions[self.job_watermark_position_combo.currentIndex()]
+            watermark_position = _WATERMARK_POSITIONS[self.job_watermark_position_combo.currentIndex()]
             watermark_opacity = self.job_watermark_opacity_slider.value() / 100.0
             watermark_scale = self.job_watermark_size_slider.value() / 100.0
 
@@ -4989,6 +5843,14 @@ class MainWindow(QMainWindow):
         # إذا كان المجدول متوقفاً نشغّله
         if not (self.scheduler_thread and self.scheduler_thread.is_alive()):
             self.start_scheduler()
+        else:
+            self._notify_schedulers()
+
+    def _notify_schedulers(self):
+        """إيقاظ خيوط المجدول لإعادة بناء جداول المواعيد بعد تغيّر الوظائف."""
+        for thread in (self.scheduler_thread, self.story_scheduler_thread, self.reels_scheduler_thread):
+            if thread and thread.is_alive():
+                thread.notify_job_changed()
     
     def _on_job_cancelled(self, job):
         """
@@ -5092,9 +5954,6 @@ class MainWindow(QMainWindow):
                         job.reset_next_run_timestamp()
                         self._save_jobs()
 
-                        # تنظيف الذاكرة
-                        gc.collect()
-
                     except Exception as e:
                         thread_safe_log(f'❌ خطأ: {e}')
                         log_error_to_file(e, 'Story job error')
@@ -5123,7 +5982,9 @@ class MainWindow(QMainWindow):
             if not folder.exists():
                 QMessageBox.warning(self, 'مجلد غير موجود', 'المجلد غير موجود')
                 return
-            files = sorted([p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS])
+            with os.scandir(folder) as it:
+                files = sorted(Path(e.path) for e in it
+                               if e.is_file() and e.name.lower().endswith(VIDEO_EXTENSIONS))
             if not files:
                 QMessageBox.warning(self, 'لا يوجد ملفات', 'لا فيديوهات في المجلد')
                 return
@@ -5252,7 +6113,7 @@ class MainWindow(QMainWindow):
                     # التحقق من طلب الإيقاف أثناء تحديث التقدم
                     if stop_event.is_set():
                         return
-                    self.ui_signals.progress_signal.emit(int(percent), f'رفع الريلز {int(percent)}%')
+                    self.ui_signals.emit_progress(int(percent), f'رفع الريلز {int(percent)}%')
 
                 try:
                     if not job.lock.acquire(blocking=False):
@@ -5360,9 +6221,18 @@ class MainWindow(QMainWindow):
         if not any_token:
             QMessageBox.warning(self, 'توكن مفقود', 'أدخل توكن صالح.')
             return
-        if self.scheduler_thread and self.scheduler_thread.is_alive():
+        alive = [(t, ev) for t, ev in ((self.scheduler_thread, self.video_scheduler_stop),
+                                       (self.story_scheduler_thread, self.story_scheduler_stop),
+                                       (self.reels_scheduler_thread, self.reels_scheduler_stop))
+                 if t and t.is_alive()]
+        if any(not ev.is_set() for _, ev in alive):
             QMessageBox.information(self, 'قيد التشغيل', 'المجدول يعمل.')
             return
+        # مجدول سابق لم يخرج بعد (رفع جارٍ عند الإيقاف) - مسح أحداث الإيقاف سيُعيد تشغيله
+        # ويترك خيوطه تعمل بجانب المجدول الجديد
+        if alive:
+            QMessageBox.information(self, 'قيد الإيقاف', 'المجدول السابق ما زال ينهي الرفع الجاري، حاول بعد قليل.')
+            return
 
         # مسح جميع أحداث الإيقاف (clear all stop events)
         self.video_scheduler_stop.clear()
@@ -5430,22 +6300,25 @@ class MainWindow(QMainWindow):
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self._log_append('⏹️ إيقاف مجدول الفيديوهات...')
             self.video_scheduler_stop.set()
+            self.scheduler_thread.notify_job_changed()
             self.scheduler_thread.join(timeout=5)
             stopped_any = True
             stopped_types.append('الفيديوهات')
 
         # إيقاف مجدول الستوري
-        if hasattr(self, 'story_scheduler_thread') and self.story_scheduler_thread and self.story_scheduler_thread.is_alive():
+        if self.story_scheduler_thread and self.story_scheduler_thread.is_alive():
             self._log_append('⏹️ إيقاف مجدول الستوري...')
             self.story_scheduler_stop.set()
+            self.story_scheduler_thread.notify_job_changed()
             self.story_scheduler_thread.join(timeout=5)
             stopped_any = True
             stopped_types.append('الستوري')
 
         # إيقاف مجدول الريلز (للمستقبل)
-        if hasattr(self, 'reels_scheduler_thread') and self.reels_scheduler_thread and self.reels_scheduler_thread.is_alive():
+        if self.reels_scheduler_thread and self.reels_scheduler_thread.is_alive():
             self._log_append('⏹️ إيقاف مجدول الريلز...')
             self.reels_scheduler_stop.set()
+            self.reels_scheduler_thread.notify_job_changed()
             self.reels_scheduler_thread.join(timeout=5)
             stopped_any = True
             stopped_types.append('الريلز')
@@ -5459,6 +6332,9 @@ class MainWindow(QMainWindow):
 
     def _save_jobs(self):
         """حفظ وظائف الفيديو والستوري والريلز."""
+        # أي حفظ يعني تغيّر الوظائف - إيقاظ المجدول لإعادة بناء جدول المواعيد
+        self._notify_schedulers()
+
         jobs_file = _get_jobs_file()
 
         # جمع وظائف الفيديو
@@ -5492,8 +6368,8 @@ class MainWindow(QMainWindow):
         jobs_file = _get_jobs_file()
         if jobs_file.exists():
             try:
-                with open(jobs_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(jobs_file, 'rb') as f:
+                    data = _json_loads(f.read())
 
                 # دعم التوافق مع الملفات القديمة
                 if isinstance(data, list):
@@ -5699,9 +6575,31 @@ class MainWindow(QMainWindow):
     # ==================== Mode Tabs ====================
 
     def _on_mode_tab_changed(self, index):
-        """معالج تغيير تبويب الوضع."""
+        """معالج تغيير تبويب الوضع (بناء تبويب الإعدادات عند أول فتح)."""
         # تبويب الصفحات = 0، تبويب الإعدادات = 1
-        pass
+        if not self._settings_built and self.mode_tabs.widget(index) is self._settings_tab:
+            self._ensure_settings_tab()
+
+    def _ensure_settings_tab(self):
+        """بناء محتوى تبويب الإعدادات داخل الويدجت المحجوز له (مرة واحدة)."""
+        self._settings_built = True
+        settings_tab_layout = QVBoxLayout(self._settings_tab)
+        settings_tab_layout.setContentsMargins(0, 0, 0, 0)
+
+        # إضافة QScrollArea لدعم التمرير بعجلة الماوس (Issue #2)
+        settings_scroll = QScrollArea()
+        settings_scroll.setWidgetResizable(True)
+        settings_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        settings_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        settings_scroll.setFrameShape(QFrame.NoFrame)
+
+        # ويدجت داخلي يحتوي على جميع الإعدادات (معتم لتمرير بنسخ البكسلات)
+        settings_content = QWidget()
+        settings_content.setAutoFillBackground(True)
+        self._build_settings_tab(QVBoxLayout(settings_content))
+
+        settings_scroll.setWidget(settings_content)
+        settings_tab_layout.addWidget(settings_scroll)
 
     def _on_job_type_changed(self, index):
         """معالج تغيير نوع المحتوى (فيديو/ستوري/ريلز)."""
@@ -5770,8 +6668,7 @@ class MainWindow(QMainWindow):
         if watermark_path == 'لم يتم اختيار شعار':
             watermark_path = ''
 
-        positions = ['top_left', 'top_right', 'bottom_left', 'bottom_right', 'center']
-        position = positions[self.job_watermark_position_combo.currentIndex()]
+        position = _WATERMARK_POSITIONS[self.job_watermark_position_combo.currentIndex()]
 
         opacity = self.job_watermark_opacity_slider.value() / 100.0
         scale = self.job_watermark_size_slider.value() / 100.0
@@ -5789,7 +6686,6 @@ class MainWindow(QMainWindow):
             settings = dialog.get_settings()
 
             # تحديث الموقع
-            position_index = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4}
             if settings['position'] == 'custom':
                 # حفظ الموقع المخصص من السحب
                 self._current_watermark_x = settings.get('custom_x')
@@ -5797,7 +6693,7 @@ class MainWindow(QMainWindow):
                 # تعيين الموقع إلى center كقيمة fallback في الواجهة
                 self.job_watermark_position_combo.setCurrentIndex(4)
             else:
-                self.job_watermark_position_combo.setCurrentIndex(position_index[settings['position']])
+                self.job_watermark_position_combo.setCurrentIndex(_WATERMARK_POS_TO_INDEX[settings['position']])
                 # إعادة تعيين الإحداثيات المخصصة
                 self._current_watermark_x = None
                 self._current_watermark_y = None
@@ -6541,36 +7437,23 @@ class MainWindow(QMainWindow):
         تنظيف جميع الـ Threads النشطة بشكل آمن.
         يتم استدعاؤها قبل إغلاق التطبيق لتجنب crash.
         """
-        threads_to_cleanup = []
-
         # 1. تنظيف threads لوحة الصفحات
         self.pages_panel.cleanup()
 
-        # 2. Threads جلب التوكن
-        if hasattr(self, '_active_token_threads'):
-            for thread in self._active_token_threads:
-                if thread and thread.isRunning():
-                    threads_to_cleanup.append(('TokenExchangeThread', thread))
+        # 2. عمليات جلب التوكن على مجمّع threads نافذة التوكينات
+        if self._token_dialog is not None:
+            if not self._token_dialog.stop_background_work(THREAD_QUIT_TIMEOUT_MS):
+                log_debug('انتهت مهلة انتظار عمليات جلب وحفظ التوكن')
 
-        # إيقاف جميع الـ threads
-        for name, thread in threads_to_cleanup:
-            if thread.isRunning():
-                try:
-                    # طلب إيقاف الـ thread
-                    thread.quit()
-                    # انتظار للإنهاء
-                    if not thread.wait(THREAD_QUIT_TIMEOUT_MS):
-                        # إذا لم ينتهِ، إجبار الإنهاء
-                        thread.terminate()
-                        thread.wait(THREAD_TERMINATE_TIMEOUT_MS)
-                except (RuntimeError, AttributeError) as e:
-                    # RuntimeError: قد يحدث إذا كان الـ thread قد انتهى بالفعل
-                    # AttributeError: قد يحدث إذا كان الـ thread قد تم حذفه
-                    log_debug(f'خطأ في تنظيف {name}: {e}')
-
-        # تنظيف المراجع
-        if hasattr(self, '_active_token_threads'):
-            self._active_token_threads.clear()
+    def showEvent(self, event):
+        """استئناف تحديث الساعة عند إظهار النافذة."""
+        super().showEvent(event)
+        self._sync_clock_timer()
+
+    def hideEvent(self, event):
+        """إيقاف تحديث الساعة أثناء إخفاء النافذة (Tray أو تصغير)."""
+        super().hideEvent(event)
+        self._sync_clock_timer()
 
     def closeEvent(self, event):
         """معالج إغلاق النافذة - الإخفاء إلى Tray دائماً."""
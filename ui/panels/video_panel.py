@@ -21,6 +21,10 @@ from ui.helpers import (
     ICONS, ICON_COLORS, HAS_QTAWESOME
 )
 
+# ترتيب خيارات position_combo في نافذة المعاينة (الفهرس <-> القيمة المحفوظة)
+_PREVIEW_POSITIONS = ('top_left', 'top_right', 'bottom_left', 'bottom_right', 'center', 'custom')
+_PREVIEW_POS_TO_INDEX = {pos: i for i, pos in enumerate(_PREVIEW_POSITIONS)}
+
 
 # ==================== DraggablePreviewLabel ====================
 
@@ -216,8 +220,7 @@ class WatermarkPreviewDialog(QDialog):
         # الموقع
         self.position_combo = NoScrollComboBox()
         self.position_combo.addItems(['أعلى يسار', 'أعلى يمين', 'أسفل يسار', 'أسفل يمين', 'وسط', 'مخصص (سحب)'])
-        position_index = {'top_left': 0, 'top_right': 1, 'bottom_left': 2, 'bottom_right': 3, 'center': 4, 'custom': 5}
-        self.position_combo.setCurrentIndex(position_index.get(self.position, 3))
+        self.position_combo.setCurrentIndex(_PREVIEW_POS_TO_INDEX.get(self.position, 3))
         self.position_combo.currentIndexChanged.connect(self._on_position_changed)
         settings_layout.addRow('الموقع:', self.position_combo)
 
@@ -433,9 +436,9 @@ class WatermarkPreviewDialog(QDialog):
         if self._use_custom_position:
             self.position = 'custom'
         else:
-            positions = ['top_left', 'top_right', 'bottom_left', 'bottom_right', 'center']
+            # 'custom' (الفهرس 5) بدون سحب يُعامل كوسط
             idx = min(self.position_combo.currentIndex(), 4)
-            self.position = positions[idx]
+            self.position = _PREVIEW_POSITIONS[idx]
 
         self.accept()
 
@@ -218,7 +218,10 @@ class SchedulerUI(QWidget):
                 return True
         else:
             if job_key in self.jobs_map:
-                del self.jobs_map[job_key]
+                removed = self.jobs_map.pop(job_key)
+                # إغلاق جلسة HTTP الخاصة بوظيفة الفيديو المحذوفة
+                if hasattr(removed, 'close_session'):
+                    removed.close_session()
                 return True
         return False
     
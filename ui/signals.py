@@ -5,7 +5,14 @@ Module for UI signal definitions
 Moved from ui/main_window.py as part of refactoring to extract reusable components.
 """
 
-from PySide6.QtCore import QObject, Signal
+import threading
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+
+# أقل فاصل بين تحديثين لشريط التقدم (بالمللي ثانية)
+# Minimum interval between two progress repaints (ms)
+PROGRESS_DEBOUNCE_MS = 100
 
 
 class UiSignals(QObject):
@@ -23,6 +30,48 @@ class UiSignals(QObject):
     # إشارات لاختبار Telegram والتحديثات - لضمان تحديث الواجهة من الخيط الرئيسي
     telegram_test_result = Signal(bool, str)    # نتيجة اختبار Telegram - Telegram test result (success, message)
     update_check_finished = Signal()            # إشارة لإنهاء التحقق من التحديثات - Update check finished signal
+    # إشارة داخلية لجدولة التفريغ في الخيط الرئيسي - Internal: schedule a flush on the GUI thread
+    _schedule_progress_flush = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._flush_scheduled = False
+        self._schedule_progress_flush.connect(self._start_progress_timer)
+
+    def emit_progress(self, percent, text):
+        """
+        تحديث التقدم مع تجميع التحديثات المتقاربة (آخر قيمة كل 100ms)
+        Coalesced progress update - only the latest value is emitted per debounce window.
+
+        قيمة 100% تُرسل فوراً وتلغي أي قيمة معلقة.
+        A 100% update bypasses the debounce and drops any pending value.
+        """
+        if percent >= 100:
+            with self._progress_lock:
+                self._pending_progress = None
+            self.progress_signal.emit(percent, text)
+            return
+        with self._progress_lock:
+            self._pending_progress = (percent, text)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # قد نكون في خيط عامل بدون حلقة أحداث - المؤقت يبدأ من الخيط الرئيسي
+        self._schedule_progress_flush.emit()
+
+    @Slot()
+    def _start_progress_timer(self):
+        QTimer.singleShot(PROGRESS_DEBOUNCE_MS, self._flush_progress)
+
+    @Slot()
+    def _flush_progress(self):
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+            self._flush_scheduled = False
+        if pending is not None:
+            self.progress_signal.emit(*pending)
 
 
 __all__ = ['UiSignals']